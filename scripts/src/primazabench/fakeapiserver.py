@@ -0,0 +1,702 @@
+import base64
+import copy
+import json
+import re
+import socket
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs, unquote
+from primazactl.utils import yamlio
+
+ALL_VERBS = ["create", "delete", "deletecollection", "get", "list",
+             "patch", "update", "watch"]
+REVIEW_VERBS = ["create"]
+
+# (group, version, plural, kind, namespaced, verbs)
+BUILTIN_RESOURCES = [
+    ("", "v1", "namespaces", "Namespace", False, ALL_VERBS),
+    ("", "v1", "secrets", "Secret", True, ALL_VERBS),
+    ("", "v1", "serviceaccounts", "ServiceAccount", True, ALL_VERBS),
+    ("", "v1", "configmaps", "ConfigMap", True, ALL_VERBS),
+    ("", "v1", "services", "Service", True, ALL_VERBS),
+    ("", "v1", "pods", "Pod", True, ALL_VERBS),
+    ("apps", "v1", "deployments", "Deployment", True, ALL_VERBS),
+    ("rbac.authorization.k8s.io", "v1", "roles", "Role", True, ALL_VERBS),
+    ("rbac.authorization.k8s.io", "v1", "rolebindings", "RoleBinding",
+     True, ALL_VERBS),
+    ("rbac.authorization.k8s.io", "v1", "clusterroles", "ClusterRole",
+     False, ALL_VERBS),
+    ("rbac.authorization.k8s.io", "v1", "clusterrolebindings",
+     "ClusterRoleBinding", False, ALL_VERBS),
+    ("admissionregistration.k8s.io", "v1",
+     "mutatingwebhookconfigurations", "MutatingWebhookConfiguration",
+     False, ALL_VERBS),
+    ("admissionregistration.k8s.io", "v1",
+     "validatingwebhookconfigurations", "ValidatingWebhookConfiguration",
+     False, ALL_VERBS),
+    ("apiextensions.k8s.io", "v1", "customresourcedefinitions",
+     "CustomResourceDefinition", False, ALL_VERBS),
+    ("authorization.k8s.io", "v1", "subjectaccessreviews",
+     "SubjectAccessReview", False, REVIEW_VERBS),
+    ("authorization.k8s.io", "v1", "selfsubjectaccessreviews",
+     "SelfSubjectAccessReview", False, REVIEW_VERBS),
+    ("authorization.k8s.io", "v1", "selfsubjectrulesreviews",
+     "SelfSubjectRulesReview", False, REVIEW_VERBS),
+    ("cert-manager.io", "v1", "certificates", "Certificate", True,
+     ALL_VERBS),
+    ("cert-manager.io", "v1", "issuers", "Issuer", True, ALL_VERBS),
+]
+
+SERVICE_ACCOUNT_PREFIX = "system:serviceaccount:"
+
+
+class FakeApiServer(object):
+    """
+    A small in-memory stand-in for a kube-apiserver. It understands the
+    REST calls primazactl makes and emulates the controllers primazactl
+    waits on: service account tokens, controller pods and cluster
+    environment status.
+    """
+
+    latency: float = 0.0
+    controller_delay: float = 0.0
+    lock: threading.Condition = None
+    objects: {} = None
+    events: [] = None
+    resource_version: int = 1
+    requests: {} = None
+    resources: {} = None
+    httpd: ThreadingHTTPServer = None
+    thread: threading.Thread = None
+
+    def __init__(self, latency=0.0, controller_delay=0.0):
+        self.latency = latency
+        self.controller_delay = controller_delay
+        self.lock = threading.Condition()
+        self.objects = {}
+        self.events = []
+        self.resource_version = 1
+        self.requests = {}
+        self.resources = {}
+        for entry in BUILTIN_RESOURCES:
+            self.register(*entry)
+        self.httpd = None
+        self.thread = None
+
+    # -- lifecycle
+
+    def start(self, port=0):
+        """
+        Serve on 127.0.0.1 from a background thread, port 0 picks a free
+        port.
+        """
+        handler = type("Handler", (ApiHandler,), {"server_state": self})
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", port), handler)
+        self.httpd.daemon_threads = True
+        self.thread = threading.Thread(target=self.httpd.serve_forever,
+                                       daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        if self.httpd:
+            self.httpd.shutdown()
+            self.httpd.server_close()
+
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self.httpd.server_address[1]}"
+
+    def kubeconfig(self, context="fake", token="bench"):
+        """
+        Returns a kubeconfig, as a dictionary, with a single context which
+        connects to the server with a bearer token.
+        """
+        return {
+            "apiVersion": "v1",
+            "kind": "Config",
+            "preferences": {},
+            "current-context": context,
+            "clusters": [{"name": context,
+                          "cluster": {"server": self.url}}],
+            "contexts": [{"name": context,
+                          "context": {"cluster": context, "user": context}}],
+            "users": [{"name": context, "user": {"token": token}}],
+        }
+
+    def stats(self):
+        """
+        Returns the number of requests served since the last reset, in
+        total and by verb and resource, e.g. "create namespaces".
+        """
+        with self.lock:
+            return {"total": sum(self.requests.values()),
+                    "by_verb_resource": dict(self.requests)}
+
+    def reset_stats(self):
+        with self.lock:
+            self.requests = {}
+
+    # -- resource registry
+
+    def register(self, group, version, plural, kind, namespaced, verbs):
+        self.resources[(group, plural)] = {
+            "group": group, "version": version, "plural": plural,
+            "kind": kind, "namespaced": namespaced, "verbs": verbs}
+
+    def register_crd(self, crd):
+        spec = crd.get("spec", {})
+        names = spec.get("names", {})
+        namespaced = spec.get("scope", "Namespaced") == "Namespaced"
+        for version in spec.get("versions", [{"name": "v1"}]):
+            self.register(spec.get("group"), version["name"],
+                          names.get("plural"), names.get("kind"),
+                          namespaced, ALL_VERBS)
+
+    def group_versions(self):
+        gvs = {}
+        for res in self.resources.values():
+            if res["group"]:
+                gvs.setdefault(res["group"], set()).add(res["version"])
+        return gvs
+
+    def resource_list(self, group, version):
+        resources = []
+        for res in self.resources.values():
+            if res["group"] == group and res["version"] == version:
+                resources.append({"name": res["plural"],
+                                  "singularName": res["kind"].lower(),
+                                  "namespaced": res["namespaced"],
+                                  "kind": res["kind"],
+                                  "verbs": res["verbs"]})
+                if res["kind"] in ("Pod", "Deployment") or \
+                        res["group"] == "primaza.io":
+                    resources.append({"name": f'{res["plural"]}/status',
+                                      "singularName": "",
+                                      "namespaced": res["namespaced"],
+                                      "kind": res["kind"],
+                                      "verbs": ["get", "patch",
+                                                "update"]})
+        return {"kind": "APIResourceList", "apiVersion": "v1",
+                "groupVersion": f"{group}/{version}" if group else version,
+                "resources": resources}
+
+    # -- storage
+
+    def add(self, group, plural, obj):
+        """
+        Store obj as if it had been created, e.g. to set up objects which
+        exist before primazactl runs.
+        """
+        namespace = obj["metadata"].get("namespace") or ""
+        with self.lock:
+            self.store((group, plural, namespace, obj["metadata"]["name"]),
+                       copy.deepcopy(obj), "ADDED")
+
+    def next_version(self):
+        self.resource_version += 1
+        return str(self.resource_version)
+
+    def record(self, event_type, key, obj):
+        self.events.append((int(obj["metadata"]["resourceVersion"]),
+                            event_type, key, copy.deepcopy(obj)))
+        self.lock.notify_all()
+
+    def store(self, key, obj, event_type):
+        obj["metadata"]["resourceVersion"] = self.next_version()
+        self.objects[key] = obj
+        self.record(event_type, key, obj)
+
+    def list_objects(self, group, plural, namespace):
+        return [(key, obj) for key, obj in sorted(self.objects.items())
+                if key[0] == group and key[1] == plural and
+                (namespace is None or key[2] == namespace)]
+
+    # -- controller emulation
+
+    def after_create(self, group, plural, namespace, obj):
+        if group == "apiextensions.k8s.io":
+            self.register_crd(obj)
+        elif group == "" and plural == "secrets" and \
+                obj.get("type") == "kubernetes.io/service-account-token":
+            obj["data"] = {
+                "token": encode(f"token-{uuid.uuid4()}"),
+                "ca.crt": encode("fake-ca"),
+                "namespace": encode(namespace)}
+        elif group == "apps" and plural == "deployments":
+            pod = self.run_pod(namespace, obj["metadata"]["name"], True,
+                               running=not self.controller_delay)
+            if self.controller_delay:
+                self.schedule(self.start_pod, namespace, pod)
+        elif group == "primaza.io" and plural == "clusterenvironments":
+            if self.controller_delay:
+                self.schedule(self.set_online, namespace,
+                              obj["metadata"]["name"])
+            else:
+                obj["status"] = online_status()
+
+    def schedule(self, func, *args):
+        if self.controller_delay:
+            timer = threading.Timer(self.controller_delay, func, args)
+            timer.daemon = True
+            timer.start()
+        else:
+            func(*args, locked=True)
+
+    def run_pod(self, namespace, deployment, locked=False, running=True):
+        if not locked:
+            with self.lock:
+                return self.run_pod(namespace, deployment, True, running)
+        name = f"primaza-controller-{deployment}-{uuid.uuid4().hex[:5]}"
+        pod = {"apiVersion": "v1", "kind": "Pod",
+               "metadata": new_metadata(name, namespace),
+               "spec": {"containers": [{"name": "manager",
+                                        "image": "primaza"}]},
+               "status": {"phase": "Running",
+                          "containerStatuses": [{
+                              "name": "manager", "ready": True,
+                              "restartCount": 0, "image": "primaza",
+                              "imageID": "primaza",
+                              "state": {"running": {
+                                  "startedAt": "2023-01-01T00:00:00Z"}}}]}}
+        if not running:
+            pod["status"]["phase"] = "Pending"
+            pod["status"]["containerStatuses"][0]["state"] = {
+                "waiting": {"reason": "ContainerCreating"}}
+        self.store(("", "pods", namespace, name), pod, "ADDED")
+        return name
+
+    def start_pod(self, namespace, name, locked=False):
+        if not locked:
+            with self.lock:
+                return self.start_pod(namespace, name, True)
+        key = ("", "pods", namespace, name)
+        pod = self.objects.get(key)
+        if pod is None:
+            return
+        pod["status"]["phase"] = "Running"
+        pod["status"]["containerStatuses"][0]["state"] = {
+            "running": {"startedAt": "2023-01-01T00:00:00Z"}}
+        self.store(key, pod, "MODIFIED")
+
+    def set_online(self, namespace, name, locked=False):
+        if not locked:
+            with self.lock:
+                return self.set_online(namespace, name, True)
+        key = ("primaza.io", "clusterenvironments", namespace, name)
+        obj = self.objects.get(key)
+        if obj is None:
+            return
+        obj["status"] = online_status()
+        self.store(key, obj, "MODIFIED")
+
+    # -- authorization
+
+    def allowed(self, spec):
+        user = spec.get("user", "")
+        attributes = spec.get("resourceAttributes", {}) or {}
+        if not user.startswith(SERVICE_ACCOUNT_PREFIX):
+            return True
+        sa_namespace, _, sa_name = \
+            user[len(SERVICE_ACCOUNT_PREFIX):].partition(":")
+        namespace = attributes.get("namespace") or ""
+        for rule in self.rules_for(sa_namespace, sa_name, namespace):
+            if rule_matches(rule, attributes):
+                return True
+        return False
+
+    def rules_for(self, sa_namespace, sa_name, namespace):
+        rbac = "rbac.authorization.k8s.io"
+        bindings = [obj for _, obj in
+                    self.list_objects(rbac, "rolebindings", namespace)]
+        bindings += [obj for _, obj in
+                     self.list_objects(rbac, "clusterrolebindings", "")]
+        for binding in bindings:
+            for subject in binding.get("subjects", []) or []:
+                if subject.get("kind") == "ServiceAccount" and \
+                        subject.get("name") == sa_name and \
+                        subject.get("namespace") == sa_namespace:
+                    ref = binding.get("roleRef", {})
+                    if ref.get("kind") == "Role":
+                        key = (rbac, "roles", namespace, ref.get("name"))
+                    else:
+                        key = (rbac, "clusterroles", "", ref.get("name"))
+                    role = self.objects.get(key)
+                    if role:
+                        yield from role.get("rules", []) or []
+
+
+class ApiHandler(BaseHTTPRequestHandler):
+    """
+    Serves the requests of a FakeApiServer: discovery, the object verbs
+    including watches and server side apply, and access reviews which are
+    answered from the roles and bindings stored in the server.
+    """
+
+    protocol_version = "HTTP/1.1"
+    server_state: FakeApiServer = None
+
+    def setup(self):
+        super().setup()
+        self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        self.dispatch("GET")
+
+    def do_POST(self):
+        self.dispatch("POST")
+
+    def do_PUT(self):
+        self.dispatch("PUT")
+
+    def do_PATCH(self):
+        self.dispatch("PATCH")
+
+    def do_DELETE(self):
+        self.dispatch("DELETE")
+
+    def dispatch(self, method):
+        state = self.server_state
+        url = urlparse(self.path)
+        query = {k: v[0] for k, v in parse_qs(url.query).items()}
+        length = int(self.headers.get("Content-Length") or 0)
+        raw = self.rfile.read(length) if length else b""
+        body = None
+        if raw:
+            content_type = self.headers.get("Content-Type", "")
+            if "yaml" in content_type:
+                body = yamlio.safe_load(raw)
+            else:
+                body = json.loads(raw)
+        if state.latency:
+            time.sleep(state.latency)
+        try:
+            route = parse_path(url.path)
+            verb = get_verb(method, route, query)
+            with state.lock:
+                key = f'{verb} {route.get("plural") or url.path}'
+                state.requests[key] = state.requests.get(key, 0) + 1
+            if verb == "watch":
+                return self.watch(route, query)
+            code, payload = self.respond(method, route, query, body)
+        except ApiStatus as status:
+            code, payload = status.code, status.payload()
+        self.send_json(code, payload)
+
+    def send_json(self, code, payload):
+        data = json.dumps(payload).encode("utf-8")
+        self.send_response(code)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def respond(self, method, route, query, body):
+        state = self.server_state
+        kind = route["type"]
+        if kind == "version":
+            return 200, {"major": "1", "minor": "27",
+                         "gitVersion": "v1.27.3-fake"}
+        if kind == "core-groups":
+            return 200, {"kind": "APIVersions", "versions": ["v1"]}
+        if kind == "groups":
+            groups = []
+            with state.lock:
+                for group, versions in sorted(state.group_versions().items()):
+                    gvs = [{"groupVersion": f"{group}/{v}", "version": v}
+                           for v in sorted(versions)]
+                    groups.append({"name": group, "versions": gvs,
+                                   "preferredVersion": gvs[0]})
+            return 200, {"kind": "APIGroupList", "apiVersion": "v1",
+                         "groups": groups}
+        if kind == "resource-list":
+            with state.lock:
+                return 200, state.resource_list(route["group"],
+                                                route["version"])
+        with state.lock:
+            return self.handle_object(method, route, query, body)
+
+    def handle_object(self, method, route, query, body):
+        state = self.server_state
+        group, plural = route["group"], route["plural"]
+        res = state.resources.get((group, plural))
+        if res is None:
+            raise ApiStatus(404, "NotFound",
+                            f"the server could not find the requested "
+                            f"resource ({plural})")
+        namespace = route.get("namespace") or ""
+        name = route.get("name")
+        dry_run = query.get("dryRun") == "All"
+
+        if group == "authorization.k8s.io":
+            return 201, self.review(plural, body)
+
+        if method == "GET" and not name:
+            selector = query.get("labelSelector")
+            fields = query.get("fieldSelector")
+            items = [copy.deepcopy(obj) for _, obj in
+                     state.list_objects(group, plural,
+                                        route.get("namespace"))
+                     if is_selected(obj, selector, fields)]
+            return 200, {"kind": f'{res["kind"]}List',
+                         "apiVersion": get_api_version(group, res["version"]),
+                         "metadata": {"resourceVersion":
+                                      str(state.resource_version)},
+                         "items": items}
+
+        key = (group, plural, namespace, name)
+        if method == "POST":
+            name = body["metadata"]["name"]
+            key = (group, plural, namespace, name)
+            if key in state.objects:
+                raise ApiStatus(409, "AlreadyExists",
+                                f'{plural} "{name}" already exists')
+            obj = copy.deepcopy(body)
+            obj["metadata"].update(new_metadata(name, namespace or None))
+            if dry_run:
+                return 201, obj
+            state.after_create(group, plural, namespace, obj)
+            state.store(key, obj, "ADDED")
+            return 201, copy.deepcopy(obj)
+
+        obj = state.objects.get(key)
+        if method == "GET":
+            if obj is None:
+                raise ApiStatus(404, "NotFound",
+                                f'{plural} "{name}" not found')
+            return 200, copy.deepcopy(obj)
+
+        if method == "PATCH" or method == "PUT":
+            content_type = self.headers.get("Content-Type", "")
+            if obj is None:
+                if "apply-patch" not in content_type:
+                    raise ApiStatus(404, "NotFound",
+                                    f'{plural} "{name}" not found')
+                obj = copy.deepcopy(body)
+                obj["metadata"].update(new_metadata(name,
+                                                    namespace or None))
+                if dry_run:
+                    return 201, obj
+                state.after_create(group, plural, namespace, obj)
+                state.store(key, obj, "ADDED")
+                return 201, copy.deepcopy(obj)
+            if method == "PUT":
+                updated = copy.deepcopy(body)
+                updated["metadata"]["uid"] = obj["metadata"]["uid"]
+            else:
+                updated = merge(copy.deepcopy(obj), body)
+            if dry_run:
+                return 200, updated
+            state.store(key, updated, "MODIFIED")
+            return 200, copy.deepcopy(updated)
+
+        if method == "DELETE":
+            if obj is None:
+                raise ApiStatus(404, "NotFound",
+                                f'{plural} "{name}" not found')
+            if not dry_run:
+                del state.objects[key]
+                obj["metadata"]["resourceVersion"] = state.next_version()
+                state.record("DELETED", key, obj)
+            return 200, {"kind": "Status", "status": "Success"}
+
+        raise ApiStatus(405, "MethodNotAllowed", f"{method} not allowed")
+
+    def review(self, plural, body):
+        state = self.server_state
+        body = copy.deepcopy(body)
+        spec = body.get("spec", {})
+        if plural == "selfsubjectrulesreviews":
+            body["status"] = {
+                "resourceRules": [{"verbs": ["*"], "apiGroups": ["*"],
+                                   "resources": ["*"]}],
+                "nonResourceRules": [], "incomplete": False}
+        else:
+            body["status"] = {"allowed": state.allowed(spec)}
+        return body
+
+    def watch(self, route, query):
+        state = self.server_state
+        group, plural = route["group"], route["plural"]
+        namespace = route.get("namespace")
+        selector = query.get("labelSelector")
+        fields = query.get("fieldSelector")
+        since = int(query.get("resourceVersion") or 0)
+        deadline = time.time() + int(query.get("timeoutSeconds") or 30)
+
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+
+        def matches(event):
+            key = event[2]
+            return key[0] == group and key[1] == plural and \
+                (namespace is None or key[2] == namespace) and \
+                is_selected(event[3], selector, fields)
+
+        try:
+            while time.time() < deadline:
+                with state.lock:
+                    pending = [e for e in state.events
+                               if e[0] > since and matches(e)]
+                    if not pending:
+                        state.lock.wait(min(1.0, deadline - time.time()))
+                        continue
+                for rv, event_type, _, obj in pending:
+                    since = rv
+                    line = json.dumps({"type": event_type,
+                                       "object": obj}) + "\n"
+                    data = line.encode("utf-8")
+                    self.wfile.write(b"%x\r\n%s\r\n" % (len(data), data))
+                    self.wfile.flush()
+            self.wfile.write(b"0\r\n\r\n")
+            self.wfile.flush()
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+        self.close_connection = True
+
+
+class ApiStatus(Exception):
+
+    def __init__(self, code, reason, message):
+        super().__init__(message)
+        self.code = code
+        self.reason = reason
+        self.message = message
+
+    def payload(self):
+        return {"kind": "Status", "apiVersion": "v1", "status": "Failure",
+                "message": self.message, "reason": self.reason,
+                "code": self.code}
+
+
+def online_status():
+    return {"state": "Online", "conditions": [
+        {"type": "Online", "status": "True"},
+        {"type": "ApplicationNamespacePermissionsRequired",
+         "status": "False"},
+        {"type": "ServiceNamespacePermissionsRequired",
+         "status": "False"}]}
+
+
+def encode(value):
+    return base64.b64encode(value.encode("utf-8")).decode("utf-8")
+
+
+def new_metadata(name, namespace):
+    metadata = {"name": name, "uid": str(uuid.uuid4()),
+                "creationTimestamp": "2023-01-01T00:00:00Z"}
+    if namespace:
+        metadata["namespace"] = namespace
+    return metadata
+
+
+def get_api_version(group, version):
+    return f"{group}/{version}" if group else version
+
+
+def merge(target, patch):
+    if not isinstance(patch, dict):
+        return patch
+    for key, value in patch.items():
+        if value is None:
+            target.pop(key, None)
+        elif isinstance(value, dict) and isinstance(target.get(key), dict):
+            target[key] = merge(target[key], value)
+        else:
+            target[key] = copy.deepcopy(value)
+    return target
+
+
+def is_selected(obj, label_selector, field_selector):
+    metadata = obj.get("metadata", {})
+    if label_selector:
+        labels = metadata.get("labels") or {}
+        for term in label_selector.split(","):
+            label, _, value = term.partition("=")
+            if labels.get(label) != value:
+                return False
+    if field_selector:
+        for term in field_selector.split(","):
+            field, _, value = term.partition("=")
+            if field == "metadata.name" and metadata.get("name") != value:
+                return False
+            if field == "metadata.namespace" and \
+                    metadata.get("namespace") != value:
+                return False
+    return True
+
+
+def rule_matches(rule, attributes):
+    def has(values, value):
+        values = values or []
+        return "*" in values or value in values
+
+    group = attributes.get("group") or ""
+    resource = attributes.get("resource") or ""
+    if attributes.get("subresource"):
+        resource = f'{resource}/{attributes["subresource"]}'
+    name = attributes.get("name")
+    if not has(rule.get("verbs"), attributes.get("verb")):
+        return False
+    if not has(rule.get("apiGroups"), group):
+        return False
+    if not has(rule.get("resources"), resource):
+        return False
+    names = rule.get("resourceNames") or []
+    if names and name not in names:
+        return False
+    return True
+
+
+API_PATH = re.compile(r"^/(api|apis)(/.*)?$")
+
+
+def parse_path(path):
+    if path == "/version" or path == "/version/":
+        return {"type": "version"}
+    match = API_PATH.match(path)
+    if not match:
+        raise ApiStatus(404, "NotFound", f"unknown path {path}")
+    parts = [unquote(p) for p in path.split("/") if p]
+    if parts[0] == "api":
+        if len(parts) == 1:
+            return {"type": "core-groups"}
+        group, version, rest = "", parts[1], parts[2:]
+    else:
+        if len(parts) == 1:
+            return {"type": "groups"}
+        if len(parts) == 2:
+            return {"type": "group", "group": parts[1]}
+        group, version, rest = parts[1], parts[2], parts[3:]
+
+    if not rest:
+        return {"type": "resource-list", "group": group, "version": version}
+
+    route = {"type": "object", "group": group, "version": version}
+    if rest[0] == "namespaces" and len(rest) >= 3:
+        route["namespace"] = rest[1]
+        rest = rest[2:]
+    route["plural"] = rest[0]
+    if len(rest) > 1:
+        route["name"] = rest[1]
+    if len(rest) > 2:
+        route["subresource"] = rest[2]
+    return route
+
+
+def get_verb(method, route, query):
+    if route.get("type") != "object":
+        return "discovery"
+    if method == "GET":
+        if query.get("watch") in ("true", "1", "True"):
+            return "watch"
+        return "get" if route.get("name") else "list"
+    return {"POST": "create", "PUT": "update", "PATCH": "patch",
+            "DELETE": "delete"}[method]
@@ -0,0 +1,220 @@
+from primazactl.utils import yamlio
+
+# synthetic manifests shaped like the primaza release manifests: the same
+# kinds, in the same namespace, with the references primazactl rewrites
+# when it moves them to another namespace
+NS: str = "primaza-system"
+LABELS = {"app.kubernetes.io/part-of": "primaza"}
+
+
+def crd(group, kind, plural, scope="Namespaced", version="v1alpha1"):
+    return {
+        "apiVersion": "apiextensions.k8s.io/v1",
+        "kind": "CustomResourceDefinition",
+        "metadata": {"name": f"{plural}.{group}"},
+        "spec": {
+            "group": group,
+            "names": {"kind": kind, "listKind": f"{kind}List",
+                      "plural": plural, "singular": kind.lower()},
+            "scope": scope,
+            "versions": [{
+                "name": version, "served": True, "storage": True,
+                "schema": {"openAPIV3Schema": {
+                    "type": "object",
+                    "properties": {
+                        "spec": {"type": "object",
+                                 "x-kubernetes-preserve-unknown-fields":
+                                     True},
+                        "status": {"type": "object",
+                                   "x-kubernetes-preserve-unknown-fields":
+                                       True}}}},
+                "subresources": {"status": {}}}],
+            "conversion": {"strategy": "Webhook", "webhook": {
+                "conversionReviewVersions": ["v1"],
+                "clientConfig": {"service": {
+                    "name": "primaza-webhook-service", "namespace": NS,
+                    "path": "/convert"}}}},
+        },
+    }
+
+
+PRIMAZA_CRDS = [
+    ("ClusterEnvironment", "clusterenvironments"),
+    ("RegisteredService", "registeredservices"),
+    ("ServiceClaim", "serviceclaims"),
+    ("ServiceClass", "serviceclasses"),
+    ("ServiceCatalog", "servicecatalogs"),
+    ("ServiceBinding", "servicebindings"),
+]
+
+
+def role(name, rules, namespace=NS, cluster=False):
+    obj = {"apiVersion": "rbac.authorization.k8s.io/v1",
+           "kind": "ClusterRole" if cluster else "Role",
+           "metadata": {"name": name, "labels": dict(LABELS)},
+           "rules": rules}
+    if not cluster:
+        obj["metadata"]["namespace"] = namespace
+    return obj
+
+
+def binding(name, role_name, sa, cluster_role=False, cluster=False):
+    obj = {"apiVersion": "rbac.authorization.k8s.io/v1",
+           "kind": "ClusterRoleBinding" if cluster else "RoleBinding",
+           "metadata": {"name": name, "labels": dict(LABELS)},
+           "roleRef": {"apiGroup": "rbac.authorization.k8s.io",
+                       "kind": "ClusterRole" if cluster_role else "Role",
+                       "name": role_name},
+           "subjects": [{"kind": "ServiceAccount", "name": sa,
+                         "namespace": NS}]}
+    if not cluster:
+        obj["metadata"]["namespace"] = NS
+    return obj
+
+
+def deployment(name, image):
+    return {
+        "apiVersion": "apps/v1", "kind": "Deployment",
+        "metadata": {"name": name, "namespace": NS,
+                     "labels": {"control-plane": "controller-manager"}},
+        "spec": {
+            "replicas": 1,
+            "selector": {"matchLabels": {"control-plane": name}},
+            "template": {
+                "metadata": {"labels": {"control-plane": name}},
+                "spec": {
+                    "serviceAccountName": name,
+                    "containers": [{
+                        "name": "manager", "image": image,
+                        "args": ["--leader-elect"],
+                        "env": [{"name": "WATCH_NAMESPACE",
+                                 "valueFrom": {"fieldRef": {
+                                     "fieldPath": "metadata.namespace"}}}],
+                        "volumeMounts": [{"name": "cert",
+                                          "mountPath": "/tmp/certs"}]}],
+                    "volumes": [{"name": "cert", "secret": {
+                        "secretName": "webhook-server-cert"}}]}}}}
+
+
+LEADER_RULES = [
+    {"apiGroups": [""], "resources": ["configmaps"],
+     "verbs": ["get", "list", "watch", "create", "update", "patch",
+               "delete"]},
+    {"apiGroups": ["coordination.k8s.io"], "resources": ["leases"],
+     "verbs": ["get", "list", "watch", "create", "update", "patch",
+               "delete"]},
+    {"apiGroups": [""], "resources": ["events"],
+     "verbs": ["create", "patch"]},
+]
+
+
+def webhook(kind):
+    return {
+        "apiVersion": "admissionregistration.k8s.io/v1",
+        "kind": kind,
+        "metadata": {"name": f"primaza-{kind.lower()}",
+                     "annotations": {"cert-manager.io/inject-ca-from":
+                                     f"{NS}/primaza-serving-cert"}},
+        "webhooks": [{
+            "name": f"v{plural}.primaza.io",
+            "admissionReviewVersions": ["v1"],
+            "sideEffects": "None",
+            "clientConfig": {"service": {
+                "name": "primaza-webhook-service", "namespace": NS,
+                "path": f"/validate-primaza-io-v1alpha1-{plural}"}},
+            "rules": [{"apiGroups": ["primaza.io"],
+                       "apiVersions": ["v1alpha1"],
+                       "operations": ["CREATE", "UPDATE"],
+                       "resources": [plural]}]}
+            for _, plural in PRIMAZA_CRDS],
+    }
+
+
+def control_plane():
+    """
+    Returns the documents of a control plane manifest: namespace, crds,
+    rbac, controller deployment, cert-manager resources and webhooks.
+    """
+    docs = [{"apiVersion": "v1", "kind": "Namespace",
+             "metadata": {"name": NS,
+                          "labels": {"control-plane": "controller-manager"}}}]
+    docs += [crd("primaza.io", kind, plural) for kind, plural in PRIMAZA_CRDS]
+    docs += [
+        {"apiVersion": "v1", "kind": "ServiceAccount",
+         "metadata": {"name": "primaza-controller-manager", "namespace": NS}},
+        role("primaza-leader-election-role", LEADER_RULES),
+        role("primaza-manager-role", [
+            {"apiGroups": ["primaza.io"], "resources": ["*"],
+             "verbs": ["*"]},
+            {"apiGroups": [""], "resources": ["secrets", "serviceaccounts"],
+             "verbs": ["*"]}], cluster=True),
+        binding("primaza-leader-election-rolebinding",
+                "primaza-leader-election-role",
+                "primaza-controller-manager"),
+        binding("primaza-manager-rolebinding", "primaza-manager-role",
+                "primaza-controller-manager", True, True),
+        {"apiVersion": "v1", "kind": "ConfigMap",
+         "metadata": {"name": "primaza-manager-config", "namespace": NS},
+         "data": {"agentapp-image": "ghcr.io/primaza/primaza-agentapp",
+                  "agentsvc-image": "ghcr.io/primaza/primaza-agentsvc"}},
+        {"apiVersion": "v1", "kind": "Service",
+         "metadata": {"name": "primaza-webhook-service", "namespace": NS},
+         "spec": {"ports": [{"port": 443, "targetPort": 9443}],
+                  "selector": {"control-plane": "controller-manager"}}},
+        deployment("primaza-controller-manager", "ghcr.io/primaza/primaza"),
+        {"apiVersion": "cert-manager.io/v1", "kind": "Issuer",
+         "metadata": {"name": "primaza-selfsigned-issuer", "namespace": NS},
+         "spec": {"selfSigned": {}}},
+        {"apiVersion": "cert-manager.io/v1", "kind": "Certificate",
+         "metadata": {"name": "primaza-serving-cert", "namespace": NS},
+         "spec": {"dnsNames": [f"primaza-webhook-service.{NS}.svc",
+                               f"primaza-webhook-service.{NS}.svc."
+                               "cluster.local"],
+                  "issuerRef": {"kind": "Issuer",
+                                "name": "primaza-selfsigned-issuer"},
+                  "secretName": "webhook-server-cert"}},
+        webhook("ValidatingWebhookConfiguration"),
+        webhook("MutatingWebhookConfiguration"),
+    ]
+    return docs
+
+
+def worker():
+    """
+    Returns the documents of a worker manifest: the crds.
+    """
+    return [crd("primaza.io", kind, plural)
+            for kind, plural in PRIMAZA_CRDS[1:]]
+
+
+def agent(kind):
+    """
+    Returns the documents of an application or service agent manifest.
+    """
+    short = "app" if kind == "application" else "svc"
+    sa = f"primaza-{short}-agent"
+    return [
+        {"apiVersion": "v1", "kind": "Namespace",
+         "metadata": {"name": NS}},
+        {"apiVersion": "v1", "kind": "ServiceAccount",
+         "metadata": {"name": sa, "namespace": NS}},
+        role(f"primaza:{short}:leader-election", LEADER_RULES),
+        role(f"primaza:{short}:manager", [
+            {"apiGroups": ["primaza.io"],
+             "resources": ["servicebindings", "serviceclaims"],
+             "verbs": ["get", "list", "watch", "update", "patch"]},
+            {"apiGroups": ["apps"], "resources": ["deployments"],
+             "verbs": ["get", "list", "watch"]}]),
+        binding(f"primaza:{short}:leader-election",
+                f"primaza:{short}:leader-election", sa),
+        binding(f"primaza:{short}:manager", f"primaza:{short}:manager", sa),
+        {"apiVersion": "v1", "kind": "ConfigMap",
+         "metadata": {"name": f"primaza-agent{short}-config",
+                      "namespace": NS}, "data": {}},
+        deployment(sa, f"ghcr.io/primaza/primaza-agent{short}"),
+    ]
+
+
+def write(path, docs):
+    with open(path, "w") as f:
+        yamlio.dump_all(docs, f)
@@ -0,0 +1,314 @@
+import argparse
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import primazactl
+from primazactl.utils import yamlio
+from primazabench import manifests
+from primazabench.fakeapiserver import FakeApiServer
+
+TENANT: str = "primaza-system"
+OPTIONS_TENANT: str = "primaza-bench"
+CLUSTER_ENVIRONMENT: str = "worker-env"
+SERVICE_ACCOUNT_NAMESPACE: str = "worker-sa"
+MAIN_CONTEXT: str = "main"
+WORKER_CONTEXT: str = "worker"
+# lines of output reported for a scenario which failed
+OUTPUT_TAIL: int = 20
+SCENARIOS: [] = ["create-tenant", "join-cluster",
+                 "create-application-namespace", "create-service-namespace",
+                 "apply", "apply-again", "apply-dry-run", "apply-tenants"]
+
+
+class Scenario(object):
+
+    name: str = None
+    description: str = None
+    args: [] = None
+    requires: [] = None
+
+    def __init__(self, name, description, args, requires=[]):
+        self.name = name
+        self.description = description
+        self.args = args
+        self.requires = requires
+
+
+class Bench(object):
+    """
+    Runs primazactl commands against a FakeApiServer, in a new process each
+    so that start up is measured, with synthetic manifests and options
+    files written to a temporary directory. The main and worker contexts
+    are served by the same server.
+    """
+
+    server: FakeApiServer = None
+    work_dir: str = None
+    kubeconfig: str = None
+    clusters: int = 2
+    tenants: int = 3
+    verbose: bool = False
+    scenarios: {} = None
+
+    def __init__(self, latency: float, controller_delay: float,
+                 clusters: int, tenants: int, verbose: bool = False):
+        self.server = FakeApiServer(latency, controller_delay)
+        self.clusters = clusters
+        self.tenants = tenants
+        self.verbose = verbose
+
+    def setup(self):
+        self.server.start()
+        self.work_dir = tempfile.mkdtemp(prefix="primazabench-")
+
+        config = self.server.kubeconfig(MAIN_CONTEXT)
+        worker = self.server.kubeconfig(WORKER_CONTEXT)
+        for entry in ["clusters", "contexts", "users"]:
+            config[entry] += worker[entry]
+        self.kubeconfig = os.path.join(self.work_dir, "kubeconfig")
+        with open(self.kubeconfig, "w") as kubeconfig:
+            yamlio.dump(config, kubeconfig)
+
+        manifest_dir = os.path.join(self.work_dir, "config")
+        os.makedirs(manifest_dir)
+        control_plane = os.path.join(manifest_dir,
+                                     "control_plane_config_latest.yaml")
+        crds = os.path.join(manifest_dir, "crds_config_latest.yaml")
+        app = os.path.join(manifest_dir,
+                           "application_namespace_config_latest.yaml")
+        svc = os.path.join(manifest_dir,
+                           "service_namespace_config_latest.yaml")
+        manifests.write(control_plane, manifests.control_plane())
+        manifests.write(crds, manifests.worker())
+        manifests.write(app, manifests.agent("application"))
+        manifests.write(svc, manifests.agent("service"))
+
+        # the service account namespace of the worker exists beforehand
+        self.server.add("", "namespaces", {
+            "apiVersion": "v1", "kind": "Namespace",
+            "metadata": {"name": SERVICE_ACCOUNT_NAMESPACE}})
+
+        options = self.__write_options("options.yaml", {
+            "name": OPTIONS_TENANT,
+            "clusterEnvironments": self.__get_cluster_environments(
+                "bench")}, manifest_dir)
+        tenant_options = self.__write_options("tenants.yaml", {
+            "tenants": [{"name": f"primaza-tenant-{tenant}",
+                         "clusterEnvironments":
+                             self.__get_cluster_environments(
+                                 f"tenant-{tenant}")}
+                        for tenant in range(self.tenants)]}, manifest_dir)
+
+        tenant_args = ["-l", self.kubeconfig, "-m", MAIN_CONTEXT,
+                       "-t", TENANT]
+        namespace_args = ["-d", CLUSTER_ENVIRONMENT, "-c", WORKER_CONTEXT,
+                          "-k", self.kubeconfig,
+                          "-j", SERVICE_ACCOUNT_NAMESPACE] + tenant_args
+        scenarios = [
+            Scenario("create-tenant",
+                     "create tenant",
+                     ["create", "tenant", TENANT, "-f", control_plane,
+                      "-k", self.kubeconfig, "-c", MAIN_CONTEXT]),
+            Scenario("join-cluster",
+                     "join cluster",
+                     ["join", "cluster", "-d", CLUSTER_ENVIRONMENT,
+                      "-e", "test", "-f", crds, "-k", self.kubeconfig,
+                      "-c", WORKER_CONTEXT, "-j", SERVICE_ACCOUNT_NAMESPACE]
+                     + tenant_args,
+                     ["create-tenant"]),
+            Scenario("create-application-namespace",
+                     "create application-namespace",
+                     ["create", "application-namespace", "bench-app",
+                      "-f", app] + namespace_args,
+                     ["create-tenant", "join-cluster"]),
+            Scenario("create-service-namespace",
+                     "create service-namespace",
+                     ["create", "service-namespace", "bench-svc",
+                      "-f", svc] + namespace_args,
+                     ["create-tenant", "join-cluster"]),
+            Scenario("apply",
+                     f"apply of a tenant with {self.clusters} cluster "
+                     "environments, each with an application and a "
+                     "service namespace",
+                     ["apply", "-p", options]),
+            Scenario("apply-again",
+                     "apply of the same options file, everything exists",
+                     ["apply", "-p", options],
+                     ["apply"]),
+            Scenario("apply-dry-run",
+                     "client dry run of apply with yaml output",
+                     ["apply", "-p", options, "-y", "client", "-o", "yaml"]),
+            Scenario("apply-tenants",
+                     f"apply of {self.tenants} tenants with "
+                     f"{self.clusters} cluster environments each",
+                     ["apply", "-p", tenant_options]),
+        ]
+        self.scenarios = {scenario.name: scenario for scenario in scenarios}
+
+    def cleanup(self):
+        self.server.stop()
+        if self.work_dir:
+            shutil.rmtree(self.work_dir, ignore_errors=True)
+
+    def run(self, names: []) -> []:
+        """
+        Run the scenarios, in the order they are defined, after the
+        scenarios they require. Returns the result of each scenario of
+        names.
+        """
+        results = []
+        done = set()
+        for scenario in self.scenarios.values():
+            if scenario.name not in names:
+                continue
+            for required in scenario.requires:
+                if required not in done:
+                    self.run_scenario(self.scenarios[required])
+                    done.add(required)
+            results.append(self.run_scenario(scenario))
+            done.add(scenario.name)
+        return results
+
+    def run_scenario(self, scenario: Scenario) -> {}:
+        env = dict(os.environ)
+        env["KUBECONFIG"] = self.kubeconfig
+        # discovery and manifest caches start empty for each bench
+        env["XDG_CACHE_HOME"] = os.path.join(self.work_dir, "cache")
+        source = os.path.dirname(os.path.dirname(primazactl.__file__))
+        env["PYTHONPATH"] = os.pathsep.join(
+            [source] + [path for path in
+                        [os.environ.get("PYTHONPATH")] if path])
+
+        command = [sys.executable, "-m", "primazactl.primazactl"] + \
+            scenario.args
+        self.server.reset_stats()
+        with tempfile.TemporaryFile() as output:
+            start = time.perf_counter()
+            process = subprocess.Popen(command, stdout=output,
+                                       stderr=output, env=env)
+            # reaped with wait4, which reports the resource usage
+            _, status, usage = os.wait4(process.pid, 0)
+            wall_time = time.perf_counter() - start
+            output.seek(0)
+            content = output.read().decode("utf-8", errors="replace")
+
+        returncode = os.waitstatus_to_exitcode(status)
+        stats = self.server.stats()
+        result = {
+            "name": scenario.name,
+            "description": scenario.description,
+            "returncode": returncode,
+            "wall_time_seconds": round(wall_time, 3),
+            "requests": stats["total"],
+            "requests_by_verb_resource": dict(sorted(
+                stats["by_verb_resource"].items())),
+            # kilobytes on linux
+            "peak_rss_kb": usage.ru_maxrss,
+            "output_bytes": len(content.encode("utf-8")),
+        }
+        if returncode != 0:
+            result["output_tail"] = content.splitlines()[-OUTPUT_TAIL:]
+        if self.verbose:
+            print(f"{scenario.name}: {' '.join(scenario.args)}\n{content}",
+                  file=sys.stderr)
+        return result
+
+    def __get_cluster_environments(self, prefix: str) -> []:
+        return [{"name": f"{prefix}-{cluster}",
+                 "environment": "test",
+                 "serviceAccountNamespace": SERVICE_ACCOUNT_NAMESPACE,
+                 "targetCluster": {"context": WORKER_CONTEXT,
+                                   "kubeconfig": self.kubeconfig},
+                 "applicationNamespaces": [
+                     {"name": f"{prefix}-app-{cluster}"}],
+                 "serviceNamespaces": [
+                     {"name": f"{prefix}-svc-{cluster}"}]}
+                for cluster in range(self.clusters)]
+
+    def __write_options(self, name: str, content: {},
+                        manifest_dir: str) -> str:
+        options = {"apiVersion": "primaza.io/v1alpha1",
+                   "kind": "Tenant",
+                   "manifestDirectory": manifest_dir,
+                   "version": "latest",
+                   "controlPlane": {"context": MAIN_CONTEXT,
+                                    "kubeconfig": self.kubeconfig}}
+        options.update(content)
+        path = os.path.join(self.work_dir, name)
+        with open(path, "w") as options_file:
+            yamlio.dump(options, options_file)
+        return path
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        prog="primazabench",
+        description="Benchmark primazactl commands against a local fake "
+                    "kubernetes API server. Reports wall time, API "
+                    "requests and peak memory of each command as JSON.",
+        epilog="Brought to you by the RedHat app-services team.")
+    parser.add_argument("scenarios",
+                        nargs="*",
+                        help=f"scenarios to run, default: all. Choose from "
+                             f"{', '.join(SCENARIOS)}.")
+    parser.add_argument("-l", "--latency",
+                        dest="latency", type=float, default=0.0,
+                        help="seconds the server waits before answering "
+                             "each request, default: 0")
+    parser.add_argument("-d", "--controller-delay",
+                        dest="controller_delay", type=float, default=0.0,
+                        help="seconds before emulated controllers start "
+                             "pods and set cluster environments online, "
+                             "default: 0")
+    parser.add_argument("-n", "--clusters",
+                        dest="clusters", type=int, default=2,
+                        help="cluster environments in the options files, "
+                             "default: 2")
+    parser.add_argument("-t", "--tenants",
+                        dest="tenants", type=int, default=3,
+                        help="tenants in the options file of apply-tenants, "
+                             "default: 3")
+    parser.add_argument("-o", "--output",
+                        dest="output", type=str, required=False,
+                        help="file to write the JSON report to, default: "
+                             "standard output")
+    parser.add_argument("-x", "--verbose",
+                        dest="verbose", action="store_true",
+                        help="write the output of each command to standard "
+                             "error")
+    args = parser.parse_args()
+    for scenario in args.scenarios:
+        if scenario not in SCENARIOS:
+            parser.error(f"unknown scenario {scenario}, choose from "
+                         f"{', '.join(SCENARIOS)}")
+
+    bench = Bench(args.latency, args.controller_delay, args.clusters,
+                  args.tenants, args.verbose)
+    try:
+        bench.setup()
+        results = bench.run(args.scenarios or SCENARIOS)
+    finally:
+        bench.cleanup()
+
+    report = json.dumps({"latency_seconds": args.latency,
+                         "controller_delay_seconds": args.controller_delay,
+                         "clusters": args.clusters,
+                         "tenants": args.tenants,
+                         "python": sys.version.split()[0],
+                         "scenarios": results}, indent=2)
+    if args.output:
+        with open(args.output, "w") as output:
+            output.write(report + "\n")
+    else:
+        print(report)
+
+    sys.exit(1 if any(result["returncode"] != 0 for result in results)
+             else 0)
+
+
+if __name__ == "__main__":
+    main()
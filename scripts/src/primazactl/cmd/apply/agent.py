@@ -1,6 +1,7 @@
 import os
 from primazactl.cmd.create.namespace.constants import APPLICATION
 from primazactl.primazaworker.agentnamespace import AgentNamespace
+from primazactl.utils import engine
 from primazactl.utils import logger
 from .tenant import Tenant
 from .defaults import defaults
@@ -39,11 +40,14 @@ class Agent(object):
         self.version = self.tenant.version if self.tenant.version \
             else defaults["version"]
 
-        logger.log_info(f"Agent created: {self.name}")
+        logger.log_info("Agent created: %s", self.name)
 
     def create(self, manifest, version):
+        return engine.run(self.create_async(manifest, version))
 
-        logger.log_info(f"{self.type}:{self.name}")
+    async def create_async(self, manifest, version):
+
+        logger.log_info("%s:%s", self.type, self.name)
 
         if manifest:
             self.manifest = manifest
@@ -59,15 +63,16 @@ class Agent(object):
                    f"cluster environment name."
 
         logger.log_info("Create AgentNamespace")
-        self.agent = AgentNamespace(self.type,
-                                    self.name,
-                                    self.cluster_environment.name,
-                                    self.cluster_environment.context,
-                                    self.cluster_environment.kube_config,
-                                    self.manifest,
-                                    self.version,
-                                    self.tenant.main,
-                                    self.cluster_environment.worker)
+        self.agent = await engine.call(AgentNamespace,
+                                       self.type,
+                                       self.name,
+                                       self.cluster_environment.name,
+                                       self.cluster_environment.context,
+                                       self.cluster_environment.kube_config,
+                                       self.manifest,
+                                       self.version,
+                                       self.tenant.main,
+                                       self.cluster_environment.worker)
         logger.log_info("Create Agent")
-        self.agent.create()
+        await self.agent.create_async()
         return None
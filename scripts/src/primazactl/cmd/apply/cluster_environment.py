@@ -1,6 +1,7 @@
 import os
 from primazactl.primazaworker.workercluster import WorkerCluster
 from primazactl.cmd.create.namespace.constants import APPLICATION
+from primazactl.utils import engine
 from primazactl.utils import logger
 from .utils import expand_path
 from .defaults import defaults
@@ -53,13 +54,21 @@ class ClusterEnvironment(object):
         if not self.service_account_namespace:
             self.service_account_namespace = \
                 defaults["service_account_namespace"]
-        logger.log_info(f"service_account_namespace: \
-            {self.service_account_namespace}")
+        logger.log_info("service_account_namespace: %s",
+                        self.service_account_namespace)
 
-        logger.log_info(f"Cluster Environment created: {self.name}")
+        logger.log_info("Cluster Environment created: %s", self.name)
 
     def join(self, name, context, kubeconfig, environment,
              manifest, version, internal_url, service_account_namespace):
+        return engine.run(self.join_async(name, context, kubeconfig,
+                                          environment, manifest, version,
+                                          internal_url,
+                                          service_account_namespace))
+
+    async def join_async(self, name, context, kubeconfig, environment,
+                         manifest, version, internal_url,
+                         service_account_namespace):
 
         self.add_args(name, context, kubeconfig, environment,
                       manifest, version, internal_url,
@@ -72,7 +81,8 @@ class ClusterEnvironment(object):
         elif not self.environment:
             return "Join cluster requires an environment name."
         else:
-            self.worker = WorkerCluster(
+            self.worker = await engine.call(
+                    WorkerCluster,
                     primaza_main=self.tenant.main,
                     context=self.context,
                     kubeconfig_file=self.kube_config,
@@ -83,7 +93,7 @@ class ClusterEnvironment(object):
                     tenant=self.tenant.tenant,
                     internal_url=self.internal_url,
                     service_account_namespace=self.service_account_namespace)
-            self.worker.install_worker()
+            await self.worker.install_worker_async()
             return ""
 
     def create_only(self, name, context, kubeconfig,
@@ -0,0 +1,178 @@
+import functools
+import traceback
+from primazactl.utils import engine
+from primazactl.utils import settings
+from primazactl.utils import logger
+from primazactl.cmd.create.namespace.constants import APPLICATION, SERVICE
+from .options import Options
+from .fanout import run_tasks, TENANT_WORKERS, CLUSTER_WORKERS, \
+    AGENT_WORKERS
+
+
+def run_options(args):
+
+    try:
+        settings.set(args)
+
+        options = Options(args)
+
+        # Options file can specify multiple tenants, install them
+        # concurrently, a failure of one does not stop the others.
+        tenants = {tenant.tenant: functools.partial(__install_tenant,
+                                                    options, tenant)
+                   for tenant in options.get_tenants()}
+        results = engine.run(run_tasks(tenants, TENANT_WORKERS))
+
+        failures = {name: error for name, error in results.items() if error}
+        if failures:
+            message = f"{len(failures)} of {len(results)} tenants failed:"
+            for name, error in failures.items():
+                message += f"\n  tenant {name}: {error}"
+            logger.log_error(message)
+            raise RuntimeError(f"[ERROR] {message}")
+
+        if settings.output_active():
+            settings.output()
+        elif settings.dry_run_active():
+            logger.output("Dry run Primaza install from options file "
+                          "complete.")
+        else:
+            logger.output("Primaza install from options file complete.")
+
+    except Exception as e:
+        if args.verbose:
+            logger.output(traceback.format_exc())
+        logger.log_error("\nAn exception occurred installing from options "
+                         "file:\n%s", e)
+        raise e
+
+
+async def __install_tenant(options, tenant):
+
+    # install tenant with no additional command line arguments
+    error = await engine.call(tenant.install, None, None, None, None, None)
+    if error:
+        logger.log_error("Primaza tenant %s install failed: %s", tenant.tenant,
+                         error)
+        return error
+
+    # check tenant is installed
+    error = await engine.call(tenant.main.check)
+    if error:
+        logger.log_error("Primaza tenant %s failed to start: %s",
+                         tenant.tenant, error)
+        return error
+
+    if not settings.output_active():
+        if settings.dry_run_active():
+            logger.output("Dry run create primaza tenant "
+                          f"{tenant.tenant} "
+                          "successfully completed\n")
+        else:
+            logger.output(f"Create primaza tenant {tenant.tenant} "
+                          f"successfully completed")
+
+    # Options file can specify multiple cluster environment,
+    # process them concurrently, a failure of one does not stop
+    # the others.
+    cluster_environments = {
+        cluster_environment.name: functools.partial(
+            __install_cluster_environment, cluster_environment, tenant)
+        for cluster_environment in
+        options.get_cluster_environments(tenant)}
+    results = await run_tasks(cluster_environments, CLUSTER_WORKERS)
+
+    failures = {name: error for name, error in results.items() if error}
+    if failures:
+        message = f"{len(failures)} of {len(results)} cluster " \
+                  "environments failed:"
+        for name, error in failures.items():
+            message += f"\n  cluster environment {name}: {error}"
+        logger.log_error(message)
+        return message
+    return None
+
+
+async def __install_cluster_environment(cluster_environment, tenant):
+
+    # join cluster with no additional command line arguments.
+    error = await cluster_environment.join_async(None, None, None, None,
+                                                 None, None, None, None)
+    if error:
+        logger.log_error(error)
+        return error
+
+    if not settings.output_active():
+        if settings.dry_run_active():
+            logger.output("Dry run join cluster "
+                          f"{cluster_environment.name} "
+                          "successfully completed.\n")
+        else:
+            logger.output(f"Join cluster {cluster_environment.name} "
+                          "successfully completed.")
+
+    # get all of the agents specified in the cluster environment
+    agents = cluster_environment.get_agents(APPLICATION)
+    for svc_agent in cluster_environment.get_agents(SERVICE):
+        agents.append(svc_agent)
+
+    if len(agents) == 0:
+        return None
+
+    # create the primaza identity and get a kubeconfig with
+    # details required to communicate with the identity
+    # just need to do this once for all agents, meanwhile
+    # create the agents concurrently
+    kcfg, results = await engine.gather(
+        __get_main_kubeconfig(tenant, cluster_environment),
+        run_tasks({f"{agent.type} namespace {agent.name}":
+                   functools.partial(agent.create_async, None, None)
+                   for agent in agents},
+                  AGENT_WORKERS))
+    created = []
+    for agent, error in zip(agents, results.values()):
+        if error:
+            logger.log_error("Create of %s namespace %s failed: %s",
+                             agent.type, agent.name, error)
+        else:
+            created.append(agent)
+
+    if created:
+        # add a secret to cluster environment to enable
+        # communication with the tenant.
+        # just need to do this once for all agents.
+        await engine.call(
+            cluster_environment.worker.create_namespaced_kubeconfig_secret,
+            kcfg, tenant.tenant)
+
+    # check agents were created.
+    results = await run_tasks({f"{agent.type} namespace {agent.name}":
+                               functools.partial(__check_agent, agent)
+                               for agent in created},
+                              AGENT_WORKERS)
+
+    errors = [error for error in results.values() if error]
+    if len(created) < len(agents):
+        errors.insert(0, f"{len(agents) - len(created)} of {len(agents)} "
+                         "namespaces could not be created")
+    return "; ".join(errors) if errors else None
+
+
+async def __get_main_kubeconfig(tenant, cluster_environment):
+    main_user = await engine.call(tenant.main.create_primaza_identity,
+                                  cluster_environment.name)
+    return await engine.call(tenant.main.get_kubeconfig, main_user)
+
+
+async def __check_agent(agent):
+
+    await agent.agent.check_async()
+    if not settings.output_active():
+        if settings.dry_run_active():
+            logger.output(f"Dry run create {agent.type} namespace "
+                          f"{agent.name} "
+                          "successfully completed.\n")
+        else:
+            logger.output(f"Create {agent.type} namespace "
+                          f"{agent.name} "
+                          "successfully completed.")
@@ -0,0 +1,43 @@
+import asyncio
+import traceback
+from primazactl.utils import logger
+from primazactl.utils import settings
+
+# maximum number of tenants installed at the same time
+TENANT_WORKERS: int = 4
+# maximum number of cluster environments of a tenant processed at the same
+# time
+CLUSTER_WORKERS: int = 8
+# maximum number of agent namespaces of a cluster processed at the same time
+AGENT_WORKERS: int = 4
+
+
+async def run_tasks(tasks: {}, max_workers: int) -> {}:
+    """
+    Run tasks concurrently, isolating their failures: an exception raised
+    by one task is recorded as its error and does not stop the others.
+
+    :param tasks: task name to a coroutine function which returns an error
+        message, or None if the task succeeded
+    :param max_workers: maximum number of tasks run at the same time
+    :return: task name to its error message, or None, in task order
+    """
+    # resources are output in the order they are created, keep that order
+    # stable by running one task at a time
+    if settings.output_active():
+        max_workers = 1
+
+    semaphore = asyncio.Semaphore(max(1, max_workers))
+    results = await asyncio.gather(*(__run_task(name, task, semaphore)
+                                     for name, task in tasks.items()))
+    return dict(zip(tasks, results))
+
+
+async def __run_task(name, task, semaphore):
+    async with semaphore:
+        try:
+            return await task()
+        except Exception as e:
+            logger.log_info(traceback.format_exc())
+            logger.log_error("%s failed: %s", name, e)
+            return str(e) if str(e) else type(e).__name__
@@ -1,4 +1,4 @@
-import yaml
+from primazactl.utils import yamlio
 from primazactl.utils import logger
 from .tenant import Tenant
 from .cluster_environment import ClusterEnvironment
@@ -7,6 +7,8 @@ from .defaults import defaults
 
 API_VERSION: str = "apiVersion"
 KIND: str = "kind"
+TENANTS: str = "tenants"
+CLUSTER_ENVIRONMENTS: str = "clusterEnvironments"
 
 
 class Options(object):
@@ -16,12 +18,12 @@ class Options(object):
 
     def __init__(self, args):
 
-        logger.log_info(f"Options:{args.options_file}:")
+        logger.log_info("Options:%s:", args.options_file)
 
         if args.options_file:
             with open(str(args.options_file), "r") as options_content:
-                load_options = yaml.safe_load(options_content)
-                logger.log_info(f"loaded options: {load_options}")
+                load_options = yamlio.safe_load(options_content)
+                logger.log_info("loaded options: %s", load_options)
 
             if API_VERSION in load_options and \
                     load_options[API_VERSION] == defaults["apiVersion"]:
@@ -29,7 +31,7 @@ class Options(object):
                         == defaults["kind"]:
                     self.options = load_options
                     self.options_empty = False
-                    logger.log_info(f"Option file content: {self.options}")
+                    logger.log_info("Option file content: %s", self.options)
                 else:
                     message = 'Invalid or no \'kind\' value in options ' \
                               'file, kind is required to be set to ' \
@@ -49,19 +51,70 @@ class Options(object):
     def get_options(self):
         return self.options
 
-    def get_tenant(self):
-        return Tenant(self.options)
+    def get_tenant(self, name: str = None):
+        """
+        Returns the tenant of the options file, or, if it lists tenants,
+        the one called name. name may only be omitted if it lists one.
+        """
+        if TENANTS not in self.options:
+            return Tenant(self.options)
+
+        tenants = self.get_tenants()
+        if not name and len(tenants) == 1:
+            return tenants[0]
+        for tenant in tenants:
+            if tenant.tenant == name:
+                return tenant
+
+        names = [tenant.tenant for tenant in tenants]
+        if name:
+            message = f"Tenant {name} is not one of the tenants {names} " \
+                      "of options file."
+        else:
+            message = f"Options file has tenants {names}, specify which " \
+                      "one to use."
+        logger.log_error(message)
+        raise RuntimeError(f"[ERROR] {message}")
+
+    def get_tenants(self):
+        """
+        Returns the tenants of the options file: one for each entry of its
+        tenants list, which default to the other options of the file, e.g.
+        a shared control plane, or else the tenant the file defines.
+        """
+        if TENANTS not in self.options:
+            return [Tenant(self.options)]
+
+        shared = {key: value for key, value in self.options.items()
+                  if key not in (TENANTS, CLUSTER_ENVIRONMENTS)}
+        tenants = [Tenant({**shared, **options})
+                   for options in self.options[TENANTS] or []]
+        if not tenants:
+            message = f"No tenants in '{TENANTS}' of options file."
+            logger.log_error(message)
+            raise RuntimeError(f"[ERROR] {message}")
+
+        names = [tenant.tenant for tenant in tenants]
+        duplicates = sorted({name for name in names if names.count(name) > 1})
+        if duplicates:
+            message = f"Tenants {duplicates} are defined more than once in " \
+                      "options file."
+            logger.log_error(message)
+            raise RuntimeError(f"[ERROR] {message}")
+        return tenants
 
     def get_cluster_environments(self, tenant):
         cluster_environments = []
-        for cluster_environment in self.options.get("clusterEnvironments", []):
+        for cluster_environment in \
+                tenant.options.get(CLUSTER_ENVIRONMENTS, []):
             cluster_environments.append(
                     ClusterEnvironment(cluster_environment, tenant))
         return cluster_environments
 
     def get_cluster_environment(self, name, tenant):
 
-        for cluster_environment in self.options.get("clusterEnvironments", []):
+        for cluster_environment in \
+                tenant.options.get(CLUSTER_ENVIRONMENTS, []):
             if name == cluster_environment.get("name", None):
                 return ClusterEnvironment(cluster_environment, tenant)
 
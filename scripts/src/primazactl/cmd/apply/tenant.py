@@ -7,6 +7,7 @@ from .defaults import defaults
 
 class Tenant(object):
 
+    options: {} = None
     kube_config: str = None
     context: str = None
     tenant: str = None
@@ -20,37 +21,40 @@ class Tenant(object):
 
     def __init__(self, options):
 
+        self.options = options
+
         self.tenant = options.get("name", None)
         if not self.tenant:
-            self.tennat = defaults["tenant"]
-        logger.log_info(f"Namespace: {self.tenant}")
+            self.tenant = defaults["tenant"]
+        logger.log_info("Namespace: %s", self.tenant)
 
         control_plane = options.get("controlPlane", None)
         if control_plane:
-            self.kubeconfig = control_plane.get("kubeconfig", None)
-            if not self.kubeconfig:
-                self.kubeconfig = defaults["kubeconfig"]
-            logger.log_info(f"kubeconfig: {self.kube_config}")
+            kube_config = control_plane.get("kubeconfig", None)
+            self.kube_config = expand_path(kube_config) \
+                if kube_config \
+                else defaults["kubeconfig"]
+            logger.log_info("kubeconfig: %s", self.kube_config)
 
             self.context = control_plane.get("context", None)
-            logger.log_info(f"context: {self.context}")
+            logger.log_info("context: %s", self.context)
 
             self.internal_url = options.get("internalUrl", None)
-            logger.log_info(f"internalUrl: {self.context}")
+            logger.log_info("internalUrl: %s", self.context)
 
         manifest_dir = options.get("manifestDirectory")
         if manifest_dir:
             self.manifest_directory = expand_path(manifest_dir)
-            logger.log_info("manifest directory from options: "
-                            f"{self.manifest}")
+            logger.log_info("manifest directory from options: %s",
+                            self.manifest)
             self.manifest = os.path.join(self.manifest_directory,
                                          defaults["tenant_config"])
-            logger.log_info(f"calculated manifest: {self.manifest}")
+            logger.log_info("calculated manifest: %s", self.manifest)
 
         self.version = options.get("version", None)
         if not self.version:
             self.version = defaults["version"]
-        logger.log_info(f"version: {self.version}")
+        logger.log_info("version: %s", self.version)
 
     def create_only(self, context, tenant, kubeconfig, internal_url):
 
@@ -1,7 +1,8 @@
 import os
 import argparse
 from pathlib import Path
-from primazactl.types import existing_file, semvertag_or_latest
+from primazactl.types import existing_file, existing_kubeconfig, \
+    semvertag_or_latest
 from primazactl.utils.kubeconfig import from_env
 from primazactl.version import __primaza_version__
 from primazactl.utils import settings
@@ -51,7 +52,7 @@ def add_shared_args(parser: argparse.ArgumentParser):
         help=f"path to kubeconfig file, default: KUBECONFIG \
                    environment variable if set, otherwise \
                    {(os.path.join(Path.home(),'.kube','config'))}",
-        type=existing_file,
+        type=existing_kubeconfig,
         default=from_env())
 
     # options
@@ -71,5 +72,32 @@ def add_shared_args(parser: argparse.ArgumentParser):
         required=False,
         choices=settings.OUTPUT_CHOICES,
         default=settings.OUTPUT_NONE,
-        help="Set to get output of resources which are created "
-             f"(default: {settings.OUTPUT_NONE}).")
+        help="Set to get output of resources which are created, as "
+             "yaml documents or JSON lines written as each resource is "
+             f"created (default: {settings.OUTPUT_NONE}).")
+
+    parser.add_argument(
+        "--output-list",
+        dest="output_list",
+        required=False,
+        action="store_true",
+        help="Set to write the output as a single v1 List of the "
+             "resources.")
+
+    parser.add_argument(
+        "--server-side",
+        dest="server_side",
+        required=False,
+        action="store_true",
+        default=False,
+        help="Apply resources with server side apply, converging existing "
+             "resources to the requested state (default: False).")
+
+    parser.add_argument(
+        "--incremental",
+        dest="incremental",
+        required=False,
+        action="store_true",
+        default=False,
+        help="Skip resources which were applied with --incremental and "
+             "are unchanged since (default: False).")
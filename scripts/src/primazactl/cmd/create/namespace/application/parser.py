@@ -1,7 +1,6 @@
 import argparse
-from primazactl.cmd.create.namespace.common import create_application_namespace
+from primazactl.cmd.registry import command
 from primazactl.cmd.create.namespace.common import add_args_namespace
-from primazactl.cmd.create.namespace.constants import APPLICATION
 
 
 def add_create_application_namespace(
@@ -13,5 +12,5 @@ def add_create_application_namespace(
             help="Create an application namespace",
             parents=parents)
     application_namespace_parser.set_defaults(
-            func=create_application_namespace)
-    add_args_namespace(application_namespace_parser, APPLICATION)
+            func=command("create application-namespace"))
+    add_args_namespace(application_namespace_parser)
@@ -0,0 +1,87 @@
+import traceback
+import sys
+from .constants import SERVICE, APPLICATION
+from primazactl.utils import settings
+from primazactl.utils import logger
+from primazactl.cmd.apply.options import Options
+
+
+def __create_namespace(args, type):
+    try:
+        settings.set(args)
+
+        options = Options(args)
+
+        # get a tenant, even if the an options file was not
+        # provided it sets the default values
+        tenant = options.get_tenant(args.tenant)
+
+        # just want to create the objects, tenant should already be installed.
+        error = tenant.create_only(args.tenant_context,
+                                   args.tenant,
+                                   args.tenant_kubeconfig,
+                                   args.tenant_internal_url)
+        if error:
+            logger.log_error(error)
+            return
+
+        # get a cluster environment
+        cluster_environment = options.get_cluster_environment(
+            args.cluster_environment, tenant)
+
+        # just want the cluster environment objects,
+        # cluster should already be joined.
+        error = cluster_environment.create_only(
+            args.cluster_environment,
+            args.context,
+            args.kubeconfig,
+            args.service_account_namespace)
+
+        if error:
+            logger.log_error(error)
+            return
+
+        # create the primaza identity and get a kubeconfig with
+        # details required to communicate with the identity
+        main_user = tenant.main.create_primaza_identity(
+            cluster_environment.name)
+        kcfg = tenant.main.get_kubeconfig(main_user)
+
+        # create the agent
+        agent = cluster_environment.get_agent(args.namespace, type)
+        error = agent.create(args.config, args.version)
+        if error:
+            logger.log_info("Create of %s namespace %s failed: %s", agent.type,
+                            agent.name, error)
+            return
+
+        # add a secret to cluster environment to enable
+        # communication with the tenant.
+        cluster_environment.worker.create_namespaced_kubeconfig_secret(
+            kcfg, tenant.tenant)
+
+        if settings.output_active():
+            settings.output()
+        elif settings.dry_run_active():
+            logger.output(f"Dry run create {type} namespace "
+                          f"{args.namespace} successfully completed.")
+        else:
+            # check agent was created correctly.
+            agent.agent.check()
+            logger.output(f"Create {type} namespace {args.namespace} "
+                          f"successfully completed")
+
+    except Exception as e:
+        if args.verbose:
+            logger.output(traceback.format_exc())
+        logger.output(f"\nAn exception creating an {type} namespace",
+                      file=sys.stderr)
+        raise e
+
+
+def create_application_namespace(args):
+    __create_namespace(args, APPLICATION)
+
+
+def create_service_namespace(args):
+    __create_namespace(args, SERVICE)
@@ -1,21 +1,17 @@
 import argparse
-import traceback
-import sys
 import os
 from pathlib import Path
 from primazactl.types import kubernetes_name, \
     existing_file, \
+    existing_kubeconfig, \
     semvertag_or_latest
 from primazactl.primazamain.constants import DEFAULT_TENANT
 from primazactl.version import __primaza_version__
-from .constants import SERVICE, APPLICATION
 from primazactl.utils import settings
-from primazactl.utils import logger
-from primazactl.cmd.apply.options import Options
 from primazactl.primazaworker.constants import WORKER_NAMESPACE
 
 
-def add_args_namespace(parser: argparse.ArgumentParser, type):
+def add_args_namespace(parser: argparse.ArgumentParser):
     parser.add_argument(
         "namespace",
         type=kubernetes_name,
@@ -99,7 +95,7 @@ def add_args_namespace(parser: argparse.ArgumentParser, type):
         help=f"path to kubeconfig file, default: KUBECONFIG \
                    environment variable if set, otherwise \
                    {(os.path.join(Path.home(),'.kube','config'))}",
-        type=existing_file,
+        type=existing_kubeconfig,
         default=None)
 
     parser.add_argument(
@@ -109,7 +105,7 @@ def add_args_namespace(parser: argparse.ArgumentParser, type):
         help=f"path to kubeconfig file for the tenant, default: KUBECONFIG \
                    environment variable if set, otherwise \
                    {(os.path.join(Path.home(),'.kube','config'))}",
-        type=existing_file,
+        type=existing_kubeconfig,
         default=None)
 
     parser.add_argument(
@@ -137,86 +133,32 @@ def add_args_namespace(parser: argparse.ArgumentParser, type):
         required=False,
         choices=settings.OUTPUT_CHOICES,
         default=settings.OUTPUT_NONE,
-        help="Set to get output of resources which are created "
-             f"(default: {settings.OUTPUT_NONE}).")
-
-
-def __create_namespace(args, type):
-    try:
-        settings.set(args)
-
-        options = Options(args)
-
-        # get a tenant, even if the an options file was not
-        # provided it sets the default values
-        tenant = options.get_tenant()
-
-        # just want to create the objects, tenant should already be installed.
-        error = tenant.create_only(args.tenant_context,
-                                   args.tenant,
-                                   args.tenant_kubeconfig,
-                                   args.tenant_internal_url)
-        if error:
-            logger.log_error(error)
-            return
-
-        # get a cluster environment
-        cluster_environment = options.get_cluster_environment(
-            args.cluster_environment, tenant)
-
-        # just want the cluster environment objects,
-        # cluster should already be joined.
-        error = cluster_environment.create_only(
-            args.cluster_environment,
-            args.context,
-            args.kubeconfig,
-            args.service_account_namespace)
-
-        if error:
-            logger.log_error(error)
-            return
-
-        # create the primaza identity and get a kubeconfig with
-        # details required to communicate with the identity
-        main_user = tenant.main.create_primaza_identity(
-            cluster_environment.name)
-        kcfg = tenant.main.get_kubeconfig(main_user)
-
-        # create the agent
-        agent = cluster_environment.get_agent(args.namespace, type)
-        error = agent.create(args.config, args.version)
-        if error:
-            logger.log_info(f"Create of {agent.type} namespace "
-                            f"{agent.name} failed: {error}")
-            return
-
-        # add a secret to cluster environment to enable
-        # communication with the tenant.
-        cluster_environment.worker.create_namespaced_kubeconfig_secret(
-            kcfg, tenant.tenant)
-
-        if settings.output_active():
-            settings.output()
-        elif settings.dry_run_active():
-            print(f"Dry run create {type} namespace "
-                  f"{args.namespace} successfully completed.")
-        else:
-            # check agent was created correctly.
-            agent.agent.check()
-            print(f"Create {type} namespace {args.namespace} "
-                  f"successfully completed")
-
-    except Exception as e:
-        if args.verbose:
-            print(traceback.format_exc())
-        print(f"\nAn exception creating an {type} namespace",
-              file=sys.stderr)
-        raise e
-
-
-def create_application_namespace(args):
-    __create_namespace(args, APPLICATION)
-
-
-def create_service_namespace(args):
-    __create_namespace(args, SERVICE)
+        help="Set to get output of resources which are created, as "
+             "yaml documents or JSON lines written as each resource is "
+             f"created (default: {settings.OUTPUT_NONE}).")
+
+    parser.add_argument(
+        "--output-list",
+        dest="output_list",
+        required=False,
+        action="store_true",
+        help="Set to write the output as a single v1 List of the "
+             "resources.")
+
+    parser.add_argument(
+        "--server-side",
+        dest="server_side",
+        required=False,
+        action="store_true",
+        default=False,
+        help="Apply resources with server side apply, converging existing "
+             "resources to the requested state (default: False).")
+
+    parser.add_argument(
+        "--incremental",
+        dest="incremental",
+        required=False,
+        action="store_true",
+        default=False,
+        help="Skip resources which were applied with --incremental and "
+             "are unchanged since (default: False).")
@@ -1,7 +1,6 @@
 import argparse
-from primazactl.cmd.create.namespace.common import create_service_namespace
+from primazactl.cmd.registry import command
 from primazactl.cmd.create.namespace.common import add_args_namespace
-from primazactl.cmd.create.namespace.constants import SERVICE
 
 
 def add_create_service_namespace(
@@ -12,5 +11,6 @@ def add_create_service_namespace(
             "service-namespace",
             help="Create a service namespace",
             parents=parents)
-    service_namespace_parser.set_defaults(func=create_service_namespace)
-    add_args_namespace(service_namespace_parser, SERVICE)
+    service_namespace_parser.set_defaults(
+            func=command("create service-namespace"))
+    add_args_namespace(service_namespace_parser)
@@ -0,0 +1,48 @@
+import sys
+import traceback
+from primazactl.utils import settings
+from primazactl.utils import logger
+from primazactl.cmd.apply.options import Options
+
+
+def create_tenant(args):
+    try:
+        settings.set(args)
+
+        # get tenant from options, even if the an options file was not
+        # provided it sets the default values
+        tenant = Options(args).get_tenant(args.tenant)
+
+        # install the tenant, use command line args which will overwrite
+        # values from options if specified.
+        error = tenant.install(args.context,
+                               args.tenant,
+                               args.kubeconfig,
+                               args.config,
+                               args.version)
+        if error:
+            logger.log_error("Primaza tenant %s install failed: %s",
+                             tenant.tenant, error)
+            return
+
+        if settings.output_active():
+            settings.output()
+        elif settings.dry_run_active():
+            logger.output(f"Dry run create primaza tenant {tenant.tenant} "
+                          "successfully completed.")
+        else:
+            # check tenant pod is running
+            error_message = tenant.main.check()
+            if error_message:
+                logger.output(f"Primaza tenant {tenant.tenant} create failed: "
+                              f"{error_message}.")
+            else:
+                logger.output(f"Create primaza tenant {tenant.tenant} "
+                              f"successfully completed.")
+
+    except Exception as e:
+        if args.verbose:
+            logger.output(traceback.format_exc())
+        logger.log_error("\nAn exception occurred executing tenant "
+                         "install:\n%s", e, file=sys.stderr)
+        raise e
@@ -0,0 +1,20 @@
+import traceback
+import sys
+from primazactl.utils import logger
+from primazactl.cmd.apply.options import Options
+
+
+def delete_tenant(args):
+    try:
+        tenant = Options(args).get_tenant(args.tenant)
+        tenant.delete(args.context,
+                      args.tenant,
+                      args.kubeconfig,
+                      args.config,
+                      args.version)
+        logger.output(f"Primaza tenant {tenant.tenant} successfully deleted.")
+    except Exception as e:
+        logger.output(traceback.format_exc())
+        logger.output(f"\nAn exception occurred executing main install: {e}",
+                      file=sys.stderr)
+        raise e
@@ -1,7 +1,8 @@
 import os
 import argparse
 from pathlib import Path
-from primazactl.types import existing_file, semvertag_or_latest
+from primazactl.types import existing_file, existing_kubeconfig, \
+    semvertag_or_latest
 from primazactl.utils.kubeconfig import from_env
 from primazactl.version import __primaza_version__
 
@@ -50,5 +51,5 @@ def add_shared_args(parser: argparse.ArgumentParser):
         help=f"path to kubeconfig file, default: KUBECONFIG \
                    environment variable if set, otherwise \
                    {(os.path.join(Path.home(),'.kube','config'))}",
-        type=existing_file,
+        type=existing_kubeconfig,
         default=from_env())
@@ -0,0 +1,68 @@
+import traceback
+import sys
+from primazactl.utils import settings
+from primazactl.cmd.apply.options import Options
+from primazactl.utils import logger
+
+
+def join_cluster(args):
+
+    try:
+
+        if not args.options_file and not (args.environment and
+                                          args.cluster_environment):
+            logger.output("[ERROR] must specify either an options file or "
+                          "both a cluster environment and an environment")
+            return
+
+        settings.set(args)
+
+        options = Options(args)
+
+        # get a tenant, even if the an options file was not
+        # provided it sets the default values
+        tenant = options.get_tenant(args.tenant)
+
+        # just want to create the objects, tenant should already be installed.
+        error = tenant.create_only(args.tenant_context,
+                                   args.tenant,
+                                   args.tenant_kubeconfig,
+                                   None)
+
+        # get a cluster_environment, even if the an options file was not
+        # provided it sets the default values
+        cluster_environment = options.get_cluster_environment(
+            args.cluster_environment, tenant)
+
+        if error:
+            logger.log_error("Join cluster %s failed: %s",
+                             cluster_environment.name, error)
+            return
+
+        # join the cluster, use command line args which will overwrite
+        # values from options if specified.
+        error = cluster_environment.join(args.cluster_environment,
+                                         args.context,
+                                         args.kubeconfig,
+                                         args.environment,
+                                         args.config,
+                                         args.version,
+                                         args.internal_url,
+                                         args.service_account_namespace)
+
+        if error:
+            logger.log_error("Join cluster %s failed: %s",
+                             cluster_environment.name, error)
+        elif settings.output_active():
+            settings.output()
+        elif settings.dry_run_active():
+            logger.output(f"Dry run join cluster {cluster_environment.name} "
+                          f"successfully completed")
+        else:
+            logger.output(f"Join cluster {cluster_environment.name} "
+                          "successfully completed")
+    except Exception as e:
+        logger.output(traceback.format_exc())
+        logger.log_error("\nAn exception occurred executing the worker join "
+                         "function: %s", e, file=sys.stderr)
+        raise e
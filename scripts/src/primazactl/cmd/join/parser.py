@@ -1,15 +1,12 @@
 import os
 import argparse
-import traceback
-import sys
 from pathlib import Path
 from primazactl.types import \
-    existing_file, kubernetes_name, semvertag_or_latest
+    existing_file, existing_kubeconfig, kubernetes_name, semvertag_or_latest
+from primazactl.cmd.registry import command
 from primazactl.primazamain.constants import DEFAULT_TENANT
 from primazactl.version import __primaza_version__
 from primazactl.utils import settings
-from primazactl.cmd.apply.options import Options
-from primazactl.utils import logger
 from primazactl.primazaworker.constants import WORKER_NAMESPACE
 
 
@@ -25,7 +22,7 @@ def add_group(parser: argparse.ArgumentParser, parents=[]):
         help="Join Cluster",
         parents=parents)
 
-    join_cluster_parser.set_defaults(func=join_cluster)
+    join_cluster_parser.set_defaults(func=command("join cluster"))
     add_args_join(join_cluster_parser)
     return join_cluster_parser
 
@@ -75,7 +72,7 @@ def add_args_join(parser: argparse.ArgumentParser):
         help=f"path to kubeconfig file, default: KUBECONFIG \
                    environment variable if set, otherwise \
                    {(os.path.join(Path.home(),'.kube','config'))}",
-        type=existing_file,
+        type=existing_kubeconfig,
         default=None)
 
     parser.add_argument(
@@ -121,7 +118,7 @@ def add_args_join(parser: argparse.ArgumentParser):
         help=f"path to kubeconfig file for the tenant, default: KUBECONFIG \
                    environment variable if set, otherwise \
                    {(os.path.join(Path.home(),'.kube','config'))}",
-        type=existing_file,
+        type=existing_kubeconfig,
         default=None)
 
     parser.add_argument(
@@ -160,68 +157,32 @@ def add_args_join(parser: argparse.ArgumentParser):
         required=False,
         choices=settings.OUTPUT_CHOICES,
         default=settings.OUTPUT_NONE,
-        help="Set to get output of resources which are created "
-             f"(default: {settings.OUTPUT_NONE}).")
-
-
-def join_cluster(args):
-
-    try:
-
-        if not args.options_file and not (args.environment and
-                                          args.cluster_environment):
-            print("[ERROR] must specify either an options file or both "
-                  "a cluster environment and an environment")
-            return
-
-        settings.set(args)
-
-        options = Options(args)
-
-        # get a tenant, even if the an options file was not
-        # provided it sets the default values
-        tenant = options.get_tenant()
-
-        # just want to create the objects, tenant should already be installed.
-        error = tenant.create_only(args.tenant_context,
-                                   args.tenant,
-                                   args.tenant_kubeconfig,
-                                   None)
-
-        # get a cluster_environment, even if the an options file was not
-        # provided it sets the default values
-        cluster_environment = options.get_cluster_environment(
-            args.cluster_environment, tenant)
-
-        if error:
-            logger.log_error(f"Join cluster {cluster_environment.name} "
-                             f"failed: {error}")
-            return
-
-        # join the cluster, use command line args which will overwrite
-        # values from options if specified.
-        error = cluster_environment.join(args.cluster_environment,
-                                         args.context,
-                                         args.kubeconfig,
-                                         args.environment,
-                                         args.config,
-                                         args.version,
-                                         args.internal_url,
-                                         args.service_account_namespace)
-
-        if error:
-            logger.log_error(f"Join cluster {cluster_environment.name} "
-                             f"failed: {error}")
-        elif settings.output_active():
-            settings.output()
-        elif settings.dry_run_active():
-            print(f"Dry run join cluster {cluster_environment.name} "
-                  f"successfully completed")
-        else:
-            print(f"Join cluster {cluster_environment.name} "
-                  "successfully completed")
-    except Exception as e:
-        print(traceback.format_exc())
-        logger.log_error(f"\nAn exception occurred executing the "
-                         f"worker join function: {e}", file=sys.stderr)
-        raise e
+        help="Set to get output of resources which are created, as "
+             "yaml documents or JSON lines written as each resource is "
+             f"created (default: {settings.OUTPUT_NONE}).")
+
+    parser.add_argument(
+        "--output-list",
+        dest="output_list",
+        required=False,
+        action="store_true",
+        help="Set to write the output as a single v1 List of the "
+             "resources.")
+
+    parser.add_argument(
+        "--server-side",
+        dest="server_side",
+        required=False,
+        action="store_true",
+        default=False,
+        help="Apply resources with server side apply, converging existing "
+             "resources to the requested state (default: False).")
+
+    parser.add_argument(
+        "--incremental",
+        dest="incremental",
+        required=False,
+        action="store_true",
+        default=False,
+        help="Skip resources which were applied with --incremental and "
+             "are unchanged since (default: False).")
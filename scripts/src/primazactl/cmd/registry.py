@@ -0,0 +1,48 @@
+import importlib
+from primazactl.utils import profiler
+
+# module and function implementing each command. They are imported when the
+# command runs, so building the parser, --help and argument errors do not
+# load the kubernetes client and the other libraries the commands use.
+COMMANDS: {} = {
+    "create tenant":
+        ("primazactl.cmd.create.tenant.command", "create_tenant"),
+    "create application-namespace":
+        ("primazactl.cmd.create.namespace.command",
+         "create_application_namespace"),
+    "create service-namespace":
+        ("primazactl.cmd.create.namespace.command",
+         "create_service_namespace"),
+    "delete tenant":
+        ("primazactl.cmd.delete.tenant.command", "delete_tenant"),
+    "join cluster":
+        ("primazactl.cmd.join.command", "join_cluster"),
+    "apply":
+        ("primazactl.cmd.apply.command", "run_options"),
+}
+
+
+class Command(object):
+    """
+    Argument parser func which imports the implementation of a command
+    from the registry and calls it.
+    """
+
+    name: str = None
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def __call__(self, args):
+        module, function = COMMANDS[self.name]
+        with profiler.span("import", module=module):
+            implementation = getattr(importlib.import_module(module),
+                                     function)
+        with profiler.span(f"command {self.name}"):
+            return implementation(args)
+
+
+def command(name: str) -> Command:
+    if name not in COMMANDS:
+        raise RuntimeError(f"[ERROR] command {name} is not registered")
+    return Command(name)
@@ -1,7 +1,6 @@
 import base64
-import polling2
 import uuid
-import yaml
+from primazactl.utils import yamlio
 from typing import Dict
 from kubernetes import client
 from primazactl.utils import logger
@@ -9,6 +8,7 @@ from primazactl.utils.kubeconfigwrapper import KubeConfigWrapper
 from primazactl.kube.serviceaccount import ServiceAccount
 from primazactl.kube.secret import Secret
 from primazactl.utils import settings
+from primazactl.kube.readiness import wait_for
 
 
 class KubeIdentity(object):
@@ -47,8 +47,8 @@ class KubeIdentity(object):
             :rtype: str
             :return kubeconfig: The kubeconfig as string
         """
-        logger.log_entry(f"sa name: {self.sa_name}, "
-                         f"namespace: {self.namespace}")
+        logger.log_entry("sa name: %s, namespace: %s", self.sa_name,
+                         self.namespace)
 
         idauth = self.get_token()
 
@@ -63,7 +63,7 @@ class KubeIdentity(object):
         if serverUrl is not None:
             kcd["clusters"][0]["cluster"]["server"] = serverUrl
 
-        return yaml.dump(kcd)
+        return yamlio.dump(kcd)
 
     def get_token(self, timeout: int = 60) -> Dict[str, str]:
         """
@@ -80,23 +80,26 @@ class KubeIdentity(object):
             :return token: A dictionary with Secret data: token, ca.crt,
                             and namespace
         """
-        logger.log_entry(f"sa_name: {self.sa_name} "
-                         f"namespace: {self.namespace}")
+        logger.log_entry("sa_name: %s namespace: %s", self.sa_name,
+                         self.namespace)
 
         if settings.dry_run_active():
             return {"token": "000000"}
 
         corev1 = client.CoreV1Api(self.api_client)
 
-        secret = polling2.poll(
-            target=lambda: corev1.read_namespaced_secret(
-                name=self.key_name,
-                namespace=self.namespace),
-            check_success=lambda x:
-            x.data is not None and x.data["token"] is not None,
-            step=1,
+        secret, ready = wait_for(
+            corev1.list_namespaced_secret,
+            corev1.read_namespaced_secret,
+            self.key_name,
+            lambda x: x.data is not None and
+            x.data.get("token") is not None,
             timeout=timeout,
-        )
+            step=1,
+            namespace=self.namespace)
+        if not ready:
+            raise RuntimeError("[ERROR] Timed out waiting for token of "
+                               f"service account {self.sa_name}")
 
         data = {}
         for k, v in secret.data.items():
@@ -105,8 +108,8 @@ class KubeIdentity(object):
 
     def create(self):
 
-        logger.log_entry(f"sa_name: {self.sa_name} "
-                         f"namespace: {self.namespace}")
+        logger.log_entry("sa_name: %s namespace: %s", self.sa_name,
+                         self.namespace)
 
         service_account = ServiceAccount(self.api_client,
                                          self.sa_name,
@@ -1,6 +1,19 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from kubernetes import client
 from kubernetes.client.rest import ApiException
 from primazactl.utils import logger
+from primazactl.kube.discovery import Discovery
+
+# maximum number of subject access reviews sent at the same time, by all
+# the AccessReviews of the command
+REVIEW_WORKERS: int = 8
+
+# subject access reviews sent by the command, keyed by the api server and
+# the review attributes, and the executor sending them
+reviews = {}
+reviews_lock = threading.Lock()
+review_executor: ThreadPoolExecutor = None
 
 
 class AccessReview(object):
@@ -36,9 +49,50 @@ class AccessReview(object):
 
     def check_access(self,
                      policy: client.V1PolicyRule) -> []:
+        return self.check_rules([policy])
+
+    def check_rules(self, rules: []) -> []:
+        """
+        Check the user has exactly the access the rules grant.
+        The reviews of all the rules are sent together: each distinct
+        review once, concurrently, and only if this command did not send it
+        already.
+
+        :return: an error message for each review with an unexpected result
+        """
+        logger.log_info("User: %s", self.user)
+
+        expectations = {}
+        for policy in rules:
+            can_reviews, cannot_reviews = self.get_access_reviews(policy)
+            for review in can_reviews:
+                expectations.setdefault(
+                    (self.__get_key(review), True), review)
+            for review in cannot_reviews:
+                expectations.setdefault(
+                    (self.__get_key(review), False), review)
+
+        results = {}
+        for (key, _), review in expectations.items():
+            if key not in results:
+                results[key] = self.__submit(key, review)
+
+        error_messages = []
+        for (key, expect_access), review in expectations.items():
+            error_message = self.__check_access(
+                review, results[key].result(), expect_access)
+            if error_message:
+                error_messages.append(error_message)
 
-        logger.log_info(f"User: {self.user}")
+        logger.log_info("Errors: %s", error_messages)
+
+        return error_messages
 
+    def get_access_reviews(self, policy: client.V1PolicyRule):
+        """
+        Expand a rule into the reviews of the verbs it allows and of the
+        verbs it does not allow.
+        """
         # replace empty fields with None to enable for loops
         api_groups = policy.api_groups if policy.api_groups \
             else ["None"]
@@ -67,19 +121,28 @@ class AccessReview(object):
                         cannot_reviews.extend(self.__get_access_reviews(
                             cannot_verbs, resource, resource_name, api_group))
 
-        error_messages = []
-        for review in can_reviews:
-            error_message = self.__check_access(review, True)
-            if error_message:
-                error_messages.append(error_message)
-        for review in cannot_reviews:
-            error_message = self.__check_access(review, False)
-            if error_message:
-                error_messages.append(error_message)
-
-        logger.log_info(f"Errors: {error_messages}")
+        return can_reviews, cannot_reviews
 
-        return error_messages
+    def __get_key(self, access_review):
+        attributes = access_review.resource_attributes
+        return (self.api_client.configuration.host,
+                access_review.user,
+                attributes.namespace,
+                attributes.verb,
+                attributes.resource,
+                attributes.group,
+                attributes.name)
+
+    def __submit(self, key, access_review):
+        global review_executor
+        with reviews_lock:
+            if key not in reviews:
+                if review_executor is None:
+                    review_executor = ThreadPoolExecutor(
+                        max_workers=REVIEW_WORKERS)
+                reviews[key] = review_executor.submit(
+                    self.check_user_access, access_review)
+            return reviews[key]
 
     def __get_access_reviews(self, verbs: [], resource: str,
                              resource_name: str, group: str):
@@ -100,31 +163,32 @@ class AccessReview(object):
             )
         return accesses
 
-    def __check_access(self, access_review, expect_access):
+    def __check_access(self, access_review, status, expect_access):
 
-        status = self.check_user_access(access_review)
         attributes = access_review.resource_attributes
-        msg = f"access: {status.allowed}, " \
+        allowed = status.allowed if status else None
+        msg = f"access: {allowed}, " \
               f"namespace: {attributes.namespace}, " \
               f"verb: {attributes.verb}, " \
               f"resource: {attributes.resource}, " \
               f"name: {attributes.name}"
 
-        if status.allowed == expect_access:
-            logger.log_info(f" PASS: {msg}")
+        if allowed == expect_access:
+            logger.log_info(" PASS: %s", msg)
             return None
         else:
-            logger.log_error(f"  FAIL: {msg} ")
+            logger.log_error("  FAIL: %s ", msg)
             return f"[ERROR]: {self.user} access error: {msg}"
 
     def get_full_verbs(self):
-        api_instance = client.AdmissionregistrationV1Api(self.api_client)
+        discovery = Discovery(self.api_client)
         try:
-            api_resources = api_instance.get_api_resources()
-            return api_resources.resources[0].verbs
+            resources = discovery.get_resources(
+                "admissionregistration.k8s.io/v1")
+            return resources[0]["verbs"]
         except ApiException as e:
             logger.log_error("Exception when calling "
-                             "get_api_resources: %s\n" % e)
+                             "get_api_resources: %s\n", e)
             raise e
 
     def check_user_access(self, access_review: client.V1SubjectAccessReview) \
@@ -141,5 +205,5 @@ class AccessReview(object):
             if e.reason != "Not Found":
                 logger.log_error("Exception when calling "
                                  "create_subject_access_review: "
-                                 "%s\n" % e)
+                                 "%s\n", e)
                 raise e
@@ -0,0 +1,85 @@
+from kubernetes import client
+from kubernetes.client.rest import ApiException
+from primazactl.utils import logger
+
+
+class RulesReview(object):
+    """
+    Answers "can I <verb> <resource>" questions for the current user from
+    a single SelfSubjectRulesReview per namespace, evaluating the returned
+    rules locally instead of sending one SelfSubjectAccessReview per
+    question.
+    """
+
+    auth_client: client.AuthorizationV1Api = None
+    reviews: {} = None
+
+    def __init__(self, api_client: client):
+        self.auth_client = client.AuthorizationV1Api(api_client)
+        self.reviews = {}
+
+    def is_allowed(self, namespace: str, verb: str, group: str,
+                   resource: str, name: str = None) -> bool | None:
+        """
+        Returns True or False when the rules review for the namespace is
+        conclusive and None when the caller needs to fall back to an
+        access review: cluster scoped requests, failed reviews or
+        incomplete rule sets which do not grant the request.
+        """
+        if not namespace:
+            return None
+
+        rules, incomplete = self.get_rules(namespace)
+        if rules is None:
+            return None
+
+        for rule in rules:
+            if self.__matches(rule, verb, group, resource, name):
+                return True
+
+        return None if incomplete else False
+
+    def get_rules(self, namespace: str):
+        if namespace not in self.reviews:
+            self.reviews[namespace] = self.__review(namespace)
+        return self.reviews[namespace]
+
+    def __review(self, namespace: str):
+        logger.log_entry("namespace: %s", namespace)
+        body = client.V1SelfSubjectRulesReview(
+            spec=client.V1SelfSubjectRulesReviewSpec(namespace=namespace))
+        try:
+            response = self.auth_client.create_self_subject_rules_review(body)
+        except ApiException as e:
+            logger.log_info("Exception when calling AuthorizationV1Api"
+                            "->create_self_subject_rules_review: %s", e)
+            return None, True
+
+        status = response.status
+        if status.incomplete:
+            logger.log_info("Rules review for namespace %s is incomplete: %s",
+                            namespace, status.evaluation_error)
+        return status.resource_rules or [], status.incomplete
+
+    @staticmethod
+    def __matches(rule: client.V1ResourceRule, verb: str, group: str,
+                  resource: str, name: str) -> bool:
+
+        if "*" not in rule.verbs and verb not in rule.verbs:
+            return False
+
+        api_groups = rule.api_groups or []
+        if "*" not in api_groups and group not in api_groups:
+            return False
+
+        resources = rule.resources or []
+        if "*" not in resources and resource not in resources:
+            return False
+
+        # create requests have no name to restrict, rules with resource
+        # names never grant them
+        if rule.resource_names and (verb == "create" or
+                                    name not in rule.resource_names):
+            return False
+
+        return True
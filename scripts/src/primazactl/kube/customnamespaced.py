@@ -1,9 +1,11 @@
 from kubernetes import client
 from kubernetes.client.rest import ApiException
-import polling2
-import yaml
+from primazactl.utils import yamlio
 from primazactl.utils import logger
 from primazactl.utils import settings
+from primazactl.kube.serverside import apply_object
+from primazactl.kube import snapshot
+from primazactl.kube.readiness import wait_for
 
 
 class CustomNamespaced(object):
@@ -32,12 +34,19 @@ class CustomNamespaced(object):
 
     def create(self):
 
-        logger.log_entry(f"name: {self.name}, namespace: {self.namespace}")
+        logger.log_entry("name: %s, namespace: %s", self.name, self.namespace)
 
         settings.add_resource(self.body)
         if settings.dry_run == settings.DRY_RUN_CLIENT:
             return
-        if not self.read():
+        if settings.server_side:
+            apply_object(self.custom.api_client, self.body,
+                         f"{self.group}/{self.version}", self.kind)
+            return
+        exists = snapshot.exists(self.custom.api_client,
+                                 f"{self.group}/{self.version}",
+                                 self.kind, self.namespace, self.name)
+        if not exists:
             try:
                 if settings.dry_run == settings.DRY_RUN_SERVER:
                     self.custom.create_namespaced_custom_object(
@@ -54,23 +63,26 @@ class CustomNamespaced(object):
                         self.namespace,
                         self.plural,
                         self.body)
-                logger.log_info(f'SUCCESS: create of {self.body["kind"]} '
-                                f'{self.body["metadata"]["name"]}',
-                                settings.dry_run_active())
+                logger.log_info('SUCCESS: create of %s %s', self.body["kind"],
+                                self.body["metadata"]["name"],
+                                always=settings.dry_run_active())
             except ApiException as e:
-                body = yaml.safe_load(e.body)
-                logger.log_error(f'FAILED: create of {self.body["kind"]} '
-                                 f'{self.body["metadata"]["name"]} '
-                                 f'Exception: {body}')
-                if not settings.dry_run_active():
-                    raise e
-        else:
-            logger.log_info(f'UNCHANGED: {self.body["kind"]} '
-                            f'{self.body["metadata"]["name"]} already exists',
-                            settings.dry_run_active())
+                # created since the snapshot or not managed by primazactl
+                exists = e.status == 409
+                if not exists:
+                    body = yamlio.safe_load(e.body)
+                    logger.log_error('FAILED: create of %s %s Exception: %s',
+                                     self.body["kind"],
+                                     self.body["metadata"]["name"], body)
+                    if not settings.dry_run_active():
+                        raise e
+        if exists:
+            logger.log_info('UNCHANGED: %s %s already exists',
+                            self.body["kind"], self.body["metadata"]["name"],
+                            always=settings.dry_run_active())
 
     def read(self) -> client.V1Namespace | None:
-        logger.log_entry(f"name: {self.name}, namespace: {self.namespace}")
+        logger.log_entry("name: %s, namespace: %s", self.name, self.namespace)
 
         try:
             return self.custom.get_namespaced_custom_object(self.group,
@@ -81,12 +93,12 @@ class CustomNamespaced(object):
         except ApiException as e:
             if e.reason != "Not Found":
                 logger.log_error("Exception when calling "
-                                 "get_namespaced_custom_object: %s\n" % e)
+                                 "get_namespaced_custom_object: %s\n", e)
                 raise e
         return None
 
     def delete(self):
-        logger.log_entry(f"namespace: {self.name}")
+        logger.log_entry("namespace: %s", self.name)
 
         try:
             self.custom.delete_namespaced_custom_object(self.group,
@@ -97,11 +109,11 @@ class CustomNamespaced(object):
         except ApiException as e:
             if e.reason != "Not Found":
                 logger.log_error("Exception when calling "
-                                 "delete_namespace: %s\n" % e)
+                                 "delete_namespace: %s\n", e)
                 raise e
 
     def find(self):
-        logger.log_entry(f"namespace: {self.name}")
+        logger.log_entry("namespace: %s", self.name)
 
         try:
             obj = self.custom.get_namespaced_custom_object(
@@ -113,17 +125,17 @@ class CustomNamespaced(object):
             self.body = obj
             self.name = self.body["metadata"]["name"]
             self.namespace = self.body["metadata"]["namespace"]
-            logger.log_info(f"found: {self.name} in "
-                            f"namespace {self.namespace}")
+            logger.log_info("found: %s in namespace %s", self.name,
+                            self.namespace)
 
         except ApiException as e:
             if e.reason != "Not Found":
                 logger.log_error("Exception when calling "
-                                 "delete_namespace: %s\n" % e)
+                                 "delete_namespace: %s\n", e)
                 raise e
 
     def patch(self, body):
-        logger.log_entry(f"type: {self.name}, namespace: {self.namespace}")
+        logger.log_entry("type: %s, namespace: %s", self.name, self.namespace)
 
         try:
             self.body = self.custom.patch_namespaced_custom_object(
@@ -135,40 +147,35 @@ class CustomNamespaced(object):
                 body)
         except ApiException as e:
             logger.log_error("Exception when calling "
-                             "replace_namespaced_custom_object: %s\n" % e)
+                             "replace_namespaced_custom_object: %s\n", e)
             raise e
 
     def check_state(self, state):
 
-        logger.log_entry(f"check state, ce_name: {self.name}, state:{state}")
+        logger.log_entry("check state, ce_name: %s, state:%s", self.name,
+                         state)
 
-        try:
-            polling2.poll(
-                target=lambda: self.custom.get_namespaced_custom_object_status(
-                    group=self.group,
-                    version=self.version,
-                    namespace=self.namespace,
-                    plural=self.plural,
-                    name=self.name).get("status", {}).get("state", None),
-                check_success=lambda x: x is not None and x == state,
-                step=5,
-                timeout=60)
-        except polling2.TimeoutException:
-            ce_status = self.custom.get_namespaced_custom_object_status(
-                group=self.group,
-                version=self.version,
-                namespace=self.namespace,
-                plural=self.plural,
-                name=self.name)
-            logger.log_error("Timed out waiting for cluster environment "
-                             f"{self.name} to reach state {state}")
-            logger.log_error(f"environment: \n{yaml.dump(ce_status)}")
+        ce_status, ready = wait_for(
+            self.custom.list_namespaced_custom_object,
+            self.custom.get_namespaced_custom_object_status,
+            self.name,
+            lambda x: x.get("status", {}).get("state", None) == state,
+            timeout=60,
+            step=5,
+            group=self.group,
+            version=self.version,
+            namespace=self.namespace,
+            plural=self.plural)
+        if not ready:
+            logger.log_error("Timed out waiting for cluster environment %s to "
+                             "reach state %s", self.name, state)
+            logger.log_error("environment: \n%s", yamlio.dump(ce_status))
             raise RuntimeError("[ERROR] Timed out waiting for cluster "
                                f"environment: {self.name} state: {state}")
 
     def check_status_condition(self, ctype: str, cstatus: str):
-        logger.log_entry(f"check status condition, ce_name: {self.name},"
-                         f"type: {ctype}, status {cstatus}")
+        logger.log_entry("check status condition, ce_name: %s,type: %s, "
+                         "status %s", self.name, ctype, cstatus)
 
         ce_status = self.custom.get_namespaced_custom_object_status(
             group=self.group,
@@ -184,7 +191,7 @@ class CustomNamespaced(object):
             raise RuntimeError("[ERROR] checking install: Cluster Environment "
                                "status conditions are empty or not defined")
 
-        logger.log_info(f"\n\nce conditions:\n{ce_conditions}")
+        logger.log_info("\n\nce conditions:\n%s", ce_conditions)
 
         for condition in ce_conditions:
             if condition["type"] == ctype:
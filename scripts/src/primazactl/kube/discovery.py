@@ -0,0 +1,154 @@
+import json
+import os
+import re
+import threading
+import time
+from kubernetes import client
+from kubernetes.client.rest import ApiException
+from primazactl.utils import logger
+from primazactl.utils.cache import get_cache_dir, write_atomic
+
+# seconds discovery information cached on disk is used before it is
+# fetched again from the server
+DISCOVERY_CACHE_TTL: int = 600
+
+# resource lists known to the command, keyed by (server, group version),
+# with whether they were fetched from the server during the command
+resource_lists = {}
+server_versions = {}
+discovery_lock = threading.Lock()
+# locks of the fetch of each (server, group version), so that concurrent
+# lookups fetch and cache a resource list once
+discovery_locks = {}
+
+
+class Discovery(object):
+    """
+    API resources served by a cluster. Each group version is fetched once
+    per command and cached on disk, like kubectl does, under
+    discovery/<server>/<server version> for DISCOVERY_CACHE_TTL seconds.
+    """
+
+    api_client: client = None
+    host: str = None
+
+    def __init__(self, api_client: client):
+        self.api_client = api_client
+        self.host = api_client.configuration.host
+
+    def get_resources(self, group_version: str,
+                      refresh: bool = False) -> []:
+        """
+        Returns the resources of a group version, e.g. "v1" or
+        "apps/v1", as listed by the server. refresh skips the caches.
+        """
+        key = (self.host, group_version)
+        with discovery_lock:
+            if not refresh and key in resource_lists:
+                return resource_lists[key][0]
+            lock = discovery_locks.setdefault(key, threading.Lock())
+
+        with lock:
+            # another lookup may have got the list while this one waited, a
+            # list fetched during the command is as fresh as a refresh
+            with discovery_lock:
+                known = resource_lists.get(key)
+            if known and (not refresh or known[1]):
+                return known[0]
+
+            resources = None if refresh else self.__read(group_version)
+            fetched = resources is None
+            if fetched:
+                resources = self.__fetch(group_version)
+                self.__write(group_version, resources)
+
+            with discovery_lock:
+                resource_lists[key] = (resources, fetched)
+        return resources
+
+    def get_resource(self, api_version: str, kind: str) -> {}:
+        """
+        Returns the resource serving kind in api_version, or None if the
+        server does not serve it. Cached resource lists which do not
+        include the kind are fetched again once, the kind may have been
+        added, e.g. by a CustomResourceDefinition, since they were cached.
+        """
+        refresh = False
+        while True:
+            try:
+                resources = self.get_resources(api_version, refresh)
+            except ApiException as e:
+                if e.status != 404:
+                    raise e
+                return None
+
+            for resource in resources:
+                # subresources, e.g. pods/status, share the kind
+                if resource["kind"] == kind and "/" not in resource["name"]:
+                    return resource
+
+            with discovery_lock:
+                fetched = resource_lists[(self.host, api_version)][1]
+            if fetched:
+                return None
+            refresh = True
+
+    def get_server_version(self) -> str:
+        with discovery_lock:
+            if self.host in server_versions:
+                return server_versions[self.host]
+
+        try:
+            version = self.__get("/version").get("gitVersion") or "unknown"
+        except ApiException as e:
+            logger.log_info("server version of %s unknown: %s", self.host,
+                            e.reason)
+            version = "unknown"
+
+        with discovery_lock:
+            server_versions[self.host] = version
+        return version
+
+    def __fetch(self, group_version: str) -> []:
+        logger.log_info("discover %s on %s", group_version, self.host)
+        path = f"/apis/{group_version}" if "/" in group_version \
+            else f"/api/{group_version}"
+        return self.__get(path).get("resources") or []
+
+    def __get(self, path: str) -> {}:
+        return self.api_client.call_api(
+            path, "GET",
+            response_type="object",
+            auth_settings=["BearerToken"],
+            _return_http_data_only=True)
+
+    def __get_path(self, group_version: str) -> str:
+        # like kubectl, one directory per server with the characters which
+        # are not safe in a file name replaced
+        host = re.sub(r"^https?://", "", self.host)
+        host = re.sub(r"[^\w.-]", "_", host)
+        version = re.sub(r"[^\w.-]", "_", self.get_server_version())
+        return get_cache_dir("discovery", host, version,
+                             *group_version.split("/"),
+                             "serverresources.json")
+
+    def __read(self, group_version: str) -> []:
+        path = self.__get_path(group_version)
+        try:
+            if time.time() - os.path.getmtime(path) > DISCOVERY_CACHE_TTL:
+                return None
+            with open(path, "r") as cached:
+                return json.load(cached)["resources"]
+        except (OSError, ValueError, KeyError):
+            return None
+
+    def __write(self, group_version: str, resources: []):
+        path = self.__get_path(group_version)
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            write_atomic(path, json.dumps({"groupVersion": group_version,
+                                           "resources": resources})
+                         .encode("utf-8"))
+        except OSError as e:
+            logger.log_warning("Failed to cache discovery of %s: %s",
+                               group_version, e)
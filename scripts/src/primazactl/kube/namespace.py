@@ -2,6 +2,8 @@ from kubernetes import client
 from kubernetes.client.rest import ApiException
 from primazactl.utils import logger
 from primazactl.utils import settings
+from primazactl.kube.serverside import apply_object
+from primazactl.kube import snapshot
 
 
 class Namespace(object):
@@ -14,7 +16,7 @@ class Namespace(object):
         self.corev1 = client.CoreV1Api(api_client)
 
     def create(self):
-        logger.log_entry(f"name: {self.name}")
+        logger.log_entry("name: %s", self.name)
 
         namespace = client.V1Namespace(
             metadata=client.V1ObjectMeta(
@@ -30,45 +32,53 @@ class Namespace(object):
         settings.add_resource(namespace.to_dict())
         if settings.dry_run == settings.DRY_RUN_CLIENT:
             return
-        if not self.read():
+        if settings.server_side:
+            apply_object(self.corev1.api_client, namespace, "v1", "Namespace")
+            return
+        exists = snapshot.exists(self.corev1.api_client, "v1", "Namespace",
+                                 None, self.name)
+        if not exists:
             try:
                 if settings.dry_run == settings.DRY_RUN_SERVER:
                     self.corev1.create_namespace(namespace, dry_run="All")
                 else:
                     self.corev1.create_namespace(namespace)
-                logger.log_info('SUCCESS: create of Namespace '
-                                f'{namespace.metadata.name}',
-                                settings.dry_run_active())
+                logger.log_info('SUCCESS: create of Namespace %s',
+                                namespace.metadata.name,
+                                always=settings.dry_run_active())
             except ApiException as e:
-                logger.log_error('FAILED: create of Namespace '
-                                 f'{namespace.metadata.name} '
-                                 "Exception: %s\n" % e)
-                if not settings.dry_run_active():
-                    raise e
-        else:
-            logger.log_info('UNCHANGED: Namespace '
-                            f'{namespace.name} already exists',
-                            settings.dry_run_active())
+                # created since the snapshot or not managed by primazactl
+                exists = e.status == 409
+                if not exists:
+                    logger.log_error('FAILED: create of Namespace %s '
+                                     'Exception: %s\n',
+                                     namespace.metadata.name, e)
+                    if not settings.dry_run_active():
+                        raise e
+        if exists:
+            logger.log_info('UNCHANGED: Namespace %s already exists',
+                            namespace.metadata.name,
+                            always=settings.dry_run_active())
 
     def read(self) -> client.V1Namespace | None:
-        logger.log_entry(f"namespace: {self.name}")
+        logger.log_entry("namespace: %s", self.name)
 
         try:
             return self.corev1.read_namespace(name=self.name)
         except ApiException as e:
             if e.reason != "Not Found":
                 logger.log_error("Exception when calling "
-                                 "read_namespace: %s\n" % e)
+                                 "read_namespace: %s\n", e)
                 raise e
         return None
 
     def delete(self):
-        logger.log_entry(f"namespace: {self.name}")
+        logger.log_entry("namespace: %s", self.name)
 
         try:
             self.corev1.delete_namespace(name=self.name)
         except ApiException as e:
             if e.reason != "Not Found":
                 logger.log_error("Exception when calling "
-                                 "delete_namespace: %s\n" % e)
+                                 "delete_namespace: %s\n", e)
                 raise e
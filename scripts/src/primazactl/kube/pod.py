@@ -1,7 +1,7 @@
-import time
 from kubernetes import client
 from kubernetes.client.rest import ApiException
 from primazactl.utils import logger
+from primazactl.kube.readiness import wait_for
 
 
 class Pod(object):
@@ -16,60 +16,56 @@ class Pod(object):
         self.corev1 = client.CoreV1Api(api_client)
 
     def get_primaza_pod_name(self):
-        logger.log_entry(f"namespace: {self.namespace}")
+        logger.log_entry("namespace: %s", self.namespace)
 
         try:
             pods_resp = self.corev1.list_namespaced_pod(self.namespace)
             for pod in pods_resp.items:
                 if pod.metadata.name.startswith("primaza-controller"):
-                    logger.log_info(f"Pod found: {pod.metadata.name}")
+                    logger.log_info("Pod found: %s", pod.metadata.name)
                     self.name = pod.metadata.name
                     break
             return self.name
         except ApiException as e:
-            logger.log_error('FAILED: list pods for namespace '
-                             f'{self.namespace} '
-                             "Exception: %s\n" % e)
+            logger.log_error('FAILED: list pods for namespace %s '
+                             'Exception: %s\n', self.namespace, e)
             raise e
 
     def wait_for_running(self):
 
-        logger.log_entry(f"namespace: {self.namespace}, name: {self.name}")
+        logger.log_entry("namespace: %s, name: %s", self.namespace, self.name)
 
         error_msg = None
         pod_running = False
         if self.name:
-            for i in range(1, 30):
-                try:
-                    status = self.corev1.read_namespaced_pod_status(
-                        self.name,
-                        self.namespace)
-                    container_status = status.status.container_statuses[0]
-                    if container_status.state.running:
-                        logger.log_info(f"pod is running: "
-                                        f"{container_status.state.running}")
-                        pod_running = True
-                        break
-                    elif container_status.state.waiting.message:
-                        error_msg = container_status.state.waiting.message
-                        logger.log_error(f"pod failed: {error_msg}")
-                        break
-                    else:
-                        logger.log_info(f"{i} of 30. Pod is not running "
-                                        f"yet, sleep and try again")
-                        time.sleep(2)
-                except ApiException as e:
-                    if e.reason == "Not Found":
-                        logger.log_info(f"{i} of 30. Pod not found, "
-                                        "sleep and try again", True)
-                        time.sleep(2)
-                    else:
-                        logger.log_error("Exception when reading "
-                                         "pod information: %s\n" % e)
-                        raise e
+            pod, ready = wait_for(self.corev1.list_namespaced_pod,
+                                  self.corev1.read_namespaced_pod_status,
+                                  self.name,
+                                  self.__is_started,
+                                  timeout=60,
+                                  step=2,
+                                  namespace=self.namespace)
+            if ready:
+                container_status = pod.status.container_statuses[0]
+                if container_status.state.running:
+                    logger.log_info("pod is running: %s",
+                                    container_status.state.running)
+                    pod_running = True
+                else:
+                    error_msg = container_status.state.waiting.message
+                    logger.log_error("pod failed: %s", error_msg)
 
         if not pod_running and not error_msg:
             error_msg = "Timed out waiting for pod to start"
             logger.log_error(error_msg)
 
         return error_msg
+
+    @staticmethod
+    def __is_started(pod: client.V1Pod) -> bool:
+        # running, or waiting with a message explaining why it cannot start
+        if not pod.status or not pod.status.container_statuses:
+            return False
+        state = pod.status.container_statuses[0].state
+        return bool(state.running or
+                    (state.waiting and state.waiting.message))
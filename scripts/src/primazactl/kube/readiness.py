@@ -0,0 +1,108 @@
+import time
+import urllib3
+from kubernetes import watch
+from kubernetes.client.rest import ApiException
+from primazactl.utils import logger
+from primazactl.utils import profiler
+
+# http status codes returned when a list or watch is not permitted
+WATCH_REFUSED = [403, 405]
+# http status code returned when a watch resource version is too old
+WATCH_EXPIRED = 410
+
+
+def wait_for(list_method, read_method, name: str, is_ready,
+             timeout: int = 60, step: int = 2, **kwargs):
+    """
+    Wait for the object called name to be ready.
+
+    The object is listed once, with a metadata.name field selector, and
+    then watched from the resource version of the list until is_ready
+    returns True for it. The list is repeated when the watch expires. If
+    the list or watch is refused, the object is instead read every step
+    seconds.
+
+    :param list_method: list method of the kubernetes client api for the
+        object, e.g. CoreV1Api.list_namespaced_pod
+    :param read_method: read method of the kubernetes client api for the
+        object, called with the name as its only keyword argument
+    :param is_ready: called with each version of the object seen, returns
+        True to stop waiting
+    :param kwargs: keyword arguments of both list_method and read_method
+    :return: the last version of the object seen, None if it was not
+        found, and whether it is ready
+    """
+    logger.log_entry("name: %s, timeout: %s", name, timeout)
+
+    with profiler.span("wait", name=name):
+        return __wait_for(list_method, read_method, name, is_ready,
+                          timeout, step, kwargs)
+
+
+def __wait_for(list_method, read_method, name, is_ready, timeout, step,
+               kwargs):
+    deadline = time.monotonic() + timeout
+    field_selector = f"metadata.name={name}"
+    obj = None
+    try:
+        while time.monotonic() < deadline:
+            response = list_method(field_selector=field_selector, **kwargs)
+            items, resource_version = __get_items(response)
+            obj = items[0] if items else None
+            if obj is not None and is_ready(obj):
+                return obj, True
+
+            remaining = max(1, int(deadline - time.monotonic()))
+            object_watch = watch.Watch()
+            try:
+                for event in object_watch.stream(
+                        list_method,
+                        field_selector=field_selector,
+                        resource_version=resource_version,
+                        timeout_seconds=remaining,
+                        _request_timeout=remaining + 5,
+                        **kwargs):
+                    if event["type"] == "DELETED":
+                        obj = None
+                    elif event["type"] in ["ADDED", "MODIFIED"]:
+                        obj = event["object"]
+                        if is_ready(obj):
+                            object_watch.stop()
+                            return obj, True
+            except ApiException as e:
+                if e.status != WATCH_EXPIRED:
+                    raise e
+                logger.log_info("watch of %s expired, list again", name)
+            except urllib3.exceptions.HTTPError as e:
+                logger.log_info("watch of %s ended, list again: %s", name, e)
+    except ApiException as e:
+        if e.status not in WATCH_REFUSED:
+            raise e
+        logger.log_info("watch of %s refused, poll instead: %s", name,
+                        e.reason)
+        return __poll(read_method, name, is_ready, deadline, step, kwargs)
+
+    return obj, False
+
+
+def __poll(read_method, name, is_ready, deadline, step, kwargs):
+    obj = None
+    while True:
+        try:
+            obj = read_method(name=name, **kwargs)
+            if is_ready(obj):
+                return obj, True
+        except ApiException as e:
+            if e.reason != "Not Found":
+                raise e
+            obj = None
+        if time.monotonic() + step >= deadline:
+            return obj, False
+        time.sleep(step)
+
+
+def __get_items(response):
+    # custom objects are returned as dictionaries, others as models
+    if isinstance(response, dict):
+        return response["items"], response["metadata"]["resourceVersion"]
+    return response.items, response.metadata.resource_version
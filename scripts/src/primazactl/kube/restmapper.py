@@ -0,0 +1,123 @@
+import threading
+from kubernetes import client, dynamic
+from kubernetes.dynamic.exceptions import ResourceNotFoundError
+from kubernetes.dynamic.resource import Resource
+from primazactl.utils import logger
+from primazactl.kube.discovery import Discovery
+
+# DynamicClients shared by every user of an ApiClient, keyed by its id
+dynamic_clients = {}
+dynamic_clients_lock = threading.Lock()
+
+
+def get_dynamic_client(api_client: client.ApiClient) \
+        -> dynamic.DynamicClient:
+    """
+    Returns the DynamicClient of api_client. Its resources are resolved by
+    a RESTMapper, from the cached discovery, instead of by the discovery
+    of the kubernetes client which fetches every group of the server when
+    it is created.
+    """
+    key = id(api_client)
+    with dynamic_clients_lock:
+        if key not in dynamic_clients:
+            dynamic_clients[key] = (api_client,
+                                    dynamic.DynamicClient(
+                                        api_client, discoverer=RESTMapper))
+        return dynamic_clients[key][1]
+
+
+class RESTMapper(object):
+    """
+    Maps an api version and kind to the resource which serves it: its
+    plural name, its scope and its verbs. It is used as the discoverer of
+    a DynamicClient, providing the subset of the discoverer interface
+    primazactl needs.
+    """
+
+    client: dynamic.DynamicClient = None
+    discovery: Discovery = None
+    mappings: {} = None
+    lock: threading.Lock = None
+
+    # DynamicClient passes its cache file, unused as Discovery keeps its
+    # own cache
+    def __init__(self, dynamic_client: dynamic.DynamicClient,
+                 _cache_file: str = None):
+        self.client = dynamic_client
+        self.discovery = Discovery(dynamic_client.client)
+        self.mappings = {}
+        self.lock = threading.Lock()
+
+    def get(self, api_version: str = None, kind: str = None,
+            **_kwargs) -> Resource:
+        """
+        Returns the resource serving kind in api_version, the other
+        selectors of the discoverer interface are not used.
+        Raises ResourceNotFoundError if the server does not serve it.
+        """
+        key = (api_version, kind)
+        with self.lock:
+            if key in self.mappings:
+                return self.mappings[key]
+
+        served = self.discovery.get_resource(api_version, kind)
+        if not served:
+            raise ResourceNotFoundError(f"No matches found for "
+                                        f"{{'api_version': '{api_version}', "
+                                        f"'kind': '{kind}'}}")
+
+        group, _, version = api_version.rpartition("/")
+        resource = Resource(prefix="apis" if group else "api",
+                            group=group,
+                            api_version=version,
+                            kind=kind,
+                            namespaced=served["namespaced"],
+                            verbs=served.get("verbs"),
+                            name=served["name"],
+                            client=self.client,
+                            singularName=served.get("singularName"),
+                            shortNames=served.get("shortNames"),
+                            categories=served.get("categories"))
+        with self.lock:
+            self.mappings[key] = resource
+        return resource
+
+    def get_for(self, body: {}) -> Resource:
+        """
+        Returns the resource for body. Kinds the server does not serve
+        yet, e.g. those of a CustomResourceDefinition which is not
+        established, are mapped to the lower case kind plus 's', scoped by
+        whether body has a namespace, and are not remembered.
+        """
+        try:
+            return self.get(api_version=body["apiVersion"],
+                            kind=body["kind"])
+        except ResourceNotFoundError:
+            logger.log_info('%s %s not found by discovery, guess its resource',
+                            body["apiVersion"], body["kind"])
+            group, _, version = body["apiVersion"].rpartition("/")
+            return Resource(prefix="apis" if group else "api",
+                            group=group,
+                            api_version=version,
+                            kind=body["kind"],
+                            namespaced="namespace" in body["metadata"],
+                            name=f'{body["kind"].lower()}s',
+                            client=self.client)
+
+    def prepare(self, bodies: []):
+        """
+        Resolve the resources of every distinct kind in bodies, so that
+        applying them does not wait on discovery.
+        """
+        for api_version, kind in dict.fromkeys(
+                (body["apiVersion"], body["kind"]) for body in bodies):
+            try:
+                self.get(api_version=api_version, kind=kind)
+            except ResourceNotFoundError:
+                # resolved again when it is applied
+                pass
+
+    @property
+    def version(self):
+        return {"kubernetes": self.discovery.get_server_version()}
@@ -2,7 +2,9 @@ from kubernetes import client
 from kubernetes.client.rest import ApiException
 from primazactl.utils import logger
 from primazactl.utils import settings
-import yaml
+from primazactl.kube.serverside import apply_object
+from primazactl.kube import snapshot
+from primazactl.utils import yamlio
 
 
 class Role(object):
@@ -22,11 +24,18 @@ class Role(object):
         self.namespace = namespace
 
     def create(self):
-        logger.log_entry(f"User: {self.name}")
+        logger.log_entry("User: %s", self.name)
         settings.add_resource(self.role.to_dict())
         if settings.dry_run == settings.DRY_RUN_CLIENT:
             return
-        if not self.read():
+        if settings.server_side:
+            apply_object(self.rbac.api_client, self.role,
+                         "rbac.authorization.k8s.io/v1", "Role")
+            return
+        exists = snapshot.exists(self.rbac.api_client,
+                                 "rbac.authorization.k8s.io/v1", "Role",
+                                 self.namespace, self.name)
+        if not exists:
             try:
                 if settings.dry_run == settings.DRY_RUN_SERVER:
                     self.rbac.create_namespaced_role(self.namespace,
@@ -35,46 +44,48 @@ class Role(object):
                 else:
                     self.rbac.create_namespaced_role(self.namespace,
                                                      self.role)
-                logger.log_info('SUCCESS: create of Role '
-                                f'{self.role.metadata.name}',
-                                settings.dry_run_active())
+                logger.log_info('SUCCESS: create of Role %s',
+                                self.role.metadata.name,
+                                always=settings.dry_run_active())
             except ApiException as e:
-                body = yaml.safe_load(e.body)
-                logger.log_error('FAILED: create of Role '
-                                 f'{self.role.metadata.name} '
-                                 f'Exception: {body["message"]}')
-                if not settings.dry_run_active():
-                    raise e
-        else:
-            logger.log_info('UNCHANGED: Role '
-                            f'{self.role.metadata.name} already exists',
-                            settings.dry_run_active())
+                # created since the snapshot or not managed by primazactl
+                exists = e.status == 409
+                if not exists:
+                    body = yamlio.safe_load(e.body)
+                    logger.log_error('FAILED: create of Role %s Exception: %s',
+                                     self.role.metadata.name, body["message"])
+                    if not settings.dry_run_active():
+                        raise e
+        if exists:
+            logger.log_info('UNCHANGED: Role %s already exists',
+                            self.role.metadata.name,
+                            always=settings.dry_run_active())
 
     def read(self) -> client.V1ClusterRole | None:
-        logger.log_entry(f"User: {self.name}")
+        logger.log_entry("User: %s", self.name)
 
         try:
             return self.rbac.read_namespaced_role(self.name, self.namespace)
         except ApiException as e:
             if e.reason != "Not Found":
                 logger.log_error("Exception when calling "
-                                 "read_cluster_role: %s\n" % e)
+                                 "read_cluster_role: %s\n", e)
                 raise e
         return None
 
     def delete(self):
-        logger.log_entry(f"User: {self.name}")
+        logger.log_entry("User: %s", self.name)
 
         try:
             return self.rbac.delete_namesapced_role(self.name, self.namespace)
         except ApiException as e:
             if e.reason != "Not Found":
                 logger.log_error("Exception when calling "
-                                 "delete_cluster_role: %s\n" % e)
+                                 "delete_cluster_role: %s\n", e)
                 raise e
 
     def get_rules(self):
-        logger.log_entry(f"User: {self.name}")
+        logger.log_entry("User: %s", self.name)
         policy = self.read()
         if policy:
             return policy.rules
@@ -2,7 +2,9 @@ from kubernetes import client
 from kubernetes.client.rest import ApiException
 from primazactl.utils import logger
 from primazactl.utils import settings
-import yaml
+from primazactl.kube.serverside import apply_object
+from primazactl.kube import snapshot
+from primazactl.utils import yamlio
 
 
 class RoleBinding(object):
@@ -26,9 +28,9 @@ class RoleBinding(object):
         self.namespace = namespace
 
     def create(self):
-        logger.log_entry(f"Name: {self.name}, user {self.user}, "
-                         f"namespace : {self.namespace}, "
-                         f"service account: {self.service_account}")
+        logger.log_entry("Name: %s, user %s, namespace : %s, service account: "
+                         "%s", self.name, self.user, self.namespace,
+                         self.service_account)
 
         binding = client.V1RoleBinding(
             kind="RoleBinding",
@@ -54,7 +56,14 @@ class RoleBinding(object):
         settings.add_resource(binding.to_dict())
         if settings.dry_run == settings.DRY_RUN_CLIENT:
             return
-        if not self.read():
+        if settings.server_side:
+            apply_object(self.rbac.api_client, binding,
+                         "rbac.authorization.k8s.io/v1", "RoleBinding")
+            return
+        exists = snapshot.exists(self.rbac.api_client,
+                                 "rbac.authorization.k8s.io/v1",
+                                 "RoleBinding", self.namespace, self.name)
+        if not exists:
             try:
                 if settings.dry_run == settings.DRY_RUN_SERVER:
                     self.rbac.create_namespaced_role_binding(
@@ -64,23 +73,26 @@ class RoleBinding(object):
                     self.rbac.create_namespaced_role_binding(
                         namespace=self.namespace,
                         body=binding)
-                logger.log_info('SUCCESS: create of RoleBinding '
-                                f'{binding.metadata.name}',
-                                settings.dry_run_active())
+                logger.log_info('SUCCESS: create of RoleBinding %s',
+                                binding.metadata.name,
+                                always=settings.dry_run_active())
             except ApiException as e:
-                body = yaml.safe_load(e.body)
-                logger.log_error('FAILED: create of RoleBinding '
-                                 f'{binding.metadata.name} '
-                                 f'Exception: {body["message"]}')
-                if not settings.dry_run_active():
-                    raise e
-        else:
-            logger.log_info('UNCHANGED: create of RoleBinding '
-                            f'{binding.metadata.name} already exists',
-                            settings.dry_run_active())
+                # created since the snapshot or not managed by primazactl
+                exists = e.status == 409
+                if not exists:
+                    body = yamlio.safe_load(e.body)
+                    logger.log_error('FAILED: create of RoleBinding %s '
+                                     'Exception: %s', binding.metadata.name,
+                                     body["message"])
+                    if not settings.dry_run_active():
+                        raise e
+        if exists:
+            logger.log_info('UNCHANGED: create of RoleBinding %s already '
+                            'exists', binding.metadata.name,
+                            always=settings.dry_run_active())
 
     def read(self) -> client.V1RoleBinding | None:
-        logger.log_entry(f"Name: {self.name}, user {self.user}")
+        logger.log_entry("Name: %s, user %s", self.name, self.user)
 
         try:
             return self.rbac.read_namespaced_role_binding(
@@ -89,12 +101,12 @@ class RoleBinding(object):
         except ApiException as e:
             if e.reason != "Not Found":
                 logger.log_error("Exception when calling "
-                                 "read_cluster_role_binding: %s\n" % e)
+                                 "read_cluster_role_binding: %s\n", e)
                 raise e
         return None
 
     def delete(self) -> str:
-        logger.log_entry(f"Name: {self.name}, user {self.user}")
+        logger.log_entry("Name: %s, user %s", self.name, self.user)
 
         try:
             self.rbac.delete_namespaced_role_binding(name=self.name,
@@ -102,5 +114,5 @@ class RoleBinding(object):
         except ApiException as e:
             if e.reason != "Not Found":
                 logger.log_error("Exception when calling "
-                                 "read_cluster_role_binding: %s\n" % e)
+                                 "read_cluster_role_binding: %s\n", e)
                 raise e
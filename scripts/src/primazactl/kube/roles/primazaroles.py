@@ -7,7 +7,7 @@ from primazactl.utils import logger
 # in the repo primaza/primaza
 def get_primaza_namespace_role(role_name: str,
                                namespace: str) -> client.V1Role:
-    logger.log_entry(f"role_name: {role_name}")
+    logger.log_entry("role_name: %s", role_name)
     return client.V1Role(
         metadata=client.V1ObjectMeta(
             name=role_name,
@@ -3,7 +3,9 @@ from kubernetes.client.rest import ApiException
 from primazactl.utils import logger
 from typing import Dict, List
 from primazactl.utils import settings
-import yaml
+from primazactl.kube.serverside import apply_object
+from primazactl.kube import snapshot
+from primazactl.utils import yamlio
 import copy
 
 
@@ -27,8 +29,8 @@ class Secret(object):
         self.owners = owners
 
     def create(self, secret: client.V1Secret = None):
-        logger.log_entry(f"Secret name: {self.name}, "
-                         f"namespace: {self.namespace}")
+        logger.log_entry("Secret name: %s, namespace: %s", self.name,
+                         self.namespace)
 
         if not secret:
             secret = client.V1Secret(
@@ -60,7 +62,12 @@ class Secret(object):
                                  'attribute modified to hide secrets')
         if settings.dry_run == settings.DRY_RUN_CLIENT:
             return
-        if not self.read():
+        if settings.server_side:
+            apply_object(self.corev1.api_client, secret, "v1", "Secret")
+            return
+        exists = snapshot.exists(self.corev1.api_client, "v1", "Secret",
+                                 self.namespace, self.name)
+        if not exists:
             try:
                 if settings.dry_run == settings.DRY_RUN_SERVER:
                     self.corev1.create_namespaced_secret(
@@ -70,24 +77,27 @@ class Secret(object):
                     self.corev1.create_namespaced_secret(
                         namespace=self.namespace,
                         body=secret)
-                logger.log_info('SUCCESS: create of Secret '
-                                f'{secret.metadata.name}',
-                                settings.dry_run_active())
+                logger.log_info('SUCCESS: create of Secret %s',
+                                secret.metadata.name,
+                                always=settings.dry_run_active())
             except ApiException as e:
-                body = yaml.safe_load(e.body)
-                logger.log_error('FAILED: create of Secret '
-                                 f'{secret.metadata.name} '
-                                 f'Exception: {body["message"]}')
-                if not settings.dry_run_active():
-                    raise e
-        else:
-            logger.log_info('UNCHANGED: create of secret '
-                            f'{secret.metadata.name} already exists',
-                            settings.dry_run_active())
+                # created since the snapshot or not managed by primazactl
+                exists = e.status == 409
+                if not exists:
+                    body = yamlio.safe_load(e.body)
+                    logger.log_error('FAILED: create of Secret %s Exception: '
+                                     '%s', secret.metadata.name,
+                                     body["message"])
+                    if not settings.dry_run_active():
+                        raise e
+        if exists:
+            logger.log_info('UNCHANGED: create of secret %s already exists',
+                            secret.metadata.name,
+                            always=settings.dry_run_active())
 
     def read(self) -> client.V1Secret | None:
-        logger.log_entry(f"Secret name: {self.name}, "
-                         f"namespace: {self.namespace}")
+        logger.log_entry("Secret name: %s, namespace: %s", self.name,
+                         self.namespace)
 
         try:
             return self.corev1.read_namespaced_secret(
@@ -96,14 +106,14 @@ class Secret(object):
         except ApiException as e:
             if e.reason != "Not Found":
                 logger.log_error("Exception when calling "
-                                 "read_namespaced_secret: %s\n" % e)
+                                 "read_namespaced_secret: %s\n", e)
                 raise e
 
         return None
 
     def delete(self):
-        logger.log_entry(f"Secret name: {self.name}, "
-                         f"namespace: {self.namespace}")
+        logger.log_entry("Secret name: %s, namespace: %s", self.name,
+                         self.namespace)
 
         try:
             self.corev1.delete_namespaced_secret(name=self.name,
@@ -111,18 +121,18 @@ class Secret(object):
         except ApiException as e:
             if e.reason != "Not Found":
                 logger.log_error("Exception when calling "
-                                 "delete_namespaced_secret: %s\n" % e)
+                                 "delete_namespaced_secret: %s\n", e)
                 raise e
 
     def list(self) -> client.V1ResourceQuotaList | None:
-        logger.log_entry(f"Secret name: {self.name}, "
-                         f"namespace: {self.namespace}")
+        logger.log_entry("Secret name: %s, namespace: %s", self.name,
+                         self.namespace)
 
         try:
             return self.corev1.list_namespaced_secret(namespace=self.namespace)
         except ApiException as e:
             if e.reason != "Not Found":
                 logger.log_error("Exception when calling "
-                                 "list_namespaced_secret: %s\n" % e)
+                                 "list_namespaced_secret: %s\n", e)
                 raise e
         return None
@@ -0,0 +1,56 @@
+from primazactl.utils import yamlio
+from kubernetes import client
+from kubernetes.client.rest import ApiException
+from primazactl.utils import logger
+from primazactl.utils import settings
+from primazactl.kube.restmapper import get_dynamic_client
+
+FIELD_MANAGER: str = "primazactl"
+
+
+def server_side_apply(api_client: client.ApiClient, body,
+                      api_version: str = None, kind: str = None) -> {}:
+    """
+    Send body as a single server side apply patch owned by the primazactl
+    field manager, creating the object or converging it to body.
+    body may be a dict or a kubernetes client model, api_version and kind
+    are set on the request when body does not include them.
+    """
+    body = api_client.sanitize_for_serialization(body)
+    if api_version:
+        body.setdefault("apiVersion", api_version)
+    if kind:
+        body.setdefault("kind", kind)
+
+    logger.log_entry('%s %s', body["kind"], body["metadata"]["name"])
+
+    dynamic_client = get_dynamic_client(api_client)
+    resource = dynamic_client.resources.get_for(body)
+
+    kwargs = {}
+    if settings.dry_run == settings.DRY_RUN_SERVER:
+        kwargs["dry_run"] = "All"
+
+    return dynamic_client.server_side_apply(resource, body,
+                                            force_conflicts=True,
+                                            field_manager=FIELD_MANAGER,
+                                            **kwargs).to_dict()
+
+
+def apply_object(api_client: client.ApiClient, body,
+                 api_version: str, kind: str):
+    """
+    Server side apply body, logging the outcome the same way the create
+    methods of the kube wrappers do.
+    """
+    name = api_client.sanitize_for_serialization(body)["metadata"]["name"]
+    try:
+        server_side_apply(api_client, body, api_version, kind)
+        logger.log_info('SUCCESS: apply of %s %s', kind, name,
+                        always=settings.dry_run_active())
+    except ApiException as e:
+        error = yamlio.safe_load(e.body)
+        logger.log_error('FAILED: apply of %s %s Exception: %s', kind, name,
+                         error["message"])
+        if not settings.dry_run_active():
+            raise e
@@ -2,7 +2,9 @@ from kubernetes import client
 from kubernetes.client.rest import ApiException
 from primazactl.utils import logger
 from primazactl.utils import settings
-import yaml
+from primazactl.kube.serverside import apply_object
+from primazactl.kube import snapshot
+from primazactl.utils import yamlio
 
 
 class ServiceAccount(object):
@@ -22,8 +24,8 @@ class ServiceAccount(object):
         self.authv1 = client.AuthorizationV1Api(api_client)
 
     def create(self):
-        logger.log_entry(f"Identity: {self.identity}, "
-                         f"namespace: {self.namespace}")
+        logger.log_entry("Identity: %s, namespace: %s", self.identity,
+                         self.namespace)
 
         new_sa = client.V1ServiceAccount(
             api_version="v1",
@@ -43,8 +45,17 @@ class ServiceAccount(object):
         if settings.dry_run == settings.DRY_RUN_CLIENT:
             self.sa = new_sa
             return
-        if not self.read():
+        if settings.server_side:
             self.sa = new_sa
+            apply_object(self.corev1.api_client, new_sa,
+                         "v1", "ServiceAccount")
+            return
+        # read returns it during a dry run
+        self.sa = new_sa
+        exists = snapshot.exists(self.corev1.api_client, "v1",
+                                 "ServiceAccount", self.namespace,
+                                 self.identity)
+        if not exists:
             try:
                 if settings.dry_run == settings.DRY_RUN_SERVER:
                     self.corev1.create_namespaced_service_account(
@@ -52,24 +63,27 @@ class ServiceAccount(object):
                 else:
                     self.corev1.create_namespaced_service_account(
                         self.namespace, self.sa)
-                logger.log_info('SUCCESS: create of ServiceAccount '
-                                f'{self.sa.metadata.name}',
-                                settings.dry_run_active())
+                logger.log_info('SUCCESS: create of ServiceAccount %s',
+                                self.sa.metadata.name,
+                                always=settings.dry_run_active())
             except ApiException as e:
-                body = yaml.safe_load(e.body)
-                logger.log_error('FAILED: create of ServiceAccount '
-                                 f'{self.sa.metadata.name} '
-                                 f'Exception: {body["message"]}')
-                if not settings.dry_run_active():
-                    raise e
-        else:
-            logger.log_info('UNCHANGED: ServiceAccount '
-                            f'{new_sa.metadata.name} already exists',
-                            settings.dry_run_active())
+                # created since the snapshot or not managed by primazactl
+                exists = e.status == 409
+                if not exists:
+                    body = yamlio.safe_load(e.body)
+                    logger.log_error('FAILED: create of ServiceAccount %s '
+                                     'Exception: %s', self.sa.metadata.name,
+                                     body["message"])
+                    if not settings.dry_run_active():
+                        raise e
+        if exists:
+            logger.log_info('UNCHANGED: ServiceAccount %s already exists',
+                            new_sa.metadata.name,
+                            always=settings.dry_run_active())
 
     def read(self) -> client.V1ServiceAccount | None:
-        logger.log_entry(f"Identity: {self.identity}, "
-                         f"namespace: {self.namespace}")
+        logger.log_entry("Identity: %s, namespace: %s", self.identity,
+                         self.namespace)
 
         if settings.dry_run_active():
             return self.sa
@@ -81,14 +95,14 @@ class ServiceAccount(object):
         except ApiException as e:
             if e.reason != "Not Found":
                 logger.log_error("Exception when calling "
-                                 "read_namespaced_secret: %s\n" % e)
+                                 "read_namespaced_secret: %s\n", e)
                 raise e
 
         return None
 
     def delete(self):
-        logger.log_entry(f"Identity: {self.identity}, "
-                         f"namespace: {self.namespace}")
+        logger.log_entry("Identity: %s, namespace: %s", self.identity,
+                         self.namespace)
 
         try:
             self.corev1.delete_namespaced_service_account(
@@ -98,5 +112,5 @@ class ServiceAccount(object):
             if e.reason != "Not Found":
                 logger.log_error("Exception when calling "
                                  "delete_namespaced_service_account: "
-                                 "%s\n" % e)
+                                 "%s\n", e)
                 raise e
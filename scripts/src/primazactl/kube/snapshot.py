@@ -0,0 +1,91 @@
+import threading
+from kubernetes import client
+from kubernetes.client.rest import ApiException
+from kubernetes.dynamic.exceptions import ResourceNotFoundError
+from primazactl.utils import logger
+from primazactl.kube.restmapper import get_dynamic_client
+
+# label set on the objects the kube wrappers create
+MANAGED_BY_SELECTOR: str = "app.kubernetes.io/managed-by=primazactl"
+# only the metadata of the listed objects is needed, ask for it alone
+METADATA_LIST: str = "application/json;as=PartialObjectMetadataList;" \
+                     "g=meta.k8s.io;v=v1,application/json"
+
+# names of the objects of a kind in a namespace, keyed by (server, api
+# version, kind, namespace), listed once per command
+snapshots = {}
+snapshots_lock = threading.Lock()
+snapshot_locks = {}
+
+
+def list_metadata(api_client: client, api_version: str, kind: str,
+                  namespace: str = None, label_selector: str = None) -> []:
+    """
+    Returns the metadata of the objects of a kind, in namespace if the
+    kind is namespaced, with a single list request.
+    """
+    dynamic_client = get_dynamic_client(api_client)
+    mapping = dynamic_client.resources.get_for(
+        {"apiVersion": api_version, "kind": kind,
+         "metadata": {"namespace": namespace} if namespace else {}})
+    response = dynamic_client.request(
+        "get",
+        mapping.path(namespace=namespace if mapping.namespaced else None),
+        label_selector=label_selector,
+        header_params={"Accept": METADATA_LIST})
+    return [item.get("metadata") or {}
+            for item in response.to_dict().get("items") or []]
+
+
+def exists(api_client: client, api_version: str, kind: str,
+           namespace: str, name: str) -> bool:
+    """
+    Returns whether the object exists, according to a snapshot of the
+    objects of its kind and namespace managed by primazactl.
+    The snapshot is listed on the first call and kept for the rest of the
+    command. Objects not managed by primazactl, or created since, are not
+    in it: creating them must handle AlreadyExists. If the kind cannot be
+    listed the object is read instead.
+    """
+    key = (api_client.configuration.host, api_version, kind, namespace)
+    with snapshots_lock:
+        lock = snapshot_locks.setdefault(key, threading.Lock())
+
+    with lock:
+        if key not in snapshots:
+            try:
+                snapshots[key] = {
+                    metadata["name"] for metadata in list_metadata(
+                        api_client, api_version, kind, namespace,
+                        MANAGED_BY_SELECTOR)}
+            except ApiException as e:
+                logger.log_info("list of %s failed, read instead: %s", kind,
+                                e.reason)
+                snapshots[key] = None
+        names = snapshots[key]
+
+    if names is None:
+        return __read(api_client, api_version, kind, namespace, name)
+    return name in names
+
+
+def __read(api_client, api_version, kind, namespace, name) -> bool:
+    dynamic_client = get_dynamic_client(api_client)
+    try:
+        mapping = dynamic_client.resources.get(api_version=api_version,
+                                               kind=kind)
+    except ResourceNotFoundError:
+        # the kind is not served, e.g. its CRD was only created by a dry
+        # run, so there is no object of it
+        logger.log_info("%s %s not served, %s not found", api_version,
+                        kind, name)
+        return False
+    try:
+        dynamic_client.get(mapping, name=name,
+                           namespace=namespace if mapping.namespaced
+                           else None)
+        return True
+    except ApiException as e:
+        if e.status != 404:
+            raise e
+    return False
@@ -1,118 +1,99 @@
-import re
-import yaml
+from primazactl.utils import yamlio
+from concurrent.futures import ThreadPoolExecutor
 from kubernetes import client
 from kubernetes.client.rest import ApiException
 from primazactl.utils import logger
+from primazactl.utils import profiler
 from primazactl.utils import settings
+from primazactl.kube.access.rulesreview import RulesReview
+from primazactl.kube.serverside import server_side_apply
+from primazactl.kube.restmapper import get_dynamic_client
+from .constants import APPLY_TIERS, APPLY_WORKERS
+from .incremental import annotate, get_hash, get_applied
 
 
-def get_method(kind, action="create", namespaced=False):
-    method = action
-    if namespaced:
-        method += "_namespaced"
-    method += f"_{re.sub(r'(?<!^)(?=[A-Z])', '_', kind).lower()}"
-    return method
+def get_plural(resource: {}, api_client: client) -> str:
+    """
+    Returns the resource name the server serves the kind of resource as,
+    guessing it from the kind if the server does not serve it yet.
+    """
+    return get_dynamic_client(api_client).resources.get_for(resource).name
 
 
-def __get_group_and_version(api_version):
-    group, _, version = api_version.partition("/")
-    if version == "":
-        use_group = "core"
-    else:
-        use_group = group.lower()
-    return version, use_group
-
-
-def get_kube_client(api_version, api_client):
-    group, _, version = api_version.partition("/")
-    if version == "":
-        version = group.capitalize()
-        cap_group = "Core"
-    else:
-        version = version.capitalize()
-        cap_group = ""
-        if group.endswith(".k8s.io"):
-            group = group[:-len(".k8s.io")]
-        for word in group.split('.'):
-            cap_group += word.capitalize()
-
-    function = f"{cap_group}{version}Api"
-
-    if hasattr(client, function):
-        return getattr(client, function)(api_client)
-    elif hasattr(client, "CustomObjectsApi"):
-        return getattr(client, "CustomObjectsApi")(api_client)
-    else:
-        return "Not Found"
-
-
-def apply_resource(resource: {}, api_client: client, action: str = "create"):
+def apply_resource(resource: {}, api_client: client, action: str = "create",
+                   record: bool = True):
 
     logger.log_entry(resource["metadata"]["name"])
     namespace = resource["metadata"]["namespace"] \
         if "namespace" in resource["metadata"] else ""
 
-    settings.add_resource(resource)
+    if record:
+        settings.add_resource(resource)
     if settings.dry_run == settings.DRY_RUN_CLIENT:
         return None, None
 
-    kwargs = {}
-    if namespace:
-        kwargs['namespace'] = namespace
-        namespaced = True
-    else:
-        namespaced = False
+    if action == "apply":
+        return server_side_apply(api_client, resource), ""
 
-    if settings.dry_run == settings.DRY_RUN_SERVER:
+    kwargs = {}
+    if settings.dry_run == settings.DRY_RUN_SERVER and action != "read":
         kwargs['dry_run'] = "All"
 
-    resource_client = get_kube_client(resource["apiVersion"], api_client)
-
-    logger.log_info(f'{resource["apiVersion"]}, {type(resource_client)}')
-
-    if isinstance(resource_client, client.CustomObjectsApi):
-        group, _, version = resource["apiVersion"].partition("/")
-        kwargs["group"] = group
-        kwargs["version"] = version
-        kwargs["plural"] = f'{resource["kind"].lower()}s'
-        if action == "read":
-            action = "get"
-        if namespaced:
-            method = f"{action}_namespaced_custom_object"
-        else:
-            method = f"{action}_cluster_custom_object"
-    else:
-        method = get_method(resource["kind"], action, namespaced)
-        group, _, version = resource["apiVersion"].partition("/")
-
-    error = ""
-    if hasattr(resource_client, method):
-        logger.log_info(f'call {method} on {type(resource_client)}, '
-                        f'name : {resource["metadata"]["name"]}')
-        if action == "create" or action == "patch":
-            resp = getattr(resource_client, method)(body=resource, **kwargs)
-        else:
-            resource_name = resource["metadata"]["name"]
-            resp = getattr(resource_client, method)(name=resource_name,
-                                                    **kwargs)
+    dynamic_client = get_dynamic_client(api_client)
+    mapping = dynamic_client.resources.get_for(resource)
+    name = resource["metadata"]["name"]
+    if mapping.namespaced and not namespace:
+        error = f"[ERROR] namespace not set for {resource['kind']} {name}"
+        logger.log_error(error)
+        return "", error
+    namespace = namespace if mapping.namespaced else None
+
+    logger.log_info('call %s on %s %s, name : %s', action,
+                    mapping.group_version, mapping.name, name)
+    if action == "create":
+        resp = dynamic_client.create(mapping, body=resource,
+                                     namespace=namespace, **kwargs)
+    elif action == "patch":
+        resp = dynamic_client.patch(mapping, body=resource,
+                                    namespace=namespace, **kwargs)
+    elif action == "read":
+        resp = dynamic_client.get(mapping, name=name, namespace=namespace)
+    elif action == "delete":
+        resp = dynamic_client.delete(mapping, name=name,
+                                     namespace=namespace, **kwargs)
     else:
-        error = f"[ERROR] method {method} not found in " \
-                f"{type(resource_client)}"
+        error = f"[ERROR] action {action} not supported for " \
+                f"{resource['kind']}"
         logger.log_error(error)
-        resp = ""
+        return "", error
 
-    return resp, error
+    return resp.to_dict(), ""
 
 
 def check_self(resource_list, api_client: client,
-               action: str = "create"):
-
+               action: str = "create", actions: [] = None):
+    """
+    Returns the errors of the resources the user does not have the
+    permissions to apply with action, or with the action of each resource
+    in actions when it is set.
+    """
+
+    # one rules review per namespace answers most of the checks locally,
+    # access reviews are only sent for what it cannot answer.
+    rules_review = RulesReview(api_client)
     auth_client = client.AuthorizationV1Api(api_client)
     errors = []
-    for resource in resource_list:
-        error = __check_self_access(resource, action, auth_client)
-        if len(error) > 0:
-            errors.append(error)
+    for index, resource in enumerate(resource_list):
+        resource_action = actions[index] if actions else action
+        # a server side apply creates missing resources and patches the
+        # others
+        verbs = ["create", "patch"] if resource_action == "apply" \
+            else [resource_action]
+        for verb in verbs:
+            error = __check_self_access(resource, verb,
+                                        rules_review, auth_client)
+            if len(error) > 0:
+                errors.append(error)
 
         if resource["kind"].lower() == "customresourcedefinition":
 
@@ -123,95 +104,187 @@ def check_self(resource_list, api_client: client,
             custom_resource["metadata"] = \
                 {"name": resource["metadata"]["name"],
                  "namespace": "kube-system"}
-            error = __check_self_access(custom_resource, action, auth_client)
-            if len(error) > 0:
-                errors.append(error)
+            for verb in verbs:
+                error = __check_self_access(custom_resource, verb,
+                                            rules_review, auth_client)
+                if len(error) > 0:
+                    errors.append(error)
 
     return errors
 
 
-def __check_self_access(resource, action, auth_client):
+def __check_self_access(resource, action, rules_review, auth_client):
 
     namespace = resource["metadata"]["namespace"] \
         if "namespace" in resource["metadata"] else ""
 
-    version, group = __get_group_and_version(resource["apiVersion"])
+    group = resource["apiVersion"].rpartition("/")[0].lower()
 
     if "plural" in resource and len(resource["plural"]) > 0:
         resource_kind = resource["plural"].lower()
     else:
-        resource_kind = f'{resource["kind"].lower()}s'
+        resource_kind = get_plural(resource, auth_client.api_client)
+
+    allowed = rules_review.is_allowed(namespace, action, group,
+                                      resource_kind,
+                                      resource["metadata"]["name"])
+    if allowed is None:
+        allowed = __review_self_access(resource_kind, group, namespace,
+                                       resource["metadata"]["name"],
+                                       action, auth_client)
+
+    if allowed:
+        logger.log_info('User has permission to %s %s %s', action,
+                        resource["kind"], resource["metadata"]["name"])
+        return []
+
+    logger.log_info('User does not have permission: verb: %s, group: %s, '
+                    'resource: %s, namespace: %s, name: %s', action, group,
+                    resource_kind, namespace, resource["metadata"]["name"])
+    return [f"User does not have permissions to {action} "
+            f'{resource["kind"]} ',
+            f'{resource["metadata"]["name"]}"',
+            "for more information use verbose output."]
+
+
+def __review_self_access(resource_kind, group, namespace, name,
+                         action, auth_client) -> bool:
 
     body = client.V1SelfSubjectAccessReview(
         spec=client.V1SelfSubjectAccessReviewSpec(
             resource_attributes=client.V1ResourceAttributes(
                 resource=resource_kind,
                 verb=action,
-                name=resource["metadata"]["name"]
+                name=name
             )
         ))
-    if group and group.lower() != "core":
-        body.spec.resource_attributes.group = group.lower()
+    if group:
+        body.spec.resource_attributes.group = group
     if namespace:
         body.spec.resource_attributes.namespace = namespace
 
-    permission_failure = False
     try:
         api_response = auth_client.create_self_subject_access_review(body)
-        if api_response.status.allowed:
-            logger.log_info(f'User has permission to {action} '
-                            f'{resource["kind"]} '
-                            f'{resource["metadata"]["name"]}')
-        else:
-            logger.log_info(f'User does not have permission: {body}')
-            permission_failure = True
-
+        return api_response.status.allowed
     except ApiException as e:
         logger.log_info("Exception when calling AuthorizationV1Api"
-                        f"->create_self_subject_access_review: {e}")
-    if permission_failure:
-        return [f"User does not have permissions to {action} "
-                f'{resource["kind"]} ',
-                f'{resource["metadata"]["name"]}"',
-                "for more information use verbose output."]
-    return []
+                        "->create_self_subject_access_review: %s", e)
+    return True
+
+
+def get_apply_tiers(resource_list, action: str = "create") -> []:
+    """
+    Group the resources into tiers which can each be applied concurrently,
+    namespaces and CRDs first, then RBAC, then service accounts and then
+    everything else. Tiers are reversed for a delete. Each entry is a
+    tuple of the resource index in resource_list and the resource.
+    """
+    tiers = [[] for _ in range(len(APPLY_TIERS) + 1)]
+    for index, resource in enumerate(resource_list):
+        tier = len(APPLY_TIERS)
+        for tier_index, kinds in enumerate(APPLY_TIERS):
+            if resource["kind"] in kinds:
+                tier = tier_index
+                break
+        tiers[tier].append((index, resource))
+
+    if action == "delete":
+        tiers.reverse()
+
+    return [tier for tier in tiers if tier]
 
 
 def apply_manifest(resource_list, client: client,
                    action: str = "create") -> []:
 
-    errors = [] if settings.dry_run == settings.DRY_RUN_CLIENT \
-        else check_self(resource_list, client, action)
+    bodies = list(resource_list)
+    actions = [action] * len(bodies)
+    skipped = set()
+    if settings.incremental and action in ["create", "apply"] and \
+            settings.dry_run != settings.DRY_RUN_CLIENT:
+        # objects already in their desired state are not sent again
+        digests = [get_hash(resource) for resource in resource_list]
+        applied = get_applied(resource_list, client)
+        skipped = {index for index, digest in applied.items()
+                   if digest == digests[index]}
+        bodies = [annotate(resource, digests[index])
+                  for index, resource in enumerate(resource_list)]
+        # a create of a changed object which exists fails, converge it and
+        # its annotation with a server side apply instead
+        for index in applied:
+            if index not in skipped:
+                actions[index] = "apply"
+        for index in sorted(skipped):
+            resource = resource_list[index]
+            logger.log_info('UNCHANGED: %s of %s %s skipped', action,
+                            resource["kind"], resource["metadata"]["name"],
+                            always=settings.dry_run_active())
+
+    errors = []
+    if settings.dry_run != settings.DRY_RUN_CLIENT:
+        with profiler.span("preflight review", resources=len(bodies)):
+            errors = check_self([body for index, body in enumerate(bodies)
+                                 if index not in skipped], client, action,
+                                [actions[index] for index in range(len(bodies))
+                                 if index not in skipped])
     if len(errors) == 0:
+        # record resources in manifest order, the order they are applied
+        # in depends on which thread gets to them first.
         for resource in resource_list:
-            resource_action = f'{action} of {resource["kind"]} ' \
-                              f'{resource["metadata"]["name"]}'
-            try:
-                resp, error = apply_resource(resource, client, action)
-                if error:
-                    logger.log_error(f'FAILED: {resource_action} '
-                                     f'failed: {error}',
-                                     not settings.dry_run_active())
-                    errors.append(error)
-                elif resp:
-                    msg = f'SUCCESS: {resource_action} was successful'
-                    logger.log_info(msg, settings.dry_run_active())
-            except ApiException as api_exception:
-                body = yaml.safe_load(api_exception.body)
-                if action == "create" and body["reason"] == "AlreadyExists":
-                    logger.log_info(f'ALREADY EXISTS: {resource_action} '
-                                    f'{body["message"]}',
-                                    settings.dry_run_active())
-                elif action == "read" and body["reason"] == "NotFound":
-                    logger.log_info(f'{resource_action}: {body["message"]}',
-                                    settings.dry_run_active())
-                elif action == "delete" and body["reason"] == "NotFound":
-                    logger.log_info(f'{resource_action}: {body["message"]}',
-                                    settings.dry_run_active())
-                else:
-                    msg = f'FAILED: {resource_action}: ' \
-                          f'Exception: {body["message"]}'
-                    logger.log_error(msg)
-                    errors.append(f'{settings.dry_run}{msg}')
+            settings.add_resource(resource)
+        if settings.dry_run == settings.DRY_RUN_CLIENT:
+            return errors
+
+        get_dynamic_client(client).resources.prepare(bodies)
+        results = {}
+        with ThreadPoolExecutor(max_workers=APPLY_WORKERS) as executor:
+            for tier in get_apply_tiers(bodies, action):
+                futures = {index: executor.submit(__apply_manifest_resource,
+                                                  resource, client,
+                                                  actions[index])
+                           for index, resource in tier
+                           if index not in skipped}
+                for index, future in futures.items():
+                    results[index] = future.result()
+
+        for index in sorted(results):
+            if results[index]:
+                errors.append(results[index])
 
     return errors
+
+
+def __apply_manifest_resource(resource, client: client,
+                              action: str = "create") -> str | None:
+
+    resource_action = f'{action} of {resource["kind"]} ' \
+                      f'{resource["metadata"]["name"]}'
+    try:
+        with profiler.span("apply", action=action, kind=resource["kind"],
+                           name=resource["metadata"]["name"]):
+            resp, error = apply_resource(resource, client, action, False)
+        if error:
+            logger.log_error('FAILED: %s failed: %s', resource_action, error,
+                             always=not settings.dry_run_active())
+            return error
+        elif resp:
+            logger.log_info('SUCCESS: %s was successful', resource_action,
+                            always=settings.dry_run_active())
+    except ApiException as api_exception:
+        body = yamlio.safe_load(api_exception.body)
+        if action == "create" and body["reason"] == "AlreadyExists":
+            logger.log_info('ALREADY EXISTS: %s %s', resource_action,
+                            body["message"], always=settings.dry_run_active())
+        elif action == "read" and body["reason"] == "NotFound":
+            logger.log_info('%s: %s', resource_action, body["message"],
+                            always=settings.dry_run_active())
+        elif action == "delete" and body["reason"] == "NotFound":
+            logger.log_info('%s: %s', resource_action, body["message"],
+                            always=settings.dry_run_active())
+        else:
+            msg = f'FAILED: {resource_action}: ' \
+                  f'Exception: {body["message"]}'
+            logger.log_error(msg)
+            return f'{settings.dry_run}{msg}'
+
+    return None
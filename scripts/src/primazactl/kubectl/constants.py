@@ -5,7 +5,23 @@ WORKER_CONFIG: str = "crds_config"
 APP_AGENT_CONFIG: str = "application_namespace_config"
 SVC_AGENT_CONFIG: str = "service_namespace_config"
 REPOSITORY: str = "primaza/primaza"
+# namespace the release manifests install into
+MANIFEST_NAMESPACE: str = "primaza-system"
+# annotation holding the sha256 of the state an object was last applied with
+APPLIED_HASH_ANNOTATION: str = "primaza.io/applied-hash"
 TEST_REPOSITORY_OVERRIDE: str = "primaza-test-only-repository-override"
+GITHUB_API_URL: str = "https://api.github.com"
+# seconds a cached latest or nightly manifest is used without revalidation
+MANIFEST_CACHE_TTL: int = 300
+
+# maximum number of resources of a manifest applied at the same time
+APPLY_WORKERS: int = 8
+# kinds applied before the rest of a manifest, in order
+APPLY_TIERS: [] = [
+    ["Namespace", "CustomResourceDefinition"],
+    ["Role", "ClusterRole", "RoleBinding", "ClusterRoleBinding"],
+    ["ServiceAccount"],
+]
 
 
 def get_repository():
@@ -0,0 +1,69 @@
+import hashlib
+import json
+from kubernetes import client
+from kubernetes.client.rest import ApiException
+from primazactl.utils import logger
+from primazactl.kube.snapshot import list_metadata
+from .constants import APPLIED_HASH_ANNOTATION
+
+
+def get_hash(resource: {}) -> str:
+    """
+    Returns the sha256 of the desired state of resource, ignoring the
+    annotation recording it.
+    """
+    metadata = dict(resource["metadata"])
+    annotations = dict(metadata.get("annotations") or {})
+    annotations.pop(APPLIED_HASH_ANNOTATION, None)
+    metadata["annotations"] = annotations
+    content = dict(resource, metadata=metadata)
+    return hashlib.sha256(json.dumps(content, sort_keys=True,
+                                     separators=(",", ":"),
+                                     default=str).encode("utf-8")).hexdigest()
+
+
+def annotate(resource: {}, digest: str) -> {}:
+    """
+    Returns a copy of resource, sharing its content, annotated with digest.
+    """
+    metadata = dict(resource["metadata"])
+    metadata["annotations"] = dict(metadata.get("annotations") or {})
+    metadata["annotations"][APPLIED_HASH_ANNOTATION] = digest
+    return dict(resource, metadata=metadata)
+
+
+def get_applied(resource_list: [], api_client: client) -> {}:
+    """
+    Returns the annotation of the desired state each resource which exists
+    was applied with, None when it has none, by the index of the resource.
+    They are found with one list per kind and namespace, resources of kinds
+    which cannot be listed are treated as missing.
+    """
+    groups = {}
+    for index, resource in enumerate(resource_list):
+        key = (resource["apiVersion"], resource["kind"],
+               resource["metadata"].get("namespace"))
+        groups.setdefault(key, []).append(index)
+
+    applied = {}
+    for (api_version, kind, namespace), indexes in groups.items():
+        existing = __list_applied(api_client, api_version, kind, namespace)
+        for index in indexes:
+            name = resource_list[index]["metadata"]["name"]
+            if name in existing:
+                applied[index] = existing[name]
+    return applied
+
+
+def __list_applied(api_client, api_version: str, kind: str,
+                   namespace: str) -> {}:
+    # name to applied hash annotation of the objects of a kind
+    try:
+        items = list_metadata(api_client, api_version, kind, namespace)
+    except ApiException as e:
+        logger.log_info("list of %s failed, apply all: %s", kind, e.reason)
+        return {}
+
+    return {metadata["name"]:
+            (metadata.get("annotations") or {}).get(APPLIED_HASH_ANNOTATION)
+            for metadata in items}
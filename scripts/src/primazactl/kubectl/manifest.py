@@ -1,12 +1,22 @@
 import os
-import yaml
+import threading
+from primazactl.utils import yamlio
 from kubernetes import client
-from primazactl.utils import logger, settings
-from github import Auth, Github
+from primazactl.utils import logger, profiler, settings
 import semver
 import requests
-from.constants import get_repository
-from.apply import apply_manifest
+from .constants import get_repository, GITHUB_API_URL, MANIFEST_CACHE_TTL
+from .apply import apply_manifest
+from .manifestcache import ManifestCache
+from .rewrite import clone
+
+# documents of the manifests read by the command, keyed by manifest key.
+# Each manifest is fetched and parsed once, e.g. for all the tenants of an
+# options file or all the namespaces of a cluster environment, and cloned
+# for each namespace it is applied to.
+manifests = {}
+manifests_lock = threading.Lock()
+manifest_locks = {}
 
 
 class Manifest(object):
@@ -18,65 +28,64 @@ class Manifest(object):
 
     def __init__(self, namespace: str, path: str,
                  version: str = None, type: str = None):
-        logger.log_entry(f"namespace: {namespace}, path: {path}, "
-                         f"version: {version}, type: {type}")
+        logger.log_entry("namespace: %s, path: %s, version: %s, type: %s",
+                         namespace, path, version, type)
         self.path = path
         self.namespace = namespace
         if version:
             self.version = version[1:] if version.startswith("v") else version
         self.type = type
 
-    def replace_ns(self, body):
-        d = yaml.dump({"body": body})  # type: str
-        r = d.replace("primaza-system", self.namespace)
-        return yaml.safe_load(r)["body"]
-
-    def update_namespace(self, body):
-        logger.log_entry(f"namespace: {self.namespace}")
-        for resource in body:
-            logger.log_info(f'resource: {resource["kind"]}')
-            if resource["kind"] == "Certificate":
-                names = resource["spec"]["dnsNames"]
-                new_names = []
-                for name in names:
-                    nn = name.split(".")
-                    nn[1] = self.namespace
-                    new_names.append(".".join(nn))
-                resource["spec"]["dnsNames"] = new_names
-                update_dict(resource, "namespace", self.namespace)
-            elif resource["kind"] == "ValidatingWebhookConfiguration":
-                # FIXME: find a smarter way
-                nr = self.replace_ns(resource)
-                resource["metadata"] = nr["metadata"]
-                resource["webhooks"] = nr["webhooks"]
-            elif resource["kind"] == "Namespace":
-                update_dict(resource, "name", self.namespace)
-            else:
-                update_dict(resource, "namespace", self.namespace)
+    def get_manifest_key(self):
+        """
+        Identifies the manifest content: the file and its modification time
+        or the repository, version and type of the release.
+        """
+        if self.path:
+            stat = os.stat(self.path)
+            return (os.path.abspath(self.path), stat.st_mtime_ns,
+                    stat.st_size)
+        return (get_repository(), self.version, self.type)
 
     def load_manifest(self):
-        logger.log_entry(f"path: {self.path}, version: {self.version}, "
-                         f"type: {self.type}")
+        logger.log_entry("path: %s, version: %s, type: %s", self.path,
+                         self.version, self.type)
         if self.path:
-            return yaml.safe_load_all(open(self.path, 'r'))
+            return yamlio.safe_load_all(open(self.path, 'r'))
         else:
             manifest = self.__set_config_content()
-            return yaml.safe_load_all(manifest)
+            return yamlio.safe_load_all(manifest)
+
+    def get_body(self) -> []:
+        """
+        Returns the documents of the manifest moved to the namespace. The
+        manifest is read and parsed once per command, the documents share
+        the content the namespace does not change with the parsed manifest
+        and must not be modified in place.
+        """
+        key = self.get_manifest_key()
+        with manifests_lock:
+            lock = manifest_locks.setdefault(key, threading.Lock())
+
+        with lock:
+            if key not in manifests:
+                with profiler.span("manifest fetch", type=self.type,
+                                   path=self.path, version=self.version):
+                    if self.path:
+                        with open(self.path, 'r') as manifest:
+                            content = manifest.read()
+                    else:
+                        content = self.__set_config_content()
+                with profiler.span("yaml parse", type=self.type):
+                    manifests[key] = list(yamlio.safe_load_all(content))
+        with profiler.span("namespace rewrite", type=self.type,
+                           namespace=self.namespace):
+            return clone(key, manifests[key], self.namespace)
 
     def apply(self, api_client: client, action: str = "create"):
-        logger.log_entry(f"action: {action}")
+        logger.log_entry("action: %s", action)
 
-        if self.path:
-            with open(self.path, 'r') as manifest:
-                self.__apply(manifest, api_client, action)
-        else:
-            self.__apply(self.__set_config_content(), api_client, action)
-
-    def __apply(self, manifest, api_client, action):
-
-        body = yaml.safe_load_all(manifest)
-        body_list = list(body)
-        self.update_namespace(body_list)
+        body_list = self.get_body()
 
         errors = apply_manifest(body_list, api_client, action)
         if len(errors) > 0:
@@ -85,11 +94,15 @@ class Manifest(object):
             for error in errors:
                 msg += f"\n{error}"
 
-            logger.log_error(msg, not settings.dry_run_active())
+            logger.log_error(msg, always=not settings.dry_run_active())
             if not settings.dry_run_active():
                 raise RuntimeError(msg)
 
-    def build_github_client(self) -> Github:
+    def build_github_client(self):
+        # PyGithub is only needed to look up released versions which are
+        # not cached, do not load it for every command
+        from github import Auth, Github
+
         token = os.getenv("GITHUB_TOKEN", None)
         if not token:
             return Github()
@@ -100,6 +113,17 @@ class Manifest(object):
     def __set_config_content(self):
         logger.log_entry()
 
+        if self.version == "latest" or self.version == "nightly":
+            return self.__get_rolling_config_content(self.version)
+
+        # released versions do not change, use a cached copy if there is one
+        cache = ManifestCache()
+        for tag in [f"v{self.version}", self.version]:
+            content, _ = cache.get(get_repository(),
+                                   tag, f"{self.type}_{tag}.yaml")
+            if content:
+                return content
+
         g = self.build_github_client()
         repo = g.get_repo(get_repository())
 
@@ -108,8 +132,8 @@ class Manifest(object):
         latest_version = None
 
         for release in releases:
-            logger.log_info(f"release found - name: {release.id}")
-            logger.log_info(f"                tag: {release.tag_name}")
+            logger.log_info("release found - name: %s", release.id)
+            logger.log_info("                tag: %s", release.tag_name)
 
             if self.version == "latest" and release.tag_name == "latest":
                 return self.__get_config_content(release)
@@ -122,18 +146,18 @@ class Manifest(object):
                 if semver.VersionInfo.isvalid(version):
                     if self.version and \
                             semver.compare(self.version, version) == 0:
-                        logger.log_info(f"match found: {release.tag_name}")
+                        logger.log_info("match found: %s", release.tag_name)
                         return self.__get_config_content(release)
                     elif not latest_version or \
                             semver.compare(version,
                                            latest_version) > 1:
-                        logger.log_info(f"later match found: "
-                                        f"{release.tag_name}")
+                        logger.log_info("later match found: %s",
+                                        release.tag_name)
                         latest_version = version
                         latest_release = release
                 else:
-                    logger.log_info(f"Ignore release tag {release.tag_name} "
-                                    f"- it is not a valid semver")
+                    logger.log_info("Ignore release tag %s - it is not a "
+                                    "valid semver", release.tag_name)
 
         if latest_release:
             return self.__get_config_content(latest_release)
@@ -142,36 +166,77 @@ class Manifest(object):
                            f"{get_repository()} for version {self.version}")
 
     def __get_config_content(self, release):
-        logger.log_entry(f"release = {release.tag_name}")
+        logger.log_entry("release = %s", release.tag_name)
         asset_name = f"{self.type}_{release.tag_name}.yaml"
-        logger.log_info(f"Look for file : {asset_name}")
+        logger.log_info("Look for file : %s", asset_name)
         for asset in release.get_assets():
-            logger.log_info(f"asset found : {asset.name}")
+            logger.log_info("asset found : %s", asset.name)
 
             if asset.name == asset_name:
                 logger.log_info("found required asset!")
                 response = requests.get(asset.browser_download_url)
-                return response.text.encode("utf-8")
+                content = response.text.encode("utf-8")
+                if response.ok:
+                    ManifestCache().put(get_repository(), release.tag_name,
+                                        asset_name, content)
+                return content
 
         raise RuntimeError(f"Failed to get release asset {asset_name} "
                            f"from {get_repository()} "
                            f"for version {self.version}")
 
+    def __get_rolling_config_content(self, tag):
+        """
+        Get the manifest of a release which is updated in place, latest or
+        nightly. A cached copy is used while it is younger than
+        MANIFEST_CACHE_TTL, after that it is revalidated against the ETag
+        of the release and only downloaded again if the release changed.
+        """
+        logger.log_entry("tag = %s", tag)
+        repository = get_repository()
+        asset_name = f"{self.type}_{tag}.yaml"
+        cache = ManifestCache()
+        content, entry = cache.get(repository, tag, asset_name)
+        if content and cache.is_fresh(entry, MANIFEST_CACHE_TTL):
+            return content
+
+        headers = {"Accept": "application/vnd.github+json"}
+        token = os.getenv("GITHUB_TOKEN", None)
+        if token:
+            headers["Authorization"] = f"Bearer {token}"
+        if content and entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+
+        try:
+            response = requests.get(f"{GITHUB_API_URL}/repos/{repository}"
+                                    f"/releases/tags/{tag}",
+                                    headers=headers)
+            if response.status_code == 304:
+                logger.log_info("release %s unchanged, use cached copy", tag)
+                cache.touch(repository, tag, asset_name, entry)
+                return content
+            if response.status_code == 404:
+                raise RuntimeError(f"A release was not found in repository "
+                                   f"{repository} for version {self.version}")
+            response.raise_for_status()
+
+            for asset in response.json()["assets"]:
+                logger.log_info("asset found : %s", asset['name'])
+                if asset["name"] == asset_name:
+                    logger.log_info("found required asset!")
+                    download = requests.get(asset["browser_download_url"])
+                    download.raise_for_status()
+                    content = download.text.encode("utf-8")
+                    cache.put(repository, tag, asset_name, content,
+                              response.headers.get("ETag"))
+                    return content
+        except requests.RequestException as e:
+            if content:
+                logger.log_warning("Failed to check release %s of %s, using "
+                                   "cached copy: %s", tag, repository, e)
+                return content
+            raise e
 
-def update_list(items: [], key: str, new_value: str):
-    for item in items:
-        if not isinstance(item, str):
-            if isinstance(item, dict):
-                update_dict(item, key, new_value)
-            elif isinstance(item, list):
-                update_list(item, key, new_value)
-
-
-def update_dict(body: {}, key: str, new_value: str):
-    for entry in body:
-        if isinstance(body[entry], dict):
-            update_dict(body[entry], key, new_value)
-        elif isinstance(body[entry], list):
-            update_list(body[entry], key, new_value)
-        elif entry == key:
-            body[entry] = new_value
+        raise RuntimeError(f"Failed to get release asset {asset_name} "
+                           f"from {repository} "
+                           f"for version {self.version}")
@@ -0,0 +1,97 @@
+import hashlib
+import json
+import os
+import time
+from primazactl.utils import logger
+from primazactl.utils.cache import get_cache_dir, write_atomic
+
+
+class ManifestCache(object):
+    """
+    On disk cache of release manifests. Content is stored once per sha256
+    digest under blobs/ and an index entry per repository, tag and asset
+    name records the digest, the ETag of the release and when it was
+    fetched.
+    """
+
+    directory: str = None
+
+    def __init__(self, directory: str = None):
+        self.directory = directory if directory \
+            else get_cache_dir("manifests")
+
+    def get(self, repository: str, tag: str, asset: str):
+        """
+        Returns the cached content and its index entry, or None, None if
+        the asset is not cached or the cached content is corrupt.
+        """
+        entry = self.__read_entry(repository, tag, asset)
+        if not entry:
+            return None, None
+
+        try:
+            with open(self.__blob_path(entry["sha256"]), "rb") as blob:
+                content = blob.read()
+        except OSError:
+            return None, None
+
+        if hashlib.sha256(content).hexdigest() != entry["sha256"]:
+            logger.log_warning("Ignore cached manifest %s for %s %s: "
+                               "integrity check failed", asset, repository,
+                               tag)
+            return None, None
+
+        logger.log_info("Cached manifest found: %s %s %s", repository, tag,
+                        asset)
+        return content, entry
+
+    def put(self, repository: str, tag: str, asset: str, content: bytes,
+            etag: str = None):
+        digest = hashlib.sha256(content).hexdigest()
+        try:
+            blob_path = self.__blob_path(digest)
+            if not os.path.exists(blob_path):
+                os.makedirs(os.path.dirname(blob_path), exist_ok=True)
+                write_atomic(blob_path, content)
+            self.__write_entry(repository, tag, asset,
+                               {"sha256": digest,
+                                "etag": etag,
+                                "fetched": time.time()})
+        except OSError as e:
+            logger.log_warning("Failed to cache manifest %s: %s", asset, e)
+
+    def touch(self, repository: str, tag: str, asset: str, entry: {}):
+        entry = dict(entry)
+        entry["fetched"] = time.time()
+        try:
+            self.__write_entry(repository, tag, asset, entry)
+        except OSError as e:
+            logger.log_warning("Failed to cache manifest %s: %s", asset, e)
+
+    @staticmethod
+    def is_fresh(entry: {}, ttl: int) -> bool:
+        return time.time() - entry.get("fetched", 0) < ttl
+
+    def __blob_path(self, digest: str) -> str:
+        return os.path.join(self.directory, "blobs", digest[:2], digest)
+
+    def __entry_path(self, repository: str, tag: str, asset: str) -> str:
+        key = hashlib.sha256(f"{repository}\n{tag}\n{asset}"
+                             .encode("utf-8")).hexdigest()
+        return os.path.join(self.directory, "index", f"{key}.json")
+
+    def __read_entry(self, repository: str, tag: str, asset: str):
+        try:
+            with open(self.__entry_path(repository, tag, asset), "r") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if not isinstance(entry, dict) or "sha256" not in entry:
+            return None
+        return entry
+
+    def __write_entry(self, repository: str, tag: str, asset: str,
+                      entry: {}):
+        path = self.__entry_path(repository, tag, asset)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        write_atomic(path, json.dumps(entry).encode("utf-8"))
@@ -0,0 +1,180 @@
+import threading
+from primazactl.utils import logger
+from .constants import MANIFEST_NAMESPACE
+
+# rewrite plan operations, each applied to the value at a path of keys
+# and list indexes in a resource:
+# - SET: replace the value with the namespace
+# - DNS: replace the second label of each dns name in the list
+# - REPLACE: replace MANIFEST_NAMESPACE in the string with the namespace
+# - KEY: replace MANIFEST_NAMESPACE in the keys of the dictionary
+SET = "set"
+DNS = "dns"
+REPLACE = "replace"
+KEY = "key"
+
+plans = {}
+plans_lock = threading.Lock()
+
+
+def compile_plan(resource: {}) -> []:
+    """
+    Returns the operations which move a resource of a manifest to another
+    namespace. The plan depends on the shape of the resource, not on the
+    namespace, so it can be reused for every namespace.
+    """
+    kind = resource["kind"]
+    if kind == "Certificate":
+        plan = []
+        if "dnsNames" in (resource.get("spec") or {}):
+            plan.append((DNS, ("spec", "dnsNames")))
+        return plan + __find_keys(resource, "namespace")
+    elif kind == "ValidatingWebhookConfiguration":
+        return __find_strings(resource, ["metadata", "webhooks"])
+    elif kind == "Namespace":
+        return __find_keys(resource, "name")
+    else:
+        return __find_keys(resource, "namespace")
+
+
+def get_plan(manifest_key, index: int, resource: {}) -> []:
+    """
+    Returns the plan of the resource at index in the manifest identified
+    by manifest_key, compiling it the first time the resource is seen.
+    """
+    key = (manifest_key, index)
+    identity = (resource.get("kind"),
+                (resource.get("metadata") or {}).get("name"))
+    with plans_lock:
+        cached = plans.get(key)
+    if cached and cached[0] == identity:
+        return cached[1]
+
+    plan = compile_plan(resource)
+    with plans_lock:
+        plans[key] = (identity, plan)
+    return plan
+
+
+def clone_plan(resource: {}, plan: [], namespace: str) -> {}:
+    """
+    Returns a copy of the resource with the plan applied. Only the
+    dictionaries and lists on the paths of the plan are copied, the rest of
+    the copy is shared with the resource. Returns None if the resource does
+    not have the shape the plan was compiled for.
+    """
+    copies = {(): dict(resource)}
+    for operation, path in plan:
+        parent = __copy_path(copies, path[:-1])
+        try:
+            value = parent[path[-1]]
+        except (KeyError, IndexError, TypeError):
+            return None
+
+        if operation == SET:
+            parent[path[-1]] = namespace
+        elif operation == DNS:
+            new_names = []
+            for name in value:
+                labels = name.split(".")
+                labels[1] = namespace
+                new_names.append(".".join(labels))
+            parent[path[-1]] = new_names
+        elif operation == REPLACE:
+            parent[path[-1]] = value.replace(MANIFEST_NAMESPACE, namespace)
+        elif operation == KEY:
+            renamed = {
+                key.replace(MANIFEST_NAMESPACE, namespace)
+                if isinstance(key, str) else key: item
+                for key, item in value.items()}
+            parent[path[-1]] = renamed
+            copies[path] = renamed
+    return copies[()]
+
+
+def clone(manifest_key, resources: [], namespace: str) -> []:
+    """
+    Returns copies of the resources of a manifest moved to namespace,
+    sharing their unchanged content with the resources, which are left as
+    they are. The copies must not be modified in place.
+    """
+    clones = []
+    for index, resource in enumerate(resources):
+        plan = get_plan(manifest_key, index, resource)
+        copy = clone_plan(resource, plan, namespace)
+        if copy is None:
+            # plan was compiled for a resource of another shape
+            plan = __recompile(manifest_key, index, resource)
+            copy = clone_plan(resource, plan, namespace)
+        clones.append(copy)
+    return clones
+
+
+def __recompile(manifest_key, index: int, resource: {}) -> []:
+    logger.log_info('recompile plan for %s %s', resource["kind"],
+                    resource["metadata"]["name"])
+    with plans_lock:
+        plans.pop((manifest_key, index), None)
+    return get_plan(manifest_key, index, resource)
+
+
+def __copy_path(copies: {}, path: tuple):
+    # the container at path in the copy, copying the containers along the
+    # path the first time they are written to. Returns None if the path
+    # does not exist.
+    if path in copies:
+        return copies[path]
+    parent = __copy_path(copies, path[:-1])
+    try:
+        value = parent[path[-1]]
+    except (KeyError, IndexError, TypeError):
+        return None
+    if isinstance(value, dict):
+        value = dict(value)
+    elif isinstance(value, list):
+        value = list(value)
+    else:
+        return None
+    parent[path[-1]] = value
+    copies[path] = value
+    return value
+
+
+def __find_keys(resource: {}, key: str) -> []:
+    # paths of every scalar value stored under key, at any depth
+    plan = []
+    stack = [((), resource)]
+    while stack:
+        path, node = stack.pop()
+        items = node.items() if isinstance(node, dict) else enumerate(node)
+        for entry, value in items:
+            if isinstance(value, (dict, list)):
+                stack.append((path + (entry,), value))
+            elif entry == key and isinstance(node, dict):
+                plan.append((SET, path + (entry,)))
+    return plan
+
+
+def __find_strings(resource: {}, fields: []) -> []:
+    # paths of every string, or dictionary key, containing the manifest
+    # namespace under the given top level fields. Keys are renamed last,
+    # deepest first, so the paths of the other operations stay valid.
+    values = []
+    keys = []
+    stack = [((field,), resource[field])
+             for field in fields if field in resource]
+    while stack:
+        path, node = stack.pop()
+        if isinstance(node, dict):
+            if any(isinstance(entry, str) and MANIFEST_NAMESPACE in entry
+                   for entry in node):
+                keys.append((KEY, path))
+            for entry, value in node.items():
+                stack.append((path + (entry,), value))
+        elif isinstance(node, list):
+            for index, value in enumerate(node):
+                stack.append((path + (index,), value))
+        elif isinstance(node, str) and MANIFEST_NAMESPACE in node:
+            values.append((REPLACE, path))
+    keys.sort(key=lambda operation: len(operation[1]), reverse=True)
+    return values + keys
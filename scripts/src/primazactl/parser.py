@@ -3,6 +3,8 @@ import sys
 from primazactl.cmd.create.parser import add_group as create_add_group
 from primazactl.cmd.join.parser import add_group as join_add_group
 from primazactl.cmd.apply.parser import add_group as apply_add_group
+from primazactl.utils import logger
+from primazactl.utils import profiler
 from primazactl.version import __version__
 
 
@@ -32,6 +34,32 @@ def build_parser() -> argparse.ArgumentParser:
         action="count",
         help="Set for verbose output")
 
+    base_subparser.add_argument(
+        "--log-format",
+        dest="log_format",
+        required=False,
+        choices=logger.LOG_FORMATS,
+        default=logger.LOG_FORMAT_TEXT,
+        help="Format of the log lines, json writes a JSON object per line "
+             f"(default: {logger.LOG_FORMAT_TEXT}).")
+
+    base_subparser.add_argument(
+        "--profile",
+        dest="profile",
+        required=False,
+        choices=profiler.PROFILE_CHOICES,
+        help="Report the time taken by each phase of the command and by "
+             "the API calls, grouped by verb and resource, as a table or "
+             "as Chrome trace event JSON to open in Perfetto.")
+
+    base_subparser.add_argument(
+        "--profile-file",
+        dest="profile_file",
+        required=False,
+        type=str,
+        help="file to write the --profile report to, default: standard "
+             "error.")
+
     subparsers = parser.add_subparsers()
     create_add_group(subparsers, parents=[base_subparser])
 
@@ -9,6 +9,7 @@ from primazactl.kube.access.accessreview import AccessReview
 from primazactl.utils import kubeconfig
 from primazactl.utils.kubeconfigwrapper import KubeConfigWrapper
 from primazactl.utils import names
+from primazactl.utils import profiler
 from primazactl.utils import settings
 
 
@@ -54,7 +55,7 @@ class PrimazaCluster(object):
         self.kubeconfig = kcw.get_kube_config_for_cluster()
 
     def get_kubeconfig(self, identity: KubeIdentity) -> Dict:
-        logger.log_entry(f"id: {identity.sa_name}")
+        logger.log_entry("id: %s", identity.sa_name)
 
         return identity.get_kubeconfig(self.kubeconfig, self.internal_url)
 
@@ -82,8 +83,8 @@ class PrimazaCluster(object):
             if secret_name \
             else names.get_kube_secret_name(user_type)
 
-        logger.log_entry(f"user_type: {user_type}, "
-                         f"namespace: {self.namespace}")
+        logger.log_entry("user_type: %s, namespace: %s", user_type,
+                         self.namespace)
         api_client = self.kubeconfig.get_api_client()
         secret = Secret(api_client, secret_name,
                         self.namespace, kubeconfig, tenant)
@@ -123,16 +124,13 @@ class PrimazaCluster(object):
                           role_namespace)
         role = Role(api_client,
                     role_name, role_namespace, None)
-        rules = role.get_rules()
-        error_messages = []
-        for rule in rules:
-            error_message = ar.check_access(rule)
-            if error_message:
-                error_messages.extend(error_message)
-        return error_messages
+        with profiler.span("access review", role=role_name,
+                           namespace=role_namespace):
+            return ar.check_rules(role.get_rules() or [])
 
     def install_config(self, manifest):
-        manifest.apply(self.kubeconfig.get_api_client(), "create")
+        action = "apply" if settings.server_side else "create"
+        manifest.apply(self.kubeconfig.get_api_client(), action)
 
     def uninstall_config(self, manifest):
         manifest.apply(self.kubeconfig.get_api_client(), "delete")
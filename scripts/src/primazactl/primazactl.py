@@ -3,6 +3,7 @@ import sys
 from primazactl import parser
 from primazactl.errors import ValidationError
 from primazactl.utils import logger
+from primazactl.utils import profiler
 
 
 def main():
@@ -13,12 +14,19 @@ def main():
 
         if hasattr(args, "verbose"):
             logger.set_verbose(args.verbose)
+        if hasattr(args, "log_format"):
+            logger.set_format(args.log_format)
 
         if not hasattr(args, "func"):
             p.print_help()
             return
 
-        args.func(args)
+        if getattr(args, "profile", None):
+            profiler.enable(args.profile, args.profile_file)
+        try:
+            args.func(args)
+        finally:
+            profiler.report()
         sys.exit(0)
 
     except (argparse.ArgumentError, ValidationError) as err:
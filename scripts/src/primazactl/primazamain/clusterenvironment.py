@@ -1,8 +1,14 @@
+import threading
 from primazactl.utils import logger
 from primazactl.cmd.create.namespace.constants import APPLICATION
 from primazactl.kube.customnamespaced import CustomNamespaced
 from primazactl.utils import settings
 
+# locks of the namespace lists of each cluster environment, keyed by the
+# cluster, tenant and name of the cluster environment.
+namespaces_locks = {}
+namespaces_lock = threading.Lock()
+
 
 def create_body(name, namespace, environment, secret_name):
     if name and environment and secret_name:
@@ -44,30 +50,37 @@ class ClusterEnvironment(CustomNamespaced):
                                      environment, secret_name))
 
     def add_namespace(self, type, name):
-        logger.log_entry(f"type: {type}, name: {name}")
-        if not self.body:
+        logger.log_entry("type: %s, name: %s", type, name)
+        # agents of a cluster environment may be created concurrently,
+        # serialize the read, update and patch of its namespace lists.
+        key = (self.custom.api_client.configuration.host, self.namespace,
+               self.name)
+        with namespaces_lock:
+            lock = namespaces_locks.setdefault(key, threading.Lock())
+
+        with lock:
             self.body = self.read()
             if not self.body:
                 msg = f"Cluster environment {self.name} not found."
                 logger.log_error(msg)
                 raise RuntimeError(msg)
 
-        if type == APPLICATION:
-            entry = "applicationNamespaces"
-        else:
-            entry = "serviceNamespaces"
+            if type == APPLICATION:
+                entry = "applicationNamespaces"
+            else:
+                entry = "serviceNamespaces"
 
-        if entry in self.body["spec"]:
-            values = self.body["spec"][entry]
-            if name not in values:
-                values.append(name)
-                self.body["spec"][entry] = values
-        else:
-            self.body["spec"][entry] = [name]
+            if entry in self.body["spec"]:
+                values = self.body["spec"][entry]
+                if name not in values:
+                    values.append(name)
+                    self.body["spec"][entry] = values
+            else:
+                self.body["spec"][entry] = [name]
 
-        logger.log_info(f'patch new spec: {self.body["spec"]}')
+            logger.log_info('patch new spec: %s', self.body["spec"])
 
-        self.patch(self.body)
+            self.patch(self.body)
 
     def check(self, state, ctype, cstatus):
         if not settings.dry_run_active():
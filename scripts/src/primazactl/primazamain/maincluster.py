@@ -47,11 +47,7 @@ class MainCluster(PrimazaCluster):
         self.manifest = Manifest(namespace, config_file,
                                  version, PRIMAZA_CONFIG)
 
-        kcw = KubeConfigWrapper(context, self.kube_config_file)
-        self.kubeconfig = kcw.get_kube_config_for_cluster()
-
-        logger.log_info("Primaza main created for cluster "
-                        f"{self.context}")
+        logger.log_info("Primaza main created for cluster %s", self.context)
 
     def install_primaza(self):
         self.install_config(self.manifest)
@@ -59,10 +55,10 @@ class MainCluster(PrimazaCluster):
     def create_primaza_identity(self, cluster_environment: str,
                                 user_type: str = None,
                                 namespace: str = None) -> KubeIdentity:
-        logger.log_entry(f"type: cluster environment: {cluster_environment}")
+        logger.log_entry("type: cluster environment: %s", cluster_environment)
         if not namespace:
             namespace = self.namespace
-        logger.log_info(f"User: {user_type}, namespace: {namespace}")
+        logger.log_info("User: %s, namespace: %s", user_type, namespace)
         sa_name, key_name = names.get_identity_names(cluster_environment,
                                                      namespace,
                                                      user_type)
@@ -74,10 +70,10 @@ class MainCluster(PrimazaCluster):
                                    environment_name,
                                    secret_name) -> ClusterEnvironment:
 
-        logger.log_entry("kind: ClusterEnvironment, "
-                         f"name: {cluster_environment_name}, "
-                         f"environment_name: {environment_name} "
-                         f"secret_name: {secret_name}")
+        logger.log_entry("kind: ClusterEnvironment, name: %s, "
+                         "environment_name: %s secret_name: %s",
+                         cluster_environment_name, environment_name,
+                         secret_name)
 
         ce = ClusterEnvironment(self.kubeconfig.get_api_client(),
                                 self.namespace,
@@ -105,7 +101,7 @@ class MainCluster(PrimazaCluster):
 
         pod = Pod(self.kubeconfig.get_api_client(), self.namespace)
         pod_name = pod.get_primaza_pod_name()
-        logger.log_info(f"Pod name {pod_name}")
+        logger.log_info("Pod name %s", pod_name)
         if pod_name:
             return pod.wait_for_running()
         return "Tenant pod not found."
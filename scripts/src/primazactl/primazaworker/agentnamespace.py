@@ -1,3 +1,4 @@
+from primazactl.utils import engine
 from primazactl.utils import logger
 from primazactl.utils import names
 from primazactl.utils import settings
@@ -65,28 +66,27 @@ class AgentNamespace(PrimazaCluster):
         self.kube_namespace = Namespace(api_client, namespace)
 
     def create(self):
-        logger.log_entry(f"namespace type: {self.type}, "
-                         f"cluster environment: {self.cluster_environment}, "
-                         f"worker cluster: {self.worker.context}")
+        engine.run(self.create_async())
+
+    async def create_async(self):
+        logger.log_entry("namespace type: %s, cluster environment: %s, worker "
+                         "cluster: %s", self.type, self.cluster_environment,
+                         self.worker.context)
 
         # On worker cluster
         # - create the namespace and resources from manifest
-        self.install_config(self.manifest)
-
-        # Request a new service account from primaza main
-        main_identity = self.main.create_primaza_identity(
-            self.cluster_environment,
-            self.user_type,
-            self.namespace)
-
-        # Get kubeconfig with secret from service accounf
-        kc = self.main.get_kubeconfig(main_identity)
+        # Meanwhile request a new service account from primaza main and
+        # get kubeconfig with secret from service account
+        _, kc = await engine.gather(
+            engine.call(self.install_config, self.manifest),
+            self.__get_main_kubeconfig())
 
         # - in the created namespace, create the Secret
         #     'primaza-auth-$CLUSTER_ENVIRONMENT' the Worker key
         #     and the kubeconfig for authenticating with the Primaza cluster.
 
-        self.create_namespaced_kubeconfig_secret(kc, self.main.namespace)
+        await engine.call(self.create_namespaced_kubeconfig_secret,
+                          kc, self.main.namespace)
 
         # - In the created namespace, create a Role (named
         #   primaza-application or primaza-service), that will grant
@@ -98,7 +98,6 @@ class AgentNamespace(PrimazaCluster):
                                                     self.namespace)
         primaza_role = Role(api_client, primaza_policy.metadata.name,
                             self.namespace, primaza_policy)
-        primaza_role.create()
 
         # - In the created namespace, RoleBinding for binding the user primaza
         #   to the role defined above
@@ -111,74 +110,73 @@ class AgentNamespace(PrimazaCluster):
                                       primaza_role.name,
                                       self.worker.namespace,
                                       sa_name)
-        primaza_binding.create()
+        await engine.gather(engine.call(primaza_role.create),
+                            engine.call(primaza_binding.create))
 
         if not settings.dry_run_active():
-            ce = self.main.get_cluster_environment(self.cluster_environment)
-            ce.add_namespace(self.type, self.namespace)
-            logger.log_info(f"ce:{ce.body}")
+            ce = await engine.call(self.main.get_cluster_environment,
+                                   self.cluster_environment)
+            await engine.call(ce.add_namespace, self.type, self.namespace)
+            logger.log_info("ce:%s", ce.body)
+
+    async def __get_main_kubeconfig(self):
+        main_identity = await engine.call(self.main.create_primaza_identity,
+                                          self.cluster_environment,
+                                          self.user_type,
+                                          self.namespace)
+        return await engine.call(self.main.get_kubeconfig, main_identity)
 
     def check(self):
-        logger.log_entry(f"Cluster: {self.context}, "
-                         f"Namespace {self.namespace}")
-
-        error_messages = []
-        if settings.dry_run_active():
-            return error_messages
-
-        if self.type == APPLICATION:
-            error_message = self.check_service_account_roles(
-                "primaza-app-agent",
-                "primaza:app:leader-election", self.namespace)
-            if error_message:
-                error_messages.extend(error_message)
+        return engine.run(self.check_async())
 
-            error_message = self.check_service_account_roles(
-                    "primaza-app-agent",
-                    "primaza:app:manager", self.namespace)
-            if error_message:
-                error_messages.extend(error_message)
+    async def check_async(self):
+        logger.log_entry("Cluster: %s, Namespace %s", self.context,
+                         self.namespace)
 
-            error_message = self.worker.check_worker_roles(
-                names.get_rolebinding_name(self.user_type),
-                self.namespace)
-            if error_message:
-                error_messages.extend(error_message)
-        else:
-            error_message = self.check_service_account_roles(
-                "primaza-svc-agent",
-                "primaza:svc:leader-election", self.namespace)
-            if error_message:
-                error_messages.extend(error_message)
+        if settings.dry_run_active():
+            return []
 
-            error_message = self.check_service_account_roles(
-                "primaza-svc-agent",
-                "primaza:svc:manager", self.namespace)
-            if error_message:
-                error_messages.extend(error_message)
+        agent = "primaza-app-agent" \
+            if self.type == APPLICATION \
+            else "primaza-svc-agent"
+        roles = "primaza:app" \
+            if self.type == APPLICATION \
+            else "primaza:svc"
+
+        # the role checks and the wait for the agent pod do not depend on
+        # each other
+        results = await engine.gather(
+            engine.call(self.check_service_account_roles,
+                        agent, f"{roles}:leader-election", self.namespace),
+            engine.call(self.check_service_account_roles,
+                        agent, f"{roles}:manager", self.namespace),
+            engine.call(self.worker.check_worker_roles,
+                        names.get_rolebinding_name(self.user_type),
+                        self.namespace),
+            engine.call(self.__wait_for_pod))
 
-            error_message = self.worker.check_worker_roles(
-                names.get_rolebinding_name(self.user_type), self.namespace)
+        error_messages = []
+        for error_message in results:
             if error_message:
                 error_messages.extend(error_message)
 
-        pod = Pod(self.kubeconfig.get_api_client(), self.namespace)
-        pod_name = pod.get_primaza_pod_name()
-        logger.log_info(f"Pod name {pod_name}")
-        if pod_name:
-            pod_error = pod.wait_for_running()
-            if pod_error:
-                error_messages.extend(pod_error)
-        else:
-            error_message.extend("Control Plane pod not found in "
-                                 f"namespace {self.namespace}.")
-
         if error_messages:
             raise RuntimeError(
                 "Error: namespace install has failed to created the correct "
                 f"accesses. Error messages were: {error_messages}")
 
-        ce = self.main.get_cluster_environment(self.cluster_environment)
-        ce.check("Online", "Online", "True")
+        ce = await engine.call(self.main.get_cluster_environment,
+                               self.cluster_environment)
+        await engine.call(ce.check, "Online", "Online", "True")
 
         logger.log_exit("All checks passed")
+
+    def __wait_for_pod(self) -> []:
+        pod = Pod(self.kubeconfig.get_api_client(), self.namespace)
+        pod_name = pod.get_primaza_pod_name()
+        logger.log_info("Pod name %s", pod_name)
+        if not pod_name:
+            return ["Control Plane pod not found in "
+                    f"namespace {self.namespace}."]
+        pod_error = pod.wait_for_running()
+        return [pod_error] if pod_error else []
@@ -2,6 +2,7 @@ from primazactl.primazamain.maincluster import MainCluster
 from primazactl.primaza.primazacluster import PrimazaCluster
 from primazactl.kubectl.constants import WORKER_CONFIG
 from primazactl.kubectl.manifest import Manifest
+from primazactl.utils import engine
 from primazactl.utils import logger
 from primazactl.utils import names
 from primazactl.utils.kubeconfigwrapper import KubeConfigWrapper
@@ -48,14 +49,13 @@ class WorkerCluster(PrimazaCluster):
         self.manifest = Manifest(service_account_namespace, config_file,
                                  version, WORKER_CONFIG)
 
-        kcw = KubeConfigWrapper(context, self.kube_config_file)
-        self.kubeconfig = kcw.get_kube_config_for_cluster()
-
-        logger.log_info("WorkerCluster created for cluster "
-                        f"{self.context}, config_file: "
-                        f"{self.config_file}")
+        logger.log_info("WorkerCluster created for cluster %s, "
+                        "config_file: %s", self.context, self.config_file)
 
     def install_worker(self):
+        engine.run(self.install_worker_async())
+
+    async def install_worker_async(self):
         logger.log_entry()
 
         if not self.context:
@@ -64,34 +64,43 @@ class WorkerCluster(PrimazaCluster):
                 raise RuntimeError("\n[ERROR] installing priamza: "
                                    "no cluster found.")
             else:
-                logger.log_info("Cluster set to current context: "
-                                f"{self.context}")
-
-        self.install_crd()
-
-        logger.log_info("Create certificate signing request")
+                logger.log_info("Cluster set to current context: %s",
+                                self.context)
 
         sa_name, key_name = names.get_identity_names(
                 self.tenant, self.cluster_environment)
+        secret_name = names.get_kube_secret_name(self.cluster_environment)
 
-        identity = self.create_identity(sa_name, key_name)
-
-        logger.log_info("Create cluster context secret in main")
-        cc_kubeconfig = self.get_kubeconfig(identity)
+        # the crds and the identity on the worker and the cluster
+        # environment in main do not depend on each other
+        _, cc_kubeconfig, ce = await engine.gather(
+            engine.call(self.install_crd),
+            self.__create_kubeconfig(sa_name, key_name),
+            self.__create_cluster_environment(secret_name))
 
-        logger.log_info("Create cluster environment in main")
-        secret_name = names.get_kube_secret_name(self.cluster_environment)
-        ce = self.primaza_main.create_cluster_environment(
-            self.cluster_environment, self.environment, secret_name)
-        self.primaza_main.create_namespaced_kubeconfig_secret(
+        await engine.call(
+            self.primaza_main.create_namespaced_kubeconfig_secret,
             cc_kubeconfig, self.primaza_main.namespace,
             self.cluster_environment, secret_name)
-        ce.check("Online", "Online", "True")
+        await engine.call(ce.check, "Online", "Online", "True")
 
         logger.log_exit("Worker install complete")
 
+    async def __create_kubeconfig(self, sa_name, key_name):
+        logger.log_info("Create certificate signing request")
+        identity = await engine.call(self.create_identity, sa_name, key_name)
+
+        logger.log_info("Create cluster context secret in main")
+        return await engine.call(self.get_kubeconfig, identity)
+
+    async def __create_cluster_environment(self, secret_name):
+        logger.log_info("Create cluster environment in main")
+        return await engine.call(self.primaza_main.create_cluster_environment,
+                                 self.cluster_environment, self.environment,
+                                 secret_name)
+
     def install_crd(self):
-        logger.log_entry(f"config: {self.config_file}")
+        logger.log_entry("config: %s", self.config_file)
         self.install_config(self.manifest)
 
     def check_worker_roles(self, role_name, role_namespace):
@@ -1,8 +1,15 @@
 import os
 import re
-import semver
 from argparse import ArgumentTypeError
 
+# semantic version 2.0.0, as matched by semver.VersionInfo.isvalid. A regular
+# expression saves importing semver to parse the arguments of every command.
+SEMVER: re.Pattern = re.compile(
+    r"^(0|[1-9]\d*)\.(0|[1-9]\d*)\.(0|[1-9]\d*)"
+    r"(?:-((?:0|[1-9]\d*|\d*[a-zA-Z-][0-9a-zA-Z-]*)"
+    r"(?:\.(?:0|[1-9]\d*|\d*[a-zA-Z-][0-9a-zA-Z-]*))*))?"
+    r"(?:\+([0-9a-zA-Z-]+(?:\.[0-9a-zA-Z-]+)*))?$")
+
 
 def existing_file(arg):
     if not os.path.isfile(arg):
@@ -12,10 +19,20 @@ def existing_file(arg):
     return arg
 
 
+def existing_kubeconfig(arg):
+    # like KUBECONFIG, a list of files of which at least one must exist
+    paths = [path for path in arg.split(os.pathsep) if path]
+    if not any(os.path.isfile(path) for path in paths):
+        raise ArgumentTypeError(
+            f"--kubeconfig does not specify a valid file: {arg}")
+
+    return arg
+
+
 def semvertag_or_latest(arg):
     if arg != "latest" and arg != "nightly":
         version = arg[1:] if arg.startswith("v") else arg
-        if not semver.VersionInfo.isvalid(version):
+        if not SEMVER.match(version):
             raise ArgumentTypeError(
                 f"--version is not a valid semantic version: {arg}")
     return arg
@@ -0,0 +1,32 @@
+import os
+import tempfile
+from pathlib import Path
+
+
+def get_cache_dir(*parts: str) -> str:
+    """
+    Returns the primazactl cache directory, or a sub directory of it:
+    $XDG_CACHE_HOME/primazactl if XDG_CACHE_HOME is set to an absolute
+    path, otherwise ~/.cache/primazactl. The directory is not created.
+    """
+    base = os.environ.get("XDG_CACHE_HOME", "")
+    if not os.path.isabs(base):
+        base = os.path.join(Path.home(), ".cache")
+    return os.path.join(base, "primazactl", *parts)
+
+
+def write_atomic(path: str, content: bytes):
+    """
+    Write content to path so that readers see either the previous or the
+    new content, never a partially written file.
+    """
+    fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(path),
+                                     prefix=".tmp-")
+    try:
+        with os.fdopen(fd, "wb") as temp_file:
+            temp_file.write(content)
+        os.replace(temp_path, path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.unlink(temp_path)
+        raise
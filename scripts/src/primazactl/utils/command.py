@@ -23,12 +23,12 @@ class Command(object):
             f"Name or value of the environment variable cannot be None:" \
             f" [{key} = {value}]"
         self.env[key] = value
-        logger.log_info(f"command env set: [{key} = {value}]")
+        logger.log_info("command env set: [%s = %s]", key, value)
         return self
 
     def run(self, cmd, stdin=None):
         # for debugging purposes
-        logger.log_entry(f"COMMAND : {cmd}")
+        logger.log_entry("COMMAND : %s", cmd)
         if stdin is not None:
             logger.log_entry("get input from stdin")
         exit_code = 0
@@ -45,8 +45,8 @@ class Command(object):
         except subprocess.CalledProcessError as err:
             output = err.output
             exit_code = err.returncode
-            logger.log_error(f'MESSAGE: {output}')
-            logger.log_error(f'ERROR CODE: {exit_code}')
+            logger.log_error('MESSAGE: %s', output)
+            logger.log_error('ERROR CODE: %s', exit_code)
         return output.decode("utf-8"), exit_code
 
     def run_wait_for_status(self, cmd, status, interval=20, timeout=180):
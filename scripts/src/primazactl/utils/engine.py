@@ -0,0 +1,70 @@
+import asyncio
+import contextvars
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from primazactl.utils import settings
+
+# maximum number of blocking calls the engine runs at the same time, shared
+# by every operation of the command
+ENGINE_WORKERS: int = 16
+
+engine_executor: ThreadPoolExecutor = None
+engine_lock = threading.Lock()
+
+
+def run(coroutine):
+    """
+    Run an asynchronous operation to completion and return its result.
+    This is the synchronous facade used by the commands, it must not be
+    called from a coroutine or from a function run by call.
+    """
+    return asyncio.run(coroutine)
+
+
+async def call(function, *args, **kwargs):
+    """
+    Await a blocking function, e.g. a kube wrapper or a kubernetes client
+    call, run on the threads of the engine.
+    """
+    loop = asyncio.get_running_loop()
+    context = contextvars.copy_context()
+    return await loop.run_in_executor(
+        __get_executor(),
+        functools.partial(context.run, function, *args, **kwargs))
+
+
+async def gather(*coroutines) -> []:
+    """
+    Await coroutines concurrently and return their results in order.
+    All of them complete before the first exception, if any, is raised:
+    blocking calls which are running cannot be cancelled.
+    Resources are output in the order they are created, when they are
+    output the coroutines are awaited one at a time.
+    """
+    if settings.output_active():
+        results = []
+        for index, coroutine in enumerate(coroutines):
+            try:
+                results.append(await coroutine)
+            except BaseException:
+                for pending in coroutines[index + 1:]:
+                    pending.close()
+                raise
+        return results
+
+    results = await asyncio.gather(*coroutines, return_exceptions=True)
+    for result in results:
+        if isinstance(result, BaseException):
+            raise result
+    return results
+
+
+def __get_executor() -> ThreadPoolExecutor:
+    global engine_executor
+    with engine_lock:
+        if engine_executor is None:
+            engine_executor = ThreadPoolExecutor(
+                max_workers=ENGINE_WORKERS,
+                thread_name_prefix="primazactl-engine")
+        return engine_executor
@@ -1,8 +1,178 @@
+import copy
+import hashlib
 import os
+import threading
+from primazactl.utils import profiler
+from primazactl.utils import yamlio
 from pathlib import Path
+from types import MappingProxyType
+
+# kubeconfig fields holding paths, resolved relative to the file they are in
+PATH_FIELDS = {
+    "clusters": ("cluster", ["certificate-authority"]),
+    "users": ("user", ["client-certificate", "client-key", "tokenFile"]),
+}
+
+# KubeConfig models shared by every caller in the process, keyed by the
+# files and their modification times, or by the sha256 of the content
+models = {}
+models_lock = threading.Lock()
+
+
+class KubeConfig(object):
+    """
+    A parsed kubeconfig with its contexts, clusters and users indexed by
+    name. Models are shared and must not be modified, the methods return
+    copies callers are free to change.
+    """
+
+    content: {} = None
+    contexts: MappingProxyType = None
+    clusters: MappingProxyType = None
+    users: MappingProxyType = None
+
+    def __init__(self, content: {}):
+        self.content = content
+        self.contexts = self.index(content, "contexts")
+        self.clusters = self.index(content, "clusters")
+        self.users = self.index(content, "users")
+
+    @staticmethod
+    def index(content: {}, field: str) -> MappingProxyType:
+        # like kubectl, the first entry with a name wins
+        entries = {}
+        for entry in content.get(field) or []:
+            entries.setdefault(entry["name"], entry)
+        return MappingProxyType(entries)
+
+    def get_content(self) -> {}:
+        return copy.deepcopy(self.content)
+
+    def get_current_context(self) -> str | None:
+        return self.content.get("current-context") or None
+
+    def get_context(self, name: str) -> {}:
+        return copy.deepcopy(self.contexts.get(name))
+
+    def get_cluster(self, name: str) -> {}:
+        return copy.deepcopy(self.clusters.get(name))
+
+    def get_user(self, name: str) -> {}:
+        return copy.deepcopy(self.users.get(name))
 
 
 def from_env() -> str:
     return os.environ.get(
             "KUBECONFIG",
             os.path.join(Path.home(), ".kube", "config"))
+
+
+def get_paths(kubeconfig: str) -> []:
+    """
+    Returns the files of a kubeconfig path, which like KUBECONFIG may be a
+    list of files separated by os.pathsep.
+    """
+    return [path for path in str(kubeconfig).split(os.pathsep) if path]
+
+
+def get_key(kubeconfig: str):
+    """
+    Identifies the content of a kubeconfig path: its files with their
+    modification times and sizes.
+    """
+    paths = get_paths(kubeconfig)
+    return (tuple(paths), tuple(__get_stamp(path) for path in paths))
+
+
+def get(kubeconfig: str) -> KubeConfig:
+    """
+    Returns the model of a kubeconfig path, merging the files of a multi
+    file path the way kubectl does: the first file to set a value or to
+    define a named cluster, context or user wins, missing files are
+    ignored. Relative paths are made absolute.
+    The files are parsed once and the model reused until one of them
+    changes.
+    """
+    key = get_key(kubeconfig)
+    with models_lock:
+        if key not in models:
+            with profiler.span("kubeconfig load", kubeconfig=kubeconfig):
+                models[key] = KubeConfig(__merge(list(key[0])))
+        return models[key]
+
+
+def from_content(content: str, parsed: {} = None) -> KubeConfig:
+    """
+    Returns the model of kubeconfig content, parsed once per process.
+    If the caller already has the parsed content it can pass it as parsed,
+    the model then owns it.
+    """
+    key = hashlib.sha256(content.encode("utf-8")).hexdigest()
+    with models_lock:
+        if key not in models:
+            if parsed is None:
+                with profiler.span("kubeconfig load"):
+                    parsed = yamlio.safe_load(content) or {}
+            models[key] = KubeConfig(parsed)
+        return models[key]
+
+
+def load(kubeconfig: str) -> {}:
+    """
+    Returns a copy of the merged content of a kubeconfig path.
+    """
+    return get(kubeconfig).get_content()
+
+
+def current_context(kubeconfig: str) -> str | None:
+    return get(kubeconfig).get_current_context()
+
+
+def __get_stamp(path: str):
+    try:
+        stat = os.stat(path)
+        return stat.st_mtime_ns, stat.st_size
+    except OSError:
+        return None
+
+
+def __merge(paths: []) -> {}:
+    merged = {"apiVersion": "v1",
+              "kind": "Config",
+              "preferences": {},
+              "clusters": [],
+              "contexts": [],
+              "users": []}
+    names = {"clusters": set(), "contexts": set(), "users": set()}
+    first = True
+    for path in paths:
+        if not os.path.isfile(path):
+            continue
+        with open(path, "r") as kc_file:
+            content = yamlio.safe_load(kc_file) or {}
+
+        for field, value in content.items():
+            if field in names:
+                continue
+            if first or not merged.get(field):
+                merged[field] = value
+        first = False
+
+        base = os.path.dirname(os.path.abspath(path))
+        for field in names:
+            for entry in content.get(field) or []:
+                if entry["name"] not in names[field]:
+                    names[field].add(entry["name"])
+                    merged[field].append(__resolve_paths(field, entry, base))
+    return merged
+
+
+def __resolve_paths(field: str, entry: {}, base: str) -> {}:
+    if field not in PATH_FIELDS:
+        return entry
+    section, keys = PATH_FIELDS[field]
+    for key in keys:
+        value = (entry.get(section) or {}).get(key)
+        if value and not os.path.isabs(value):
+            entry[section][key] = os.path.join(base, value)
+    return entry
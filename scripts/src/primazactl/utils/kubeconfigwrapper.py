@@ -1,7 +1,16 @@
-from kubeconfig import KubeConfig
-import yaml
+import hashlib
+import threading
+from primazactl.utils import yamlio
 from kubernetes import client, config
 from primazactl.utils import logger
+from primazactl.utils import profiler
+from primazactl.utils import kubeconfig
+
+# ApiClients shared by every wrapper of the same kubeconfig and context,
+# keyed by (kubeconfig file, context, modification times of its files) or
+# by (None, context, sha256 of the kubeconfig content)
+api_clients = {}
+api_clients_lock = threading.Lock()
 
 
 class KubeConfigWrapper(object):
@@ -15,39 +24,31 @@ class KubeConfigWrapper(object):
         self.kube_config_file = kube_config_file
         if not context:
             self.context = self.get_context()
-            logger.log_info(f"kcw: Use context cluster: {self.context}")
+            logger.log_info("kcw: Use context cluster: %s", self.context)
         else:
             self.context = context
-        logger.log_info(f"kcw: cluster: {self.context}, "
-                        f"file: {self.kube_config_file}")
-
-    def use_context(self):
-        logger.log_entry(f"Cluster: {self.context}, "
-                         f"File : {self.kube_config_file}")
-        if self.kube_config_file:
-            config = KubeConfig(self.kube_config_file)
-            config.use_context(f"{self.context}")
-        else:
-            config = self.get_kube_config_content_as_yaml()
-            config["current-context"] = self.context
+        logger.log_info("kcw: cluster: %s, file: %s", self.context,
+                        self.kube_config_file)
 
     def get_context(self):
-        if self.kube_config_file:
-            config = KubeConfig(self.kube_config_file)
-            return config.current_context()
-        else:
-            config = self.get_kube_config_content_as_yaml()
-            return config["current-context"]
+        return self.get_model().get_current_context()
+
+    def get_model(self) -> kubeconfig.KubeConfig:
+        if self.kube_config_content:
+            return kubeconfig.from_content(self.kube_config_content)
+        return kubeconfig.get(self.kube_config_file)
 
     def get_kube_config_content_as_yaml(self):
-        if not self.kube_config_content:
-            self.get_kube_config_content()
-        return yaml.safe_load(self.kube_config_content)
+        return self.get_model().get_content()
 
     def get_kube_config_content(self):
         if not self.kube_config_content:
-            with open(str(self.kube_config_file), "r") as kc_file:
-                self.kube_config_content = kc_file.read()
+            if len(kubeconfig.get_paths(self.kube_config_file)) == 1:
+                with open(str(self.kube_config_file), "r") as kc_file:
+                    self.kube_config_content = kc_file.read()
+            else:
+                self.kube_config_content = \
+                    yamlio.dump(kubeconfig.load(self.kube_config_file))
         return self.kube_config_content
 
     def get_kubeconfig_for_content(self, content):
@@ -56,64 +57,58 @@ class KubeConfigWrapper(object):
         return kcw
 
     def get_kube_config_for_cluster(self):
-        logger.log_entry(f"Cluster: {self.context}, "
-                         f"File : {self.kube_config_file}")
+        logger.log_entry("Cluster: %s, File : %s", self.context,
+                         self.kube_config_file)
 
-        kcc_yaml = self.get_kube_config_content_as_yaml()
+        model = self.get_model()
 
         cluster_config = {"apiVersion": "v1",
-                          "kind": kcc_yaml["kind"],
-                          "preferences": kcc_yaml["preferences"],
+                          "kind": model.content.get("kind"),
+                          "preferences": model.content.get("preferences"),
                           "current-context": self.context}
 
         context_cluster: str = None
-        for context in kcc_yaml["contexts"]:
-            if context["name"] == self.context:
-                cluster_config["contexts"] = [context]
-                logger.log_info(f"context found: {self.context}")
-                self.user = context["context"]["user"]
-                context_cluster = context["context"]["cluster"]
-                break
-
-        if self.user != self.context:
-            for context in kcc_yaml["contexts"]:
-                if context["name"] == self.user:
-                    cluster_config["contexts"].append(context)
-                    logger.log_info(f'context found: {context["name"]}')
-                    break
-
-        for cluster in kcc_yaml["clusters"]:
-            if cluster["name"] == self.context or \
-                    (context_cluster and cluster["name"] == context_cluster):
-                logger.log_info(f'cluster found: {cluster["name"]}')
-                cluster_config["clusters"] = [cluster]
-                break
-
-        if "clusters" not in cluster_config:
+        context = model.get_context(self.context)
+        if context:
+            cluster_config["contexts"] = [context]
+            logger.log_info("context found: %s", self.context)
+            self.user = context["context"]["user"]
+            context_cluster = context["context"]["cluster"]
+
+            if self.user != self.context:
+                user_context = model.get_context(self.user)
+                if user_context:
+                    cluster_config["contexts"].append(user_context)
+                    logger.log_info("context found: %s", self.user)
+
+        cluster = model.get_cluster(context_cluster) \
+            if context_cluster in model.clusters \
+            else model.get_cluster(self.context)
+        if not cluster:
             context = self.context if not context_cluster \
                 else context_cluster
             msg = f"Error cluster {context} not found in kube config: " \
                   f"{self.kube_config_file}"
             logger.log_error(msg)
             raise RuntimeError(f"[ERROR] {msg}")
+        logger.log_info('cluster found: %s', cluster["name"])
+        cluster_config["clusters"] = [cluster]
 
-        for user in kcc_yaml["users"]:
-            if user["name"] == self.context or \
-                    (self.user and user["name"] == self.user):
-                logger.log_info(f'user found: {user["name"]}')
-                if "users" in cluster_config:
-                    cluster_config["users"].append(user)
-                else:
-                    cluster_config["users"] = [user]
+        for name in dict.fromkeys([self.context, self.user]):
+            user = model.get_user(name)
+            if user:
+                logger.log_info('user found: %s', user["name"])
+                cluster_config.setdefault("users", []).append(user)
 
         kcw = KubeConfigWrapper(self.context, self.kube_config_file)
-        kcw.kube_config_content = yaml.dump(cluster_config)
-        # logger.log_info(f"Kubeconfig:\n{yaml.dump(cluster_config)}")
+        kcw.kube_config_content = yamlio.dump(cluster_config)
+        # the content was just built, no need to parse it again
+        kubeconfig.from_content(kcw.kube_config_content, cluster_config)
         return kcw
 
     def copy_to_temp_file(self, temp_file):
-        logger.log_entry(f"Cluster: {self.context}, "
-                         f"File : {temp_file.name}")
+        logger.log_entry("Cluster: %s, File : %s", self.context,
+                         temp_file.name)
         temp_file.write(str(self.kube_config_content))
         return KubeConfigWrapper(self.context, temp_file.name)
 
@@ -124,18 +119,30 @@ class KubeConfigWrapper(object):
 
         logger.log_entry(self.context)
         try:
-            if self.kube_config_file:
-                self.use_context()
-                config.load_kube_config(config_file=self.kube_config_file)
-                return client.ApiClient()
+            if self.kube_config_content:
+                key = (None, self.context,
+                       hashlib.sha256(self.kube_config_content
+                                      .encode("utf-8")).hexdigest())
             else:
-                content = yaml.safe_load(self.get_kube_config_content())
-                cluster_only_api_client = \
-                    config.new_client_from_config_dict(content)
-                return cluster_only_api_client
+                key = (self.kube_config_file, self.context,
+                       kubeconfig.get_key(self.kube_config_file))
+
+            with api_clients_lock:
+                if key not in api_clients:
+                    api_clients[key] = self.__new_api_client()
+                return api_clients[key]
         except Exception as e:
             msg = f"Exception getting kubernetes client for cluster " \
                   f"{self.context} in {self.kube_config_file}. " \
                   f"Exception was {e}"
             logger.log_error(msg)
             raise RuntimeError(f"[ERROR] {msg}")
+
+    def __new_api_client(self) -> client:
+        logger.log_info("kcw: new api client for cluster: %s, file: %s",
+                        self.context, self.kube_config_file)
+        with profiler.span("api client", context=self.context):
+            return profiler.instrument(config.new_client_from_config_dict(
+                self.get_kube_config_content_as_yaml(),
+                context=self.context,
+                persist_config=False))
@@ -1,10 +1,107 @@
-import inspect
+import atexit
+import datetime
+import json
+import logging
+import logging.handlers
 import os
+import queue
+import sys
+import threading
 from primazactl.version import __version__, __primaza_version__
 
+LOG_FORMAT_TEXT = "text"
+LOG_FORMAT_JSON = "json"
+LOG_FORMATS = [LOG_FORMAT_TEXT, LOG_FORMAT_JSON]
+
+# levels of entry and exit logs, between DEBUG and INFO
+ENTER: int = 15
+EXIT: int = 16
+logging.addLevelName(ENTER, "ENTER")
+logging.addLevelName(EXIT, "EXIT")
+# level of the primazactl logger when not verbose, only messages logged
+# with always are written
+QUIET: int = logging.CRITICAL + 10
+
 verbose = False
 first_log = True
 dry_run: str = ""
+# file logs and messages are written to, standard output if not set
+log_file = None
+
+# labels of the callers of the log functions, keyed by code object:
+# "file:function" for functions, None for methods, which are labelled
+# with the class of self when they log
+labels = {}
+
+log = logging.getLogger("primazactl")
+log.setLevel(QUIET)
+log.propagate = False
+
+# verbose logs are formatted by the thread which logs them and written by
+# the listener thread, logging does not wait for the output
+log_queue = queue.Queue()
+log_listener: logging.handlers.QueueListener = None
+log_lock = threading.Lock()
+
+
+class Record(logging.LogRecord):
+    """
+    Log record whose message may be a callable, called when the record is
+    formatted, e.g. log_info(lambda: yamlio.dump(content)). As with the
+    stdlib logging, a message with args is formatted as message % args.
+    """
+
+    def getMessage(self):
+        message = self.msg() if callable(self.msg) else str(self.msg)
+        if self.args:
+            message = message % self.args
+        return message
+
+
+class TextFormatter(logging.Formatter):
+
+    def format(self, record):
+        message = record.getMessage()
+        if not record.caller:
+            return f"[{record.levelname}]{record.dry_run}{message}"
+        # entries and exits are not dry run specific
+        prefix = {"ENTER": "[ENTER]", "EXIT": "[EXIT] "}.get(
+            record.levelname, f"[{record.levelname}]{record.dry_run}")
+        return f"{prefix} {record.caller} : {message}"
+
+
+class JsonFormatter(logging.Formatter):
+
+    def format(self, record):
+        created = datetime.datetime.fromtimestamp(record.created,
+                                                  datetime.timezone.utc)
+        entry = {"time": created.isoformat(timespec="milliseconds"),
+                 "level": record.levelname,
+                 "message": record.getMessage()}
+        if record.caller:
+            entry["caller"] = record.caller
+        if record.dry_run:
+            entry["dryRun"] = True
+        return json.dumps(entry)
+
+
+class OutputHandler(logging.Handler):
+    """
+    Writes each record as a line to the file it was logged for, log_file
+    or standard output by default, with one write so lines do not mix.
+    """
+
+    def emit(self, record):
+        try:
+            (record.file or log_file or sys.stdout).write(
+                f"{self.format(record)}\n")
+        except Exception:
+            self.handleError(record)
+
+
+output_handler = OutputHandler()
+output_handler.setFormatter(TextFormatter())
+log.addHandler(logging.handlers.QueueHandler(log_queue))
 
 
 def set_dry_run(dry_run_text):
@@ -12,53 +109,128 @@ def set_dry_run(dry_run_text):
     dry_run = dry_run_text
 
 
-def log_info(message, always=False):
+def set_log_file(file):
+    global log_file
+    log_file = file
+
+
+def set_format(value):
+    output_handler.setFormatter(JsonFormatter() if value == LOG_FORMAT_JSON
+                                else TextFormatter())
+
+
+def log_info(message, *args, always=False):
     if always:
-        print(f"[INFO]{dry_run}{message}")
+        __log(logging.INFO, message, args)
     elif verbose:
-        __write_log(f"[INFO]{dry_run}", message)
+        __write_log(logging.INFO, message, args)
 
 
-def log_entry(message="Just entering"):
+def log_entry(message="Just entering", *args):
     if verbose:
-        __write_log("[ENTER]", message)
+        __write_log(ENTER, message, args)
 
 
-def log_exit(message="Just exiting"):
+def log_exit(message="Just exiting", *args):
     if verbose:
-        __write_log("[EXIT] ", message)
+        __write_log(EXIT, message, args)
 
 
-def log_warning(message):
+def log_warning(message, *args):
     if verbose:
-        __write_log(f"[WARNING]{dry_run}", message)
+        __write_log(logging.WARNING, message, args)
 
 
-def log_error(message, always=True):
+def log_error(message, *args, always=True, file=None):
 
     if always:
-        print(f"[ERROR]{dry_run}{message}")
+        __log(logging.ERROR, message, args, file)
     elif verbose:
-        __write_log(f"[ERROR]{dry_run}", message)
+        __write_log(logging.ERROR, message, args)
+
+
+def output(message, *args, file=None):
+    """
+    Write command output, a result or the dry run resources, as is, after
+    the logs logged before it.
+    """
+    flush()
+    if args:
+        message = message % args
+    (file or log_file or sys.stdout).write(f"{message}\n")
 
 
 def set_verbose(value):
     global verbose
     verbose = value
+    log.setLevel(logging.DEBUG if verbose else QUIET)
+
+
+def flush():
+    """
+    Wait for the verbose logs logged so far to be written.
+    """
+    if log_listener is not None:
+        log_queue.join()
 
 
-def __write_log(type, message):
+def __write_log(level, message, args):
     global first_log
     if first_log:
         first_log = False
-        log_info(f"Primazactl version: {__version__}, "
-                 f"Primaza version: {__primaza_version__}")
-    stack = inspect.stack()
-    if "self" in stack[2][0].f_locals:
-        calling_class = stack[2][0].f_locals["self"].__class__.__name__
-        calling_method = stack[2][0].f_code.co_name
-        print(f"{type} {calling_class}.{calling_method} : {message}")
-    else:
-        calling_file = os.path.basename(stack[2].filename)
-        calling_method = stack[2].function
-        print(f"{type} {calling_file}:{calling_method} : {message}")
+        log_info("Primazactl version: %s, Primaza version: %s",
+                 __version__, __primaza_version__)
+    if not log.isEnabledFor(level):
+        return
+    __start_listener()
+    # the caller of the log function which called __write_log
+    log.handle(__new_record(level, message, args,
+                            __get_caller(sys._getframe(2)), None))
+
+
+def __log(level, message, args, file=None):
+    # messages logged with always are written straight away, after the
+    # verbose logs logged before them
+    flush()
+    output_handler.handle(__new_record(level, message, args, None, file))
+
+
+def __new_record(level, message, args, caller, file) -> Record:
+    record = Record(log.name, level, "", 0, message, args, None)
+    record.caller = caller
+    record.dry_run = dry_run
+    record.file = file
+    return record
+
+
+def __start_listener():
+    global log_listener
+    if log_listener is not None:
+        return
+    with log_lock:
+        if log_listener is None:
+            log_listener = logging.handlers.QueueListener(log_queue,
+                                                          output_handler)
+            log_listener.start()
+            atexit.register(log_listener.stop)
+
+
+def __get_caller(frame) -> str:
+    code = frame.f_code
+    try:
+        label = labels[code]
+    except KeyError:
+        if "self" in code.co_varnames or "self" in code.co_cellvars or \
+                "self" in code.co_freevars:
+            label = None
+        else:
+            label = f"{os.path.basename(code.co_filename)}:{code.co_name}"
+        labels[code] = label
+
+    if label is None:
+        # f_locals is only built for methods, there is no source to read
+        instance = frame.f_locals.get("self")
+        if instance is None:
+            return f"{os.path.basename(code.co_filename)}:{code.co_name}"
+        return f"{instance.__class__.__name__}.{code.co_name}"
+    return label
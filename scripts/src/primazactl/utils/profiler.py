@@ -0,0 +1,207 @@
+import contextlib
+import functools
+import json
+import os
+import sys
+import threading
+import time
+from urllib.parse import parse_qs, urlsplit
+
+PROFILE_TABLE = "table"
+PROFILE_TRACE = "trace"
+PROFILE_CHOICES = [PROFILE_TABLE, PROFILE_TRACE]
+
+# namespace subresources, /api/v1/namespaces/{name}/{subresource}
+NAMESPACE_SUBRESOURCES = ["status", "finalize"]
+
+profile: str = None
+profile_file: str = None
+# time the module was imported, spans are reported relative to it
+origin: float = time.perf_counter()
+# spans as (name, category, start, duration, thread id, args)
+spans = []
+threads = {}
+spans_lock = threading.Lock()
+
+
+def enable(profile_type: str, file: str = None):
+    """
+    Start recording spans, reported by report as a summary table or as
+    Chrome trace event JSON to file, default: standard error.
+    """
+    global profile
+    global profile_file
+    profile = profile_type
+    profile_file = file
+
+
+@contextlib.contextmanager
+def span(name: str, /, category: str = "phase", **args):
+    """
+    Record the time the body takes as a span called name, e.g.
+    with profiler.span("manifest fetch", type=self.type): ...
+    The span is recorded when the body raises too.
+    """
+    if profile is None:
+        yield
+        return
+
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        __record(name, category, start, time.perf_counter() - start, args)
+
+
+def instrument(api_client):
+    """
+    Record each request api_client sends as a span of category api,
+    named by its verb and resource, e.g. "create namespaces". Returns
+    api_client, unchanged when profiling is not active.
+    """
+    if profile is None:
+        return api_client
+
+    request = api_client.rest_client.request
+
+    @functools.wraps(request)
+    def timed_request(method, url, *args, **kwargs):
+        query_params = kwargs.get("query_params", args[0] if args else None)
+        verb, resource = get_verb_resource(method, url, query_params)
+        start = time.perf_counter()
+        try:
+            return request(method, url, *args, **kwargs)
+        finally:
+            __record(f"{verb} {resource}", "api", start,
+                     time.perf_counter() - start, {"url": url})
+
+    api_client.rest_client.request = timed_request
+    return api_client
+
+
+def get_verb_resource(method: str, url: str, query_params=None) -> ():
+    """
+    Returns the kubernetes verb and resource of a request, e.g. ("list",
+    "pods") for GET /api/v1/namespaces/default/pods.
+    """
+    split = urlsplit(url)
+    query = {key: values[-1] for key, values in parse_qs(split.query).items()}
+    for key, value in query_params or []:
+        query[key] = value
+
+    parts = [part for part in split.path.split("/") if part]
+    if parts[:1] == ["api"]:
+        parts = parts[2:]
+    elif parts[:1] == ["apis"]:
+        parts = parts[3:]
+    else:
+        return method.lower(), "/".join(parts) or "/"
+    if not parts:
+        return "get", "discovery"
+
+    if parts[0] == "namespaces" and len(parts) > 2 and \
+            parts[2] not in NAMESPACE_SUBRESOURCES:
+        parts = parts[2:]
+    resource = "/".join(parts[:1] + parts[2:3])
+    has_name = len(parts) > 1
+
+    method = method.upper()
+    if method == "GET":
+        if str(query.get("watch", "")).lower() in ["true", "1"]:
+            verb = "watch"
+        else:
+            verb = "get" if has_name else "list"
+    elif method == "DELETE" and not has_name:
+        verb = "deletecollection"
+    else:
+        verb = {"POST": "create", "PUT": "update", "PATCH": "patch",
+                "DELETE": "delete"}.get(method, method.lower())
+    return verb, resource
+
+
+def report():
+    """
+    Write the spans recorded, when profiling is active.
+    """
+    if profile is None:
+        return
+
+    with spans_lock:
+        recorded = list(spans)
+        names = dict(threads)
+
+    if profile == PROFILE_TRACE:
+        content = get_trace(recorded, names)
+    else:
+        content = get_table(recorded)
+
+    if profile_file:
+        with open(profile_file, "w") as file:
+            file.write(content)
+    else:
+        print(content, file=sys.stderr)
+
+
+def get_trace(recorded: [], names: {}) -> str:
+    """
+    Chrome trace event JSON of the spans, which Perfetto and
+    chrome://tracing open.
+    """
+    pid = os.getpid()
+    events = [{"name": "thread_name", "ph": "M", "pid": pid, "tid": tid,
+               "args": {"name": name}}
+              for tid, name in names.items()]
+    for name, category, start, duration, tid, args in recorded:
+        events.append({"name": name,
+                       "cat": category,
+                       "ph": "X",
+                       "ts": round((start - origin) * 1e6, 3),
+                       "dur": round(duration * 1e6, 3),
+                       "pid": pid,
+                       "tid": tid,
+                       "args": args})
+    return json.dumps({"traceEvents": events, "displayTimeUnit": "ms"})
+
+
+def get_table(recorded: []) -> str:
+    """
+    Count, total, mean and maximum duration of the spans of each name,
+    phases first, then api calls by verb and resource.
+    """
+    lines = []
+    for category, title in [("phase", "phase"),
+                            ("api", "api call (verb resource)")]:
+        totals = {}
+        for name, span_category, _, duration, _, _ in recorded:
+            if span_category == category:
+                count, total, longest = totals.get(name, (0, 0.0, 0.0))
+                totals[name] = (count + 1, total + duration,
+                                max(longest, duration))
+        if not totals:
+            continue
+
+        width = max(len(title), max(len(name) for name in totals))
+        lines.append(f"{title:<{width}}  {'count':>7}  {'total s':>9}  "
+                     f"{'mean s':>9}  {'max s':>9}")
+        for name, (count, total, longest) in \
+                sorted(totals.items(), key=lambda item: -item[1][1]):
+            lines.append(f"{name:<{width}}  {count:>7}  {total:>9.3f}  "
+                         f"{total / count:>9.3f}  {longest:>9.3f}")
+        if category == "api":
+            count = sum(entry[0] for entry in totals.values())
+            total = sum(entry[1] for entry in totals.values())
+            lines.append(f"{'total':<{width}}  {count:>7}  {total:>9.3f}")
+        lines.append("")
+
+    if recorded:
+        end = max(start + duration for _, _, start, duration, _, _
+                  in recorded)
+        lines.append(f"elapsed: {end - origin:.3f}s")
+    return "\n".join(lines)
+
+
+def __record(name, category, start, duration, args):
+    thread = threading.current_thread()
+    with spans_lock:
+        threads.setdefault(thread.ident, thread.name)
+        spans.append((name, category, start, duration, thread.ident, args))
@@ -1,14 +1,18 @@
-import yaml
+from primazactl.utils import yamlio
+import json
 import sys
+import threading
 from primazactl.utils import logger
 
 dry_run = "none"
 output_type = "none"
-resources = {
-    "apiVersion": "v1",
-    "items": []
-}
+server_side = False
+incremental = False
+output_list = False
+# resources are written as they are added, not kept until the command ends
+resources_written = 0
 warnings = []
+output_lock = threading.Lock()
 
 DRY_RUN_SERVER = "server"
 DRY_RUN_CLIENT = "client"
@@ -16,20 +20,31 @@ DRY_RUN_NONE = "none"
 DRY_RUN_CHOICES = [DRY_RUN_CLIENT, DRY_RUN_SERVER, DRY_RUN_NONE]
 
 OUTPUT_YAML = "yaml"
+OUTPUT_JSON = "json"
 OUTPUT_NONE = "none"
-OUTPUT_CHOICES = [OUTPUT_YAML, OUTPUT_NONE]
+OUTPUT_CHOICES = [OUTPUT_YAML, OUTPUT_JSON, OUTPUT_NONE]
 
 
 def set(args):
     global dry_run
     global output_type
+    global server_side
+    global incremental
+    global output_list
 
     if args.output_type != OUTPUT_NONE:
         output_type = args.output_type
+        output_list = args.output_list
+        # standard output only carries the resources, which are parsed
+        logger.set_log_file(sys.stderr)
     if args.dry_run != DRY_RUN_NONE:
         dry_run = args.dry_run
         logger.set_dry_run(" (dry run) ")
-    logger.log_info(f"Dry run: {dry_run}, Dry run yaml output: {output_type}")
+    server_side = args.server_side
+    incremental = args.incremental
+    logger.log_info("Dry run: %s, Dry run yaml output: %s, Server side apply: "
+                    "%s, Incremental: %s", dry_run, output_type, server_side,
+                    incremental)
 
 
 def dry_run_active():
@@ -41,17 +56,54 @@ def output_active():
 
 
 def output():
-    if output_type == OUTPUT_YAML:
-        print(f"\n{yaml.dump(resources)}")
-        if len(warnings) > 0:
-            for warning in warnings:
-                print(warning, file=sys.stderr)
+    """
+    Complete the output of the resources, closing the List they are
+    written in, and write the warnings.
+    """
+    if not output_active():
+        return
+
+    with output_lock:
+        if output_list:
+            if resources_written == 0:
+                __write(yamlio.dump({"apiVersion": "v1", "items": []})
+                        if output_type == OUTPUT_YAML else
+                        json.dumps({"apiVersion": "v1", "items": []}) + "\n")
+            elif output_type == OUTPUT_JSON:
+                __write("\n]}\n")
+    for warning in warnings:
+        print(warning, file=sys.stderr)
 
 
 def add_resource(resource):
-    global resources
-    if output_active():
-        resources["items"].append(resource)
+    """
+    Write a resource which is created straight away: as a yaml document or
+    a JSON line, or as the next item of a v1 List if output_list is set.
+    """
+    global resources_written
+    if not output_active():
+        return
+
+    if output_type == OUTPUT_YAML:
+        # a one item sequence is the List item as yaml.dump writes it
+        content = yamlio.dump([resource]) if output_list else \
+            f"---\n{yamlio.dump(resource)}"
+    else:
+        content = json.dumps(resource, default=str)
+        if not output_list:
+            content += "\n"
+
+    with output_lock:
+        if output_list:
+            if resources_written == 0:
+                header = "apiVersion: v1\nitems:\n" \
+                    if output_type == OUTPUT_YAML else \
+                    '{"apiVersion": "v1", "items": [\n'
+                content = header + content
+            elif output_type == OUTPUT_JSON:
+                content = ",\n" + content
+        __write(content)
+        resources_written += 1
 
 
 def add_warning(message):
@@ -59,3 +111,11 @@ def add_warning(message):
     if output_active():
         warnings.append(f"WARNING:{dry_run}{message}")
     logger.log_warning(message)
+
+
+def __write(content):
+    # after the logs logged so far, with one write so that resources added
+    # by several threads do not mix, flushed for the reader of a pipe
+    logger.flush()
+    sys.stdout.write(content)
+    sys.stdout.flush()
@@ -0,0 +1,49 @@
+import yaml
+
+# use the libyaml bindings when pyyaml was built with them, they parse and
+# emit many times faster than the pure python implementation
+try:
+    from yaml import CSafeLoader as SafeLoader, CSafeDumper as SafeDumper
+except ImportError:
+    from yaml import SafeLoader, SafeDumper
+
+
+class Dumper(SafeDumper):
+    """
+    Safe dumper which writes content shared by several objects in full each
+    time instead of as yaml anchors and aliases, e.g. the content manifests
+    applied to several namespaces have in common.
+    """
+
+    def ignore_aliases(self, data):
+        return True
+
+
+def safe_load(stream):
+    """
+    Parse the first document of a string, bytes or file into python objects.
+    """
+    return yaml.load(stream, Loader=SafeLoader)
+
+
+def safe_load_all(stream):
+    """
+    Parse every document of a string, bytes or file, lazily, into python
+    objects.
+    """
+    return yaml.load_all(stream, Loader=SafeLoader)
+
+
+def dump(data, stream=None, **kwargs):
+    """
+    Serialize data to a yaml string or, if stream is set, to stream.
+    """
+    return yaml.dump(data, stream, Dumper=Dumper, **kwargs)
+
+
+def dump_all(documents, stream=None, **kwargs):
+    """
+    Serialize documents to a multi-document yaml string or, if stream is
+    set, to stream.
+    """
+    return yaml.dump_all(documents, stream, Dumper=Dumper, **kwargs)
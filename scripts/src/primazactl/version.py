@@ -0,0 +1,2 @@
+__version__ = "dev"
+__primaza_version__ = "latest"
@@ -3,7 +3,7 @@ import subprocess
 import sys
 import time
 import os
-import yaml
+from primazactl.utils import yamlio
 import tempfile
 from primazactl.utils.command import Command
 from primazactl.kubectl.manifest import Manifest
@@ -214,7 +214,7 @@ def get_cluster_internal_url(cluster_name: str) -> str:
     if err != 0:
         raise RuntimeError("\n[ERROR] error getting data from docker:"
                            f"{control_plane} : {err}")
-    docker_data = yaml.safe_load(out)
+    docker_data = yamlio.safe_load(out)
     networks = docker_data[0]["NetworkSettings"]["Networks"]
     ipaddr = networks["kind"]["IPAddress"]
     internal_url = f"https://{ipaddr}:6443"
@@ -716,7 +716,7 @@ def test_dry_run_with_options(command_args):
 
     with tempfile.NamedTemporaryFile(mode="w+") as options_file:
         with open(options_file.name, 'w') as options:
-            yaml.dump(options_yaml, options)
+            yamlio.dump(options_yaml, options)
 
         command = [f"{command_args.venv_dir}/bin/primazactl", "apply",
                    "-p", options_file.name,
@@ -933,10 +933,18 @@ def check_output(manifest_file, version, type, resp):
     manifest_list = list(manifest_yaml)
 
     outcome = True
-    response_yaml = yaml.safe_load(resp)
+    # resources are output as yaml documents, or as a v1 List
+    response_resources = []
+    for document in yamlio.safe_load_all(resp):
+        if not document:
+            continue
+        if "items" in document:
+            response_resources.extend(document["items"])
+        else:
+            response_resources.append(document)
     for manifest_resource in manifest_list:
         match_found = False
-        for response_resource in response_yaml["items"]:
+        for response_resource in response_resources:
             if response_resource["kind"] == manifest_resource["kind"]:
                 if response_resource["metadata"]["name"] == \
                         manifest_resource["metadata"]["name"]:
@@ -968,7 +976,7 @@ def test_apply(command_args):
 
     with tempfile.NamedTemporaryFile(mode="w+") as options_file:
         with open(options_file.name, 'w') as options:
-            yaml.dump(options_yaml, options)
+            yamlio.dump(options_yaml, options)
 
         command = [f"{command_args.venv_dir}/bin/primazactl", "apply",
                    "-p", options_file.name]
@@ -1018,7 +1026,7 @@ def check_apply_out(out, expect_out):
 
 def update_options_file(command_args):
     with open(command_args.options_file) as options:
-        options_yaml = yaml.safe_load(options)
+        options_yaml = yamlio.safe_load(options)
 
     main_url = get_cluster_internal_url(
         options_yaml['controlPlane']["context"].replace("kind-", ""))
@@ -1,4 +1,4 @@
-import yaml
+from primazactl.utils import yamlio
 import argparse
 import os
 from kubernetes.client.rest import ApiException
@@ -41,7 +41,7 @@ class User(object):
         logger.log_entry(f"process file: {self.user_config_file}")
 
         with open(self.user_config_file, 'r') as manifest:
-            resources = yaml.safe_load_all(manifest)
+            resources = yamlio.safe_load_all(manifest)
             resource_list = list(resources)
 
         for resource in resource_list:
@@ -66,7 +66,7 @@ class User(object):
                                               self.api_client,
                                               "delete")
                 except ApiException as api_exception:
-                    body = yaml.safe_load(api_exception.body)
+                    body = yamlio.safe_load(api_exception.body)
                     if body["reason"] == "NotFound":
                         logger.log_info(f'create: {body["message"]}')
                         pass
@@ -79,7 +79,7 @@ class User(object):
                                               self.api_client,
                                               "create")
                 except ApiException as api_exception:
-                    body = yaml.safe_load(api_exception.body)
+                    body = yamlio.safe_load(api_exception.body)
                     if body["reason"] == "AlreadyExists":
                         logger.log_info(f'create: {body["message"]}')
                         pass
@@ -101,7 +101,7 @@ class User(object):
 
         os.makedirs(os.path.dirname(new_file_path), exist_ok=True)
         with open(new_file_path, "w") as file:
-            file.write(yaml.dump(kcd))
+            file.write(yamlio.dump(kcd))
             logger.log_info("Write complete")
             print(f"kubeconfig file created for user {self.user_name} : "
                   f"{new_file_path}")
@@ -0,0 +1,48 @@
+import os
+import tempfile
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+from kubernetes import config
+from primazactl.kube import discovery
+from primazactl.kube.discovery import Discovery
+from primazabench.fakeapiserver import FakeApiServer
+
+
+class DiscoveryTest(unittest.TestCase):
+
+    server: FakeApiServer = None
+    api_client = None
+
+    def setUp(self):
+        cache_home = tempfile.TemporaryDirectory()
+        self.addCleanup(cache_home.cleanup)
+        environ = mock.patch.dict(os.environ,
+                                  {"XDG_CACHE_HOME": cache_home.name})
+        environ.start()
+        self.addCleanup(environ.stop)
+        # slow responses keep concurrent lookups waiting on each other
+        self.server = FakeApiServer(latency=0.05).start()
+        self.addCleanup(self.server.stop)
+        self.api_client = config.new_client_from_config_dict(
+            self.server.kubeconfig())
+        discovery.resource_lists.clear()
+        discovery.server_versions.clear()
+
+    def test_concurrent_lookups_fetch_once(self):
+        self.server.reset_stats()
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            futures = [executor.submit(Discovery(self.api_client)
+                                       .get_resources, "apps/v1")
+                       for _ in range(8)]
+            results = [future.result() for future in futures]
+
+        self.assertTrue(results[0])
+        for resources in results:
+            self.assertIs(resources, results[0])
+        self.assertEqual(self.server.stats()["by_verb_resource"]
+                         .get("discovery /apis/apps/v1"), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,69 @@
+import copy
+import unittest
+from kubernetes import config
+from primazactl.utils import settings
+from primazactl.kubectl.apply import apply_manifest
+from primazactl.kubectl.constants import APPLIED_HASH_ANNOTATION
+from primazabench.fakeapiserver import FakeApiServer
+
+CONFIG_MAP: {} = {
+    "apiVersion": "v1",
+    "kind": "ConfigMap",
+    "metadata": {"name": "incremental", "namespace": "default"},
+    "data": {"key": "first"},
+}
+
+
+class IncrementalTest(unittest.TestCase):
+
+    server: FakeApiServer = None
+    api_client = None
+
+    def setUp(self):
+        self.server = FakeApiServer().start()
+        self.api_client = config.new_client_from_config_dict(
+            self.server.kubeconfig())
+        settings.incremental = True
+        self.addCleanup(setattr, settings, "incremental", False)
+        self.addCleanup(self.server.stop)
+
+    def apply(self, resource) -> {}:
+        self.server.reset_stats()
+        errors = apply_manifest([copy.deepcopy(resource)], self.api_client)
+        self.assertEqual(errors, [])
+        return self.server.stats()["by_verb_resource"]
+
+    def get_stored(self) -> {}:
+        return self.server.objects[("", "configmaps", "default",
+                                    "incremental")]
+
+    def test_unchanged_object_is_skipped(self):
+        self.assertEqual(self.apply(CONFIG_MAP).get("create configmaps"), 1)
+
+        requests = self.apply(CONFIG_MAP)
+        self.assertNotIn("create configmaps", requests)
+        self.assertNotIn("patch configmaps", requests)
+
+    def test_changed_object_is_updated(self):
+        self.apply(CONFIG_MAP)
+        first_hash = self.get_stored()["metadata"]["annotations"][
+            APPLIED_HASH_ANNOTATION]
+
+        changed = copy.deepcopy(CONFIG_MAP)
+        changed["data"]["key"] = "second"
+        requests = self.apply(changed)
+        self.assertNotIn("create configmaps", requests)
+        self.assertEqual(requests.get("patch configmaps"), 1)
+        stored = self.get_stored()
+        self.assertEqual(stored["data"]["key"], "second")
+        self.assertNotEqual(stored["metadata"]["annotations"][
+            APPLIED_HASH_ANNOTATION], first_hash)
+
+        # the refreshed annotation makes the next run skip it
+        requests = self.apply(changed)
+        self.assertNotIn("create configmaps", requests)
+        self.assertNotIn("patch configmaps", requests)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,47 @@
+import argparse
+import os
+import tempfile
+import unittest
+from primazactl.utils import yamlio
+from primazactl.cmd.apply.options import Options
+
+OPTIONS: {} = {
+    "apiVersion": "primaza.io/v1alpha1",
+    "kind": "Tenant",
+    "controlPlane": {"context": "shared"},
+    "tenants": [{"name": "primaza-alice"},
+                {"name": "primaza-bob",
+                 "controlPlane": {"context": "bob"}}],
+}
+
+
+class OptionsTest(unittest.TestCase):
+
+    def get_options(self, content) -> Options:
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        path = os.path.join(directory.name, "options.yaml")
+        with open(path, "w") as options_file:
+            yamlio.dump(content, options_file)
+        return Options(argparse.Namespace(options_file=path))
+
+    def test_tenant_is_selected_by_name(self):
+        tenant = self.get_options(OPTIONS).get_tenant("primaza-bob")
+        self.assertEqual(tenant.tenant, "primaza-bob")
+        self.assertEqual(tenant.options["controlPlane"]["context"], "bob")
+
+    def test_unknown_tenant_is_an_error(self):
+        options = self.get_options(OPTIONS)
+        for name in ["primaza-carol", None]:
+            with self.assertRaises(RuntimeError):
+                options.get_tenant(name)
+
+    def test_single_tenant_needs_no_name(self):
+        content = {**OPTIONS, "tenants": OPTIONS["tenants"][:1]}
+        tenant = self.get_options(content).get_tenant()
+        self.assertEqual(tenant.tenant, "primaza-alice")
+        self.assertEqual(tenant.options["controlPlane"]["context"], "shared")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,62 @@
+import copy
+import unittest
+from primazactl.kubectl.rewrite import clone
+
+MANIFEST: [] = [
+    {"apiVersion": "v1", "kind": "Namespace",
+     "metadata": {"name": "primaza-system"}},
+    {"apiVersion": "apps/v1", "kind": "Deployment",
+     "metadata": {"name": "controller", "namespace": "primaza-system"},
+     "spec": {"template": {"spec": {"containers": [
+         {"name": "manager", "image": "primaza:latest"}]}}}},
+    {"apiVersion": "cert-manager.io/v1", "kind": "Certificate",
+     "metadata": {"name": "serving-cert", "namespace": "primaza-system"},
+     "spec": {"dnsNames": ["webhook.primaza-system.svc",
+                           "webhook.primaza-system.svc.cluster.local"],
+              "issuerRef": {"name": "issuer"}}},
+    {"apiVersion": "admissionregistration.k8s.io/v1",
+     "kind": "ValidatingWebhookConfiguration",
+     "metadata": {"name": "validating",
+                  "annotations": {"cert-manager.io/inject-ca-from":
+                                  "primaza-system/serving-cert"}},
+     "webhooks": [{"name": "webhook.primaza.io",
+                   "clientConfig": {"service": {
+                       "name": "webhook", "namespace": "primaza-system",
+                       "path": "/validate"}}}]},
+]
+
+
+class RewriteTest(unittest.TestCase):
+
+    def test_clone_moves_resources_to_namespace(self):
+        original = copy.deepcopy(MANIFEST)
+        clones = clone(("test", "rewrite"), MANIFEST, "tenant")
+
+        self.assertEqual(MANIFEST, original)
+        namespace, deployment, certificate, webhook = clones
+        self.assertEqual(namespace["metadata"]["name"], "tenant")
+        self.assertEqual(deployment["metadata"]["namespace"], "tenant")
+        self.assertEqual(certificate["metadata"]["namespace"], "tenant")
+        self.assertEqual(certificate["spec"]["dnsNames"],
+                         ["webhook.tenant.svc",
+                          "webhook.tenant.svc.cluster.local"])
+        self.assertEqual(webhook["metadata"]["annotations"],
+                         {"cert-manager.io/inject-ca-from":
+                          "tenant/serving-cert"})
+        self.assertEqual(webhook["webhooks"][0]["clientConfig"]["service"],
+                         {"name": "webhook", "namespace": "tenant",
+                          "path": "/validate"})
+        # content the namespace does not change is shared
+        self.assertIs(deployment["spec"], MANIFEST[1]["spec"])
+        self.assertIs(certificate["spec"]["issuerRef"],
+                      MANIFEST[2]["spec"]["issuerRef"])
+
+    def test_clone_for_each_namespace(self):
+        first = clone(("test", "namespaces"), MANIFEST, "first")
+        second = clone(("test", "namespaces"), MANIFEST, "second")
+        self.assertEqual(first[1]["metadata"]["namespace"], "first")
+        self.assertEqual(second[1]["metadata"]["namespace"], "second")
+
+
+if __name__ == "__main__":
+    unittest.main()
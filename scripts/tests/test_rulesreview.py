@@ -0,0 +1,44 @@
+import unittest
+from kubernetes import client
+from primazactl.kube.access.rulesreview import RulesReview
+
+NAMESPACE: str = "primaza-system"
+
+
+class RulesReviewTest(unittest.TestCase):
+
+    def get_review(self, *rules) -> RulesReview:
+        review = RulesReview(client.ApiClient())
+        # rules of a complete review, answered without a request
+        review.reviews[NAMESPACE] = (list(rules), False)
+        return review
+
+    def test_rule_grants_verb(self):
+        review = self.get_review(client.V1ResourceRule(
+            verbs=["create", "get"], api_groups=[""],
+            resources=["secrets"]))
+        self.assertTrue(review.is_allowed(NAMESPACE, "create", "",
+                                          "secrets", "kubeconfig"))
+        self.assertFalse(review.is_allowed(NAMESPACE, "delete", "",
+                                           "secrets", "kubeconfig"))
+
+    def test_resource_names_restrict_names(self):
+        review = self.get_review(client.V1ResourceRule(
+            verbs=["get", "patch"], api_groups=[""], resources=["secrets"],
+            resource_names=["kubeconfig"]))
+        self.assertTrue(review.is_allowed(NAMESPACE, "patch", "",
+                                          "secrets", "kubeconfig"))
+        self.assertFalse(review.is_allowed(NAMESPACE, "patch", "",
+                                           "secrets", "other"))
+        self.assertFalse(review.is_allowed(NAMESPACE, "get", "", "secrets"))
+
+    def test_resource_names_do_not_grant_create(self):
+        review = self.get_review(client.V1ResourceRule(
+            verbs=["*"], api_groups=[""], resources=["secrets"],
+            resource_names=["kubeconfig"]))
+        self.assertFalse(review.is_allowed(NAMESPACE, "create", "",
+                                           "secrets", "kubeconfig"))
+
+
+if __name__ == "__main__":
+    unittest.main()
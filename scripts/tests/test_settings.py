@@ -0,0 +1,46 @@
+import argparse
+import contextlib
+import io
+import unittest
+from primazactl.utils import logger
+from primazactl.utils import settings
+from primazactl.utils import yamlio
+
+CONFIG_MAP: {} = {
+    "apiVersion": "v1",
+    "kind": "ConfigMap",
+    "metadata": {"name": "output", "namespace": "default"},
+}
+
+
+class OutputTest(unittest.TestCase):
+
+    def setUp(self):
+        for name in ["dry_run", "output_type", "output_list",
+                     "resources_written"]:
+            self.addCleanup(setattr, settings, name, getattr(settings, name))
+        self.addCleanup(logger.set_dry_run, logger.dry_run)
+        self.addCleanup(logger.set_log_file, logger.log_file)
+
+    def test_logs_are_not_written_to_the_output(self):
+        stdout = io.StringIO()
+        stderr = io.StringIO()
+        with contextlib.redirect_stdout(stdout), \
+                contextlib.redirect_stderr(stderr):
+            settings.set(argparse.Namespace(
+                output_type=settings.OUTPUT_YAML, output_list=False,
+                dry_run=settings.DRY_RUN_SERVER, server_side=False,
+                incremental=False))
+            for _ in range(2):
+                settings.add_resource(CONFIG_MAP)
+                logger.log_info("SUCCESS: create of ConfigMap output",
+                                always=True)
+            settings.output()
+
+        self.assertEqual(list(yamlio.safe_load_all(stdout.getvalue())),
+                         [CONFIG_MAP, CONFIG_MAP])
+        self.assertIn("[INFO] (dry run) SUCCESS", stderr.getvalue())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,28 @@
+import unittest
+from kubernetes import config
+from primazactl.kube import snapshot
+from primazabench.fakeapiserver import FakeApiServer
+
+
+class SnapshotTest(unittest.TestCase):
+
+    server: FakeApiServer = None
+    api_client = None
+
+    def setUp(self):
+        self.server = FakeApiServer().start()
+        self.addCleanup(self.server.stop)
+        self.api_client = config.new_client_from_config_dict(
+            self.server.kubeconfig())
+        snapshot.snapshots.clear()
+
+    def test_object_of_kind_not_served_does_not_exist(self):
+        # e.g. a cluster environment whose CRD was only dry run created
+        self.assertFalse(snapshot.exists(self.api_client,
+                                         "primaza.io/v1alpha1",
+                                         "ClusterEnvironment",
+                                         "primaza-system", "worker"))
+
+
+if __name__ == '__main__':
+    unittest.main()